@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Profil filtreleme benchmark'ı: eski (her profilde fields.json üzerinde doğrusal
+arama) ve yeni (önceden derlenmiş küme araması) yöntemlerinin karşılaştırması
+
+Kullanım:
+    python benchmarks/bench_filter.py [--profiles 100000] [--field-id 8] [--specialty-ids 1,5,9]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.helpers import get_field_name_by_id, get_specialty_name_by_id, load_fields
+from src.utils.taxonomy import get_taxonomy
+
+
+def legacy_filter(fields_data, profile, field_id, specialty_ids) -> bool:
+    """Eski StreamingAcademicScraper._filter_profile gövdesi"""
+    if not field_id and not specialty_ids:
+        return True
+    if field_id:
+        field_name = get_field_name_by_id(fields_data, field_id)
+        if field_name and profile.get('green_label') != field_name:
+            return False
+    if specialty_ids and field_id:
+        profile_specialty = profile.get('blue_label', '')
+        for specialty_id in specialty_ids:
+            specialty_name = get_specialty_name_by_id(fields_data, field_id, specialty_id)
+            if specialty_name and profile_specialty == specialty_name:
+                return True
+        return False
+    return True
+
+
+def sample_profiles(fields_data, n: int, seed: int = 42):
+    """Gerçek alan/uzmanlık adlarından rastgele profil etiketleri"""
+    rng = random.Random(seed)
+    pairs = [(f['name'], s['name']) for f in fields_data for s in f['specialties']]
+    return [{"green_label": g, "blue_label": b} for g, b in (rng.choice(pairs) for _ in range(n))]
+
+
+def time_it(fn, profiles) -> dict:
+    start = time.perf_counter()
+    matched = sum(1 for profile in profiles if fn(profile))
+    elapsed = time.perf_counter() - start
+    return {"seconds": round(elapsed, 4), "ns_per_profile": round(elapsed / len(profiles) * 1e9, 1),
+            "matched": matched}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=100_000)
+    parser.add_argument("--field-id", type=int, default=8)
+    parser.add_argument("--specialty-ids", type=str, default="1,5,9")
+    args = parser.parse_args()
+
+    specialty_ids = [int(s) for s in args.specialty_ids.split(",") if s.strip()] or None
+
+    load_start = time.perf_counter()
+    fields_data = load_fields()
+    load_seconds = time.perf_counter() - load_start
+    profiles = sample_profiles(fields_data, args.profiles)
+    taxonomy = get_taxonomy()
+
+    legacy = time_it(lambda p: legacy_filter(fields_data, p, args.field_id, specialty_ids), profiles)
+    profile_filter = taxonomy.compile_filter(args.field_id, specialty_ids)
+    indexed = time_it(profile_filter.matches, profiles)
+    assert legacy["matched"] == indexed["matched"], (legacy, indexed)
+
+    print(json.dumps({
+        "profiles": args.profiles,
+        "field_id": args.field_id,
+        "specialty_ids": specialty_ids,
+        "load_fields_seconds_per_scraper": round(load_seconds, 5),
+        "legacy_linear_scan": legacy,
+        "taxonomy_index": indexed,
+        "speedup": round(legacy["seconds"] / indexed["seconds"], 1) if indexed["seconds"] else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
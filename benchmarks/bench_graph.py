@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Grafik indeksi benchmark'ı: sentetik işbirliği grafiğinde CSR kurulumu ve
+sorgu gecikmeleri (en kısa yol, ortak komşular, k-adım komşuluk, derece sıralaması)
+
+Kullanım:
+    python benchmarks/bench_graph.py [--nodes 100000] [--degree 6] [--queries 1000]
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper.graph_index import CollaborationGraph
+
+
+def synthetic_edges(n: int, degree: int, seed: int = 42):
+    """Tercihli bağlanma benzeri grafik: birkaç yüksek dereceli düğüm, çoğunluk düşük"""
+    rng = random.Random(seed)
+    edges = set()
+    endpoints = [0]
+    for u in range(1, n):
+        for _ in range(max(1, degree // 2)):
+            v = rng.choice(endpoints) if rng.random() < 0.5 else rng.randrange(u)
+            if v != u:
+                edges.add((v, u) if v < u else (u, v))
+                endpoints.append(v)
+        endpoints.append(u)
+    return edges
+
+
+def bfs_distance(graph: CollaborationGraph, source: int, target: int, max_depth: int):
+    """Doğrulama için tek yönlü BFS"""
+    seen = {source: 0}
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        if seen[u] >= max_depth:
+            continue
+        for v in graph.neighbors(u):
+            if v not in seen:
+                seen[v] = seen[u] + 1
+                if v == target:
+                    return seen[v]
+                queue.append(v)
+    return None if source != target else 0
+
+
+def time_queries(fn, args) -> dict:
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(*arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--degree", type=int, default=6)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    edges = synthetic_edges(args.nodes, args.degree)
+    ids = [f"A{i:08X}" for i in range(args.nodes)]
+
+    start = time.perf_counter()
+    graph = CollaborationGraph(ids, [""] * args.nodes, edges)
+    build_seconds = time.perf_counter() - start
+
+    rng = random.Random(7)
+    pairs = [(rng.randrange(args.nodes), rng.randrange(args.nodes)) for _ in range(args.queries)]
+    nodes = [(rng.randrange(args.nodes),) for _ in range(args.queries)]
+
+    # Bidirectional BFS uzunlukları tek yönlü BFS ile karşılaştırılır
+    for a, b in pairs[:50]:
+        path = graph.shortest_path(a, b, max_depth=6)
+        expected = bfs_distance(graph, a, b, 6)
+        assert (len(path) - 1 if path else None) == expected, (a, b, path, expected)
+
+    print(json.dumps({
+        "nodes": graph.node_count,
+        "edges": graph.edge_count,
+        "build_seconds": round(build_seconds, 3),
+        "csr_bytes": graph.offsets.itemsize * len(graph.offsets) + graph.targets.itemsize * len(graph.targets),
+        "shortest_path": time_queries(lambda a, b: graph.shortest_path(a, b, 6), pairs),
+        "common_neighbors": time_queries(graph.common_neighbors, pairs),
+        "neighborhood_2_hops_limit_100": time_queries(lambda a: graph.neighborhood(a, 2, 100), nodes),
+        "degree_top_20": time_queries(lambda: graph.top_degree(20), [()] * args.queries),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
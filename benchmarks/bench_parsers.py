@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Sayfa görüntüsü ayrıştırma benchmark'ı: stand-in sitesinin sonuç ve profil
+sayfalarını fixture olarak kullanıp parsers.py fonksiyonlarının sıralı,
+thread havuzunda ve process havuzunda hızını ölçer; gezinme süresi
+(--nav-ms) verilerek ayrıştırmanın gezinmeyle örtüşmesi simüle edilir
+
+Kullanım:
+    python benchmarks/bench_parsers.py [--pages 200] [--workers 2] [--nav-ms 50]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.yok_standin import StandinSite
+from src.scraper.parser_pool import create_parser_pool
+from src.scraper.parsers import parse_collaborator_page, parse_result_rows
+
+QUERY = "AHMET YILMAZ"
+BASE_URL = "https://akademik.yok.gov.tr/AkademikArama/"
+
+
+def fixtures(site: StandinSite, pages: int):
+    """(ayrıştırıcı, argümanlar) listesi: sonuç sayfaları ve işbirlikçi profil sayfaları"""
+    result_pages = -(-site.results // site.page_size)
+    jobs = []
+    for i in range(pages):
+        if i % 2 == 0:
+            page_html = site.results_page(QUERY, i // 2 % result_pages + 1)
+            jobs.append((parse_result_rows, (page_html, BASE_URL, 1)))
+        else:
+            author = site.search_result(QUERY, i % site.results)
+            collab = {"name": author["name"], "href": BASE_URL + site.profile_url(author["author_id"])}
+            jobs.append((parse_collaborator_page, (site.profile_page(author["author_id"]), collab, i, BASE_URL)))
+    return jobs
+
+
+def run_pool(kind: str, workers: int, jobs) -> float:
+    pool = create_parser_pool(kind, workers)
+    try:
+        # Process başlatma ölçüme katılmasın
+        pool.submit(parse_result_rows, "<html></html>", BASE_URL).result()
+        start = time.perf_counter()
+        futures = [pool.submit(parser, *args) for parser, args in jobs]
+        for future in futures:
+            future.result()
+        return time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+
+def run_pipeline(kind: str, workers: int, jobs, nav_seconds: float) -> float:
+    """Snapshot modu: sayfa n ayrıştırılırken tarayıcı n+1'e gidiyor"""
+    pool = create_parser_pool(kind, workers)
+    try:
+        pool.submit(parse_result_rows, "<html></html>", BASE_URL).result()
+        start = time.perf_counter()
+        parsing = None
+        for parser, args in jobs:
+            time.sleep(nav_seconds)
+            if parsing is not None:
+                parsing.result()
+            parsing = pool.submit(parser, *args)
+        parsing.result()
+        return time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--nav-ms", type=float, default=50.0, help="Simüle edilen sayfa geçiş süresi")
+    args = parser.parse_args()
+
+    site = StandinSite(results=200, page_size=20, collaborators=30)
+    jobs = fixtures(site, args.pages)
+
+    # Ayrıştırıcılar saf: aynı HTML her zaman aynı sözlükleri üretir
+    parsed = [parser(*job_args) for parser, job_args in jobs]
+    assert parsed == [parser(*job_args) for parser, job_args in jobs]
+
+    start = time.perf_counter()
+    for parser, job_args in jobs:
+        parser(*job_args)
+    sequential = time.perf_counter() - start
+
+    nav_seconds = args.nav_ms / 1000
+    report = {
+        "pages": args.pages,
+        "workers": args.workers,
+        "sequential_pages_per_sec": round(args.pages / sequential, 1),
+        "mean_parse_ms": round(sequential / args.pages * 1000, 3),
+        "thread_pool_pages_per_sec": round(args.pages / run_pool("thread", args.workers, jobs), 1),
+        "process_pool_pages_per_sec": round(args.pages / run_pool("process", args.workers, jobs), 1),
+        "navigation_ms": args.nav_ms,
+        # Canlı sorgu gibi sıralı: gezinme + ayrıştırma
+        "serial_crawl_seconds": round(args.pages * nav_seconds + sequential, 3),
+        "overlapped_crawl_seconds": {
+            kind: round(run_pipeline(kind, args.workers, jobs, nav_seconds), 3) for kind in ("thread", "process")
+        },
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
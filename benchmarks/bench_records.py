@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Kayıt gösterimi bellek benchmark'ı: aynı profil/işbirlikçi kayıtlarının
+sözlük olarak ve records.py'deki kompakt kayıtlar olarak bellekte tuttuğu yer
+
+Kayıtlar parser çıktısı gibi her biri kendi metinleriyle (JSON satırından)
+oluşturulur; ölçüm tracemalloc ile yapılır.
+
+Kullanım:
+    python benchmarks/bench_records.py [--records 100000]
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper.records import make_record
+from src.utils.helpers import load_fields
+
+FIRST_NAMES = ["AHMET", "MEHMET", "AYŞE", "FATMA", "İSMAİL", "IŞIL", "ŞULE", "ÇAĞRI", "GÜLŞEN", "ÖMER"]
+LAST_NAMES = ["YILMAZ", "KAYA", "DEMİR", "ŞAHİN", "ÇELİK", "ÖZTÜRK", "AYDIN", "IŞIK", "KILIÇ", "GÜNEŞ"]
+CITIES = ["ANKARA", "İSTANBUL", "İZMİR", "ISPARTA", "ZONGULDAK", "ERZURUM", "KONYA", "SAMSUN"]
+TITLES = ["PROFESÖR", "DOÇENT", "DOKTOR ÖĞRETİM ÜYESİ", "ARAŞTIRMA GÖREVLİSİ"]
+
+
+def synthetic_lines(fields_data, n: int, seed: int = 42):
+    """(tür, JSON satırı) çiftleri: yarısı profil, yarısı işbirlikçi"""
+    rng = random.Random(seed)
+    pairs = [(f['name'], s['name']) for f in fields_data for s in f['specialties']]
+    for i in range(n):
+        green, blue = rng.choice(pairs)
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        title = rng.choice(TITLES)
+        header = f"{rng.choice(CITIES)} ÜNİVERSİTESİ/FAKÜLTE/{blue.upper()} BÖLÜMÜ/"
+        url = f"https://akademik.yok.gov.tr/AkademikArama/view?authorId=S{i:08X}"
+        email = f"user{i}@uni{i % 200}.edu.tr"
+        photo = "https://akademik.yok.gov.tr/AkademikArama/authorimages/photo_m.jpg"
+        if i % 2 == 0:
+            record = {
+                "id": i % 50 + 1, "name": name, "title": title, "url": url,
+                "info": f"{title}\n{name}\n{header}\n{green}   {blue}",
+                "header": header, "green_label": green, "blue_label": blue,
+                "email": email, "photoUrl": photo,
+            }
+            yield "profiles", json.dumps(record, ensure_ascii=False)
+        else:
+            record = {
+                "id": i % 50 + 1, "name": name, "url": url, "status": "completed", "deleted": False,
+                "title": title, "info": header, "green_label": green, "blue_label": blue,
+                "keywords": "", "email": email, "photoUrl": photo,
+                "source_author_id": f"S{i // 50:08X}",
+            }
+            yield "collaborators", json.dumps(record, ensure_ascii=False)
+
+
+def measure(lines, build) -> dict:
+    """Kayıtları kur, tuttukları belleği ölç"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = [build(kind, json.loads(line)) for kind, line in lines]
+    build_seconds = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "records": records,
+        "build_seconds": round(build_seconds, 3),
+        "bytes": current,
+        "bytes_per_record": round(current / len(records), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    lines = list(synthetic_lines(load_fields(), args.records))
+
+    plain = measure(lines, lambda kind, data: data)
+    plain_records = plain.pop("records")
+    compact = measure(lines, make_record)
+    compact_records = compact.pop("records")
+
+    # Sınırda JSON şekline dönüş maliyeti ve doğruluğu
+    start = time.perf_counter()
+    converted = [record.to_dict() for record in compact_records]
+    to_dict_seconds = time.perf_counter() - start
+    assert converted == plain_records
+
+    start = time.perf_counter()
+    for record in compact_records:
+        record.get("title"), record.get("green_label"), record.get("email")
+    get_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "records": args.records,
+        "dict": plain,
+        "compact": compact,
+        "saved_percent": round((1 - compact["bytes"] / plain["bytes"]) * 100, 1),
+        "to_dict_us_per_record": round(to_dict_seconds / args.records * 1e6, 3),
+        "three_gets_us_per_record": round(get_seconds / args.records * 1e6, 3),
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Çözümleme indeksi benchmark'ı: sentetik kişilerle indeks kurulumu, email
+araması ve hatalı yazılmış isimlerle trigram araması gecikmeleri
+
+Kullanım:
+    python benchmarks/bench_resolve.py [--people 100000] [--repeat 200]
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper.resolution_index import ResolutionIndex
+
+FIRST_NAMES = ["AHMET", "MEHMET", "AYŞE", "FATMA", "İSMAİL", "IŞIL", "ŞULE", "ÇAĞRI", "GÜLŞEN", "ÖMER",
+               "EMRE", "ZEYNEP", "BURAK", "ELİF", "HÜLYA", "OĞUZ", "SEDA", "TUNCAY", "YASEMİN", "KEREM"]
+LAST_NAMES = ["YILMAZ", "KAYA", "DEMİR", "ŞAHİN", "ÇELİK", "ÖZTÜRK", "AYDIN", "IŞIK", "KILIÇ", "GÜNEŞ",
+              "ARSLAN", "DOĞAN", "KOÇ", "KURT", "ÖZDEMİR", "POLAT", "ERDOĞAN", "YAVUZ", "AKSOY", "TAŞ"]
+
+
+def synthetic_people(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    for i in range(n):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        # Aynı isimli binlerce kişi olmasın diye ikinci ad / soyad eklenir
+        middle = rng.choice(FIRST_NAMES) if rng.random() < 0.5 else ""
+        suffix = f"{rng.choice(LAST_NAMES)}{i % 97}" if rng.random() < 0.5 else f"{last}{i % 89}"
+        yield {
+            "name": " ".join(part for part in (first, middle, suffix) if part),
+            "url": f"https://akademik.yok.gov.tr/AkademikArama/view?authorId=S{i:08X}",
+            "email": f"user{i}[at]uni{i % 200}.edu.tr",
+        }
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Küçük harf, Türkçe karakter kaybı ve bir harf hatası"""
+    text = name.lower().translate(str.maketrans("çğışöü", "cgisou", "\u0307"))
+    i = rng.randrange(len(text))
+    return text[:i] + text[i + 1:]
+
+
+def timed(fn, args) -> dict:
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--people", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    people = list(synthetic_people(args.people))
+    # Boş dizin: yalnızca sentetik kayıtlar indekslenir
+    index = ResolutionIndex(Path(tempfile.mkdtemp()))
+    index.stats()
+
+    start = time.perf_counter()
+    for person in people:
+        index._pending.append(("bench", "profiles", person))
+    stats = index.stats()
+    build_seconds = time.perf_counter() - start
+
+    rng = random.Random(7)
+    sample = [rng.choice(people) for _ in range(args.repeat)]
+    misspelled = [(misspell(person["name"], rng), person) for person in sample]
+
+    # Hatalı yazılmış isimde doğru kişi ilk 10 aday içinde mi
+    found = 0
+    for query, person in misspelled:
+        author_ids = [result["url"] for result in index.fuzzy_names(query, limit=10)["results"]]
+        found += person["url"] in author_ids
+
+    print(json.dumps({
+        "build_seconds": round(build_seconds, 2),
+        **stats,
+        "email_lookup": timed(index.lookup_email, [person["email"].upper() for person in sample]),
+        "fuzzy_exact_name": timed(index.fuzzy_names, [person["name"] for person in sample]),
+        "fuzzy_misspelled_name": timed(index.fuzzy_names, [query for query, _ in misspelled]),
+        "misspelled_recall_at_10": round(found / len(misspelled), 3),
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Uçtan uca scraper benchmark'ı: yerel YÖK stand-in sunucusuna karşı
+scrape_profiles_streaming (selenium / http motorları) ve main_codes/scripts
+akışları çalıştırılır; ilk profile kadar geçen süre, profil/sn, aşama
+süreleri, Python ve Chrome tepe RSS'i ve session dizinine yazılan byte
+ölçülür. Sonuçlar JSON olarak saklanıp önceki bir çalıştırmayla karşılaştırılabilir.
+
+Kullanım:
+    python benchmarks/bench_scraper.py [--engines http,selenium] [--scenarios search,email]
+                                       [--scripts] [--latency-ms 20] [--results 120]
+                                       [--output benchmarks/results/run.json]
+                                       [--baseline benchmarks/results/base.json] [--fail-on-regression]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.yok_standin import add_site_arguments, site_from_args
+from src.utils.helpers import process_tree_rss_mb
+
+SCRIPTS_DIR = ROOT / "main_codes" / "scripts"
+SCRIPT_SESSIONS_DIR = ROOT / "main_codes" / "public" / "collaborator-sessions"
+QUERY = "Ahmet Yılmaz"
+# Sonuç karşılaştırmasında kullanılan metrikler: (yol, büyük değer daha iyi mi)
+COMPARED_METRICS = [
+    ("total_seconds", False),
+    ("time_to_first_profile_seconds", False),
+    ("profiles_per_sec", True),
+    ("collaborators_per_sec", True),
+    ("peak_rss_mb.python", False),
+    ("peak_rss_mb.chrome", False),
+    ("session_bytes", False),
+]
+
+
+def process_rss_mb(pid: int) -> Optional[float]:
+    """Tek process'in RSS değeri (MB), alt process'ler hariç"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def written_bytes() -> int:
+    """Process'in write() ile yazdığı toplam byte (Linux /proc/self/io)"""
+    try:
+        for line in Path("/proc/self/io").read_text().splitlines():
+            if line.startswith("wchar:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def dir_bytes(path: Path) -> int:
+    if not path.exists():
+        return 0
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+class RssSampler:
+    """Arka planda process'in ve alt process'lerinin (Chrome) tepe RSS'ini örnekler"""
+
+    def __init__(self, pid: int, exclude_pids: List[int] = (), interval: float = 0.05):
+        self.pid = pid
+        self.exclude_pids = list(exclude_pids)
+        self.interval = interval
+        self.python_peak = 0.0
+        self.chrome_peak = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _sample(self):
+        own = process_rss_mb(self.pid)
+        if own is None:
+            return
+        tree = process_tree_rss_mb(self.pid) or own
+        for pid in self.exclude_pids:
+            tree -= process_tree_rss_mb(pid) or 0.0
+        self.python_peak = max(self.python_peak, own)
+        self.chrome_peak = max(self.chrome_peak, tree - own)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "RssSampler":
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def result(self) -> Dict:
+        return {"python": round(self.python_peak, 1), "chrome": round(self.chrome_peak, 1)}
+
+
+class StandinProcess:
+    """Stand-in sunucusunu ayrı process'te çalıştırır (GIL ve RSS ölçümüne karışmasın)"""
+
+    def __init__(self, args):
+        command = [sys.executable, str(Path(__file__).parent / "yok_standin.py"), "--port", "0",
+                   "--results", str(args.results), "--page-size", str(args.page_size),
+                   "--collaborators", str(args.collaborators), "--deleted-ratio", str(args.deleted_ratio),
+                   "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+                   "--seed", str(args.seed)]
+        self.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        self.base_url = self.process.stdout.readline().strip()
+        if not self.base_url:
+            raise RuntimeError("Stand-in sunucusu başlatılamadı")
+
+    def stats(self) -> Dict:
+        with urllib.request.urlopen(self.base_url + "__stats", timeout=5) as response:
+            return json.loads(response.read())
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait(timeout=10)
+
+
+def stage_durations(events: List[tuple], end: float) -> List[Dict]:
+    """progress adımlarından aşama süreleri: her adım bir sonrakine kadar sürer"""
+    steps = [(t, step) for t, kind, step in events if kind == "progress"]
+    stages = []
+    for i, (t, step) in enumerate(steps):
+        next_t = steps[i + 1][0] if i + 1 < len(steps) else end
+        stages.append({"step": step, "start": round(t, 4), "seconds": round(next_t - t, 4)})
+    return stages
+
+
+def rate(count: int, start: Optional[float], end: Optional[float]) -> Optional[float]:
+    if not count or start is None or end is None or end <= start:
+        return None
+    return round(count / (end - start), 2)
+
+
+async def drive_scraper(scraper, session, email: Optional[str]) -> Dict:
+    """scrape_profiles_streaming akışını tüket, olayları zaman damgasıyla topla"""
+    events = []
+    errors = []
+    started = time.perf_counter()
+    async for update in scraper.scrape_profiles_streaming(QUERY, session.session_id, email=email,
+                                                          cache_max_age=0, session=session):
+        elapsed = time.perf_counter() - started
+        data = update.get("data") or {}
+        events.append((elapsed, update["type"], data.get("step")))
+        if update["type"] == "error":
+            errors.append(data.get("message"))
+    total = time.perf_counter() - started
+
+    profile_times = [t for t, kind, _ in events if kind in ("profile_added", "email_match")]
+    collaborator_times = [t for t, kind, _ in events if kind == "collaborator_added"]
+    return {
+        "ok": not errors,
+        "errors": errors,
+        "total_seconds": round(total, 4),
+        "time_to_first_profile_seconds": round(profile_times[0], 4) if profile_times else None,
+        "profiles": len(profile_times),
+        "profiles_per_sec": rate(len(profile_times), 0.0, profile_times[-1] if profile_times else None),
+        "collaborators": len(collaborator_times),
+        "collaborators_per_sec": rate(len(collaborator_times), profile_times[-1] if profile_times else None,
+                                      collaborator_times[-1] if collaborator_times else None),
+        "stages": stage_durations(events, total),
+    }
+
+
+def run_engine(engine: str, scenario: str, email: Optional[str], server: StandinProcess,
+               sessions_dir: Path, cache_dir: Path) -> Dict:
+    """Bir motor + senaryo çalıştırması (src modülleri YOK_BASE_URL ayarlandıktan sonra yüklenir)"""
+    from src.scraper.academic_scraper import StreamingAcademicScraper
+    from src.scraper.http_scraper import HttpAcademicScraper
+    from src.scraper.profile_cache import ProfileCache
+    from src.scraper.session_manager import AcademicScrapingSession, get_state_writer
+    from src.utils.http_client import KeepAliveHttpClient
+    from src.utils.metrics import get_metrics
+
+    # Gerçek profil cache'i sentetik kayıtlarla kirlenmesin
+    cache = ProfileCache(cache_dir / f"{engine}_{scenario}.sqlite3")
+    if engine == "http":
+        scraper = HttpAcademicScraper(http_client=KeepAliveHttpClient(), profile_cache=cache)
+    else:
+        scraper = StreamingAcademicScraper(profile_cache=cache)
+    session = AcademicScrapingSession(f"bench_{engine}_{scenario}_{int(time.time())}", sessions_dir)
+
+    before_server = server.stats()
+    before_io = written_bytes()
+    with RssSampler(os.getpid(), exclude_pids=[server.process.pid]) as sampler:
+        result = asyncio.run(drive_scraper(scraper, session, email))
+        get_state_writer().flush(timeout=30)
+    after_server = server.stats()
+    cache.close()
+
+    result["peak_rss_mb"] = sampler.result()
+    result["session_bytes"] = dir_bytes(session.base_dir)
+    result["process_write_bytes"] = written_bytes() - before_io if before_io >= 0 else None
+    result["server"] = {key: after_server[key] - before_server[key] for key in after_server}
+    # Scraper içindeki span ölçümleri (aşama başına süre)
+    result["spans"] = get_metrics().session_spans(session)
+    return result
+
+
+def run_script(command: List[str], env: Dict[str, str]) -> Dict:
+    """Script'i çalıştır, stdout satırlarını zaman damgasıyla topla"""
+    started = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                               env=env, cwd=str(SCRIPTS_DIR))
+    lines = []
+    with RssSampler(process.pid) as sampler:
+        for line in process.stdout:
+            lines.append((time.perf_counter() - started, line.rstrip()))
+        process.wait()
+    return {
+        "returncode": process.returncode,
+        "lines": lines,
+        "total_seconds": round(time.perf_counter() - started, 4),
+        "peak_rss_mb": sampler.result(),
+    }
+
+
+def run_script_flows(server: StandinProcess, site, keep: bool) -> Dict:
+    """main_codes/scripts akışları: ana profil araması, ardından işbirlikçiler"""
+    env = dict(os.environ, YOK_BASE_URL=server.base_url, PYTHONUNBUFFERED="1")
+    session_id = f"bench_scripts_{int(time.time())}"
+    session_dir = SCRIPT_SESSIONS_DIR / session_id
+    results = {}
+    try:
+        before_server = server.stats()
+        main = run_script([sys.executable, "scrape_main_profile.py", QUERY, session_id], env)
+        add_times = [t for t, line in main["lines"] if line.startswith("[ADD]")]
+        results["scripts/main_profile"] = {
+            "ok": main["returncode"] == 0,
+            "errors": [] if main["returncode"] == 0 else [line for _, line in main["lines"][-5:]],
+            "total_seconds": main["total_seconds"],
+            "time_to_first_profile_seconds": round(add_times[0], 4) if add_times else None,
+            "profiles": len(add_times),
+            "profiles_per_sec": rate(len(add_times), 0.0, add_times[-1] if add_times else None),
+            "peak_rss_mb": main["peak_rss_mb"],
+            "session_bytes": dir_bytes(session_dir),
+            "server": {key: value - before_server[key] for key, value in server.stats().items()},
+        }
+
+        before_bytes = dir_bytes(session_dir)
+        before_server = server.stats()
+        profile_url = server.base_url.rstrip("/") + site.profile_url(site.search_result(QUERY, 0)["author_id"])
+        collaborators = run_script([sys.executable, "scrape_collaborators.py", QUERY, session_id,
+                                    "--profile-url", profile_url], env)
+        collaborators_file = session_dir / "collaborators.json"
+        count = len(json.loads(collaborators_file.read_text(encoding="utf-8"))) if collaborators_file.exists() else 0
+        results["scripts/collaborators"] = {
+            "ok": collaborators["returncode"] == 0,
+            "errors": [] if collaborators["returncode"] == 0 else [line for _, line in collaborators["lines"][-5:]],
+            "total_seconds": collaborators["total_seconds"],
+            "collaborators": count,
+            "collaborators_per_sec": rate(count, 0.0, collaborators["total_seconds"]),
+            "peak_rss_mb": collaborators["peak_rss_mb"],
+            "session_bytes": dir_bytes(session_dir) - before_bytes,
+            "server": {key: value - before_server[key] for key, value in server.stats().items()},
+        }
+    finally:
+        if not keep:
+            shutil.rmtree(session_dir, ignore_errors=True)
+    return results
+
+
+def metric(run: Dict, path: str):
+    value = run
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def compare(runs: Dict, config: Dict, baseline: Dict, tolerance: float) -> Dict:
+    """Önceki rapora göre değişimler; tolerans yüzdesinden fazla kötüleşme regresyondur"""
+    comparison = {}
+    regressions = []
+    for name, run in runs.items():
+        base_run = baseline.get("runs", {}).get(name)
+        if not base_run or not run.get("ok") or not base_run.get("ok"):
+            continue
+        for path, higher_is_better in COMPARED_METRICS:
+            current, previous = metric(run, path), metric(base_run, path)
+            if not isinstance(current, (int, float)) or not isinstance(previous, (int, float)) or not previous:
+                continue
+            change = (current - previous) / previous * 100
+            worse = -change if higher_is_better else change
+            comparison.setdefault(name, {})[path] = {
+                "baseline": previous, "current": current, "change_pct": round(change, 1)
+            }
+            if worse > tolerance:
+                regressions.append(f"{name}: {path} {previous} -> {current} ({change:+.1f}%)")
+    # Farklı fixture ayarlarıyla alınmış raporlar doğrudan karşılaştırılamaz
+    return {"config_changed": baseline.get("config") != config, "runs": comparison, "regressions": regressions}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--engines", default="http,selenium")
+    parser.add_argument("--scenarios", default="search,email",
+                        help="search: ilk 50 profil; email: 3. sayfadaki email'i bul ve işbirlikçileri çek")
+    parser.add_argument("--scripts", action="store_true", help="main_codes/scripts akışlarını da çalıştır")
+    parser.add_argument("--output", help="JSON raporun yazılacağı dosya")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki JSON rapor")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="Regresyon eşiği (yüzde)")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--keep-sessions", action="store_true", help="Benchmark session'larını silme")
+    add_site_arguments(parser)
+    args = parser.parse_args()
+
+    server = StandinProcess(args)
+    # src modülleri (driver_pool.BASE_URL) bundan sonra yüklenir
+    os.environ["YOK_BASE_URL"] = server.base_url
+    site = site_from_args(args)
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_scraper_"))
+    sessions_dir = work_dir / "sessions"
+    sessions_dir.mkdir()
+
+    # email senaryosu: 3. sayfadaki bir profil (50 profil sınırı içinde)
+    email_index = min(args.results - 1, 2 * args.page_size + args.page_size // 2, 49)
+    target_email = site.search_result(QUERY, email_index)["email"].replace("[at]", "@")
+
+    runs = {}
+    try:
+        for engine in [e.strip() for e in args.engines.split(",") if e.strip()]:
+            for scenario in [s.strip() for s in args.scenarios.split(",") if s.strip()]:
+                email = target_email if scenario == "email" else None
+                print(f"▶ {engine}/{scenario}", file=sys.stderr)
+                try:
+                    runs[f"{engine}/{scenario}"] = run_engine(engine, scenario, email, server, sessions_dir, work_dir)
+                except Exception as e:
+                    runs[f"{engine}/{scenario}"] = {"ok": False, "errors": [f"{type(e).__name__}: {e}"]}
+        if args.scripts:
+            print("▶ scripts", file=sys.stderr)
+            runs.update(run_script_flows(server, site, args.keep_sessions))
+    finally:
+        server.close()
+        if args.keep_sessions:
+            print(f"ℹ️ Session'lar: {sessions_dir}", file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "query": QUERY, "email_index": email_index, "results": args.results, "page_size": args.page_size,
+            "collaborators": args.collaborators, "deleted_ratio": args.deleted_ratio,
+            "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "seed": args.seed,
+        },
+        "runs": runs,
+    }
+    if args.baseline:
+        report["comparison"] = compare(runs, report["config"], json.loads(Path(args.baseline).read_text(encoding="utf-8")),
+                                       args.tolerance)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text, encoding="utf-8")
+    print(text)
+    if args.fail_on_regression and report.get("comparison", {}).get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
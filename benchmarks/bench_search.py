@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Yerel profil arama benchmark'ı: sentetik profillerle indeks kurulumu ve
+terim / öbek / önek / boolean sorgu gecikmeleri
+
+Kullanım:
+    python benchmarks/bench_search.py [--profiles 100000] [--repeat 50]
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper.search_index import ProfileSearchIndex
+from src.utils.helpers import load_fields
+
+FIRST_NAMES = ["AHMET", "MEHMET", "AYŞE", "FATMA", "İSMAİL", "IŞIL", "ŞULE", "ÇAĞRI", "GÜLŞEN", "ÖMER"]
+LAST_NAMES = ["YILMAZ", "KAYA", "DEMİR", "ŞAHİN", "ÇELİK", "ÖZTÜRK", "AYDIN", "IŞIK", "KILIÇ", "GÜNEŞ"]
+CITIES = ["ANKARA", "İSTANBUL", "İZMİR", "ISPARTA", "ZONGULDAK", "ERZURUM", "KONYA", "SAMSUN"]
+TITLES = ["PROFESÖR", "DOÇENT", "DOKTOR ÖĞRETİM ÜYESİ", "ARAŞTIRMA GÖREVLİSİ"]
+
+
+def synthetic_profiles(fields_data, n: int, seed: int = 42):
+    rng = random.Random(seed)
+    pairs = [(f['name'], s['name']) for f in fields_data for s in f['specialties']]
+    for i in range(n):
+        green, blue = rng.choice(pairs)
+        _, other = rng.choice(pairs)
+        yield {
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "title": rng.choice(TITLES),
+            "url": f"https://akademik.yok.gov.tr/AkademikArama/view?authorId=S{i:08X}",
+            "header": f"{rng.choice(CITIES)} ÜNİVERSİTESİ/{blue.upper()} BÖLÜMÜ/",
+            "green_label": green,
+            "blue_label": blue,
+            "keywords": f"{other} ; {rng.choice(CITIES).title()} Çalışmaları",
+        }
+
+
+def time_query(index: ProfileSearchIndex, query: str, repeat: int) -> dict:
+    samples = []
+    total = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        total = index.search(query, limit=20)["total"]
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"matches": total, "median_ms": round(statistics.median(samples), 3),
+            "max_ms": round(max(samples), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    fields_data = load_fields()
+    # Boş dizin: yalnızca sentetik kayıtlar indekslenir
+    index = ProfileSearchIndex(Path(tempfile.mkdtemp()))
+    index.search("")
+
+    start = time.perf_counter()
+    for profile in synthetic_profiles(fields_data, args.profiles):
+        index._pending.append(("bench", "profiles", profile))
+    index.search("")
+    build_seconds = time.perf_counter() - start
+
+    queries = {
+        "term": "öztürk",
+        "ascii_folded_term": "ozturk",
+        "two_terms": "işık ankara",
+        "phrase": '"türk dili"',
+        "prefix": "mühendis*",
+        "boolean": "(izmir OR ısparta) AND profesör -kimya",
+    }
+    print(json.dumps({
+        "profiles": args.profiles,
+        "build_seconds": round(build_seconds, 2),
+        "profiles_per_sec": round(args.profiles / build_seconds),
+        **index.stats(),
+        "queries": {name: dict(time_query(index, query, args.repeat), query=query)
+                    for name, query in queries.items()},
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Session depolama benchmark'ı: eski (her eklemede tüm listeyi yeniden yaz)
+ve yeni (append-only JSONL + sıkıştırma) yöntemlerinin karşılaştırması
+
+Kullanım:
+    python benchmarks/bench_session_storage.py [--profiles 100] [--collaborators 100]
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper.session_manager import AcademicScrapingSession, get_state_writer, iter_session_records
+
+
+def sample_profile(i: int) -> dict:
+    info = (f"PROFESÖR\nAD SOYAD {i}\nÖRNEK ÜNİVERSİTESİ/MÜHENDİSLİK FAKÜLTESİ/BÖLÜM {i}/\n"
+            "Mühendislik Temel Alanı   Bilgisayar Bilimleri ve Mühendisliği Yapay Zeka ; Veri Madenciliği")
+    return {
+        "id": i,
+        "name": f"AD SOYAD {i}",
+        "title": "PROFESÖR",
+        "url": f"https://akademik.yok.gov.tr/AkademikArama/AkademisyenGorevOgrenimBilgileri?authorId={i:016X}",
+        "info": info,
+        "header": f"ÖRNEK ÜNİVERSİTESİ/MÜHENDİSLİK FAKÜLTESİ/BÖLÜM {i}/",
+        "green_label": "Mühendislik Temel Alanı",
+        "blue_label": "Bilgisayar Bilimleri ve Mühendisliği",
+        "email": f"ad.soyad{i}@ornek.edu.tr",
+        "photoUrl": "https://akademik.yok.gov.tr/AkademikArama/authorimages/photo_m.jpg",
+    }
+
+
+def written_bytes() -> int:
+    """Process'in write() ile yazdığı toplam byte (Linux /proc/self/io)"""
+    try:
+        for line in Path("/proc/self/io").read_text().splitlines():
+            if line.startswith("wchar:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def run_legacy(base_dir: Path, n_profiles: int, n_collaborators: int) -> dict:
+    """Eski yöntem: her eklemede tüm listeyi indent=2 ile yeniden yaz"""
+    profiles, collaborators = [], []
+    bytes_written = 0
+    start_io = written_bytes()
+    start = time.perf_counter()
+    for i in range(n_profiles):
+        profiles.append(sample_profile(i))
+        data = json.dumps(profiles, ensure_ascii=False, indent=2)
+        (base_dir / "profiles.json").write_text(data, encoding="utf-8")
+        bytes_written += len(data.encode("utf-8"))
+    for i in range(n_collaborators):
+        collaborators.append(sample_profile(10_000 + i))
+        data = json.dumps(collaborators, ensure_ascii=False, indent=2)
+        (base_dir / "collaborators.json").write_text(data, encoding="utf-8")
+        bytes_written += len(data.encode("utf-8"))
+    elapsed = time.perf_counter() - start
+    io_bytes = written_bytes() - start_io if start_io >= 0 else bytes_written
+    return {"seconds": elapsed, "bytes_written": io_bytes}
+
+
+def run_jsonl(sessions_dir: Path, n_profiles: int, n_collaborators: int) -> dict:
+    """Yeni yöntem: AcademicScrapingSession (append-only log + sıkıştırma)"""
+    start_io = written_bytes()
+    start = time.perf_counter()
+    session = AcademicScrapingSession("bench_jsonl", sessions_dir=sessions_dir)
+    for i in range(n_profiles):
+        session.add_profile(sample_profile(i))
+    for i in range(n_collaborators):
+        session.add_collaborator(sample_profile(10_000 + i))
+    session.finalize()
+    get_state_writer().flush()
+    elapsed = time.perf_counter() - start
+    io_bytes = written_bytes() - start_io if start_io >= 0 else -1
+
+    # Okuyucu API'si kayıtları eksiksiz geri vermeli
+    read_back = sum(1 for _ in iter_session_records("bench_jsonl", "profiles", sessions_dir))
+    assert read_back == n_profiles, read_back
+    return {"seconds": elapsed, "bytes_written": io_bytes}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=100)
+    parser.add_argument("--collaborators", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        legacy_dir = tmp_path / "legacy"
+        legacy_dir.mkdir()
+        legacy = run_legacy(legacy_dir, args.profiles, args.collaborators)
+        jsonl = run_jsonl(tmp_path / "sessions", args.profiles, args.collaborators)
+        final_size = sum(p.stat().st_size for p in (tmp_path / "legacy").iterdir())
+
+    for result in (legacy, jsonl):
+        result["write_amplification"] = round(result["bytes_written"] / final_size, 2)
+
+    print(json.dumps({
+        "records": {"profiles": args.profiles, "collaborators": args.collaborators},
+        "final_json_bytes": final_size,
+        "legacy_rewrite": legacy,
+        "jsonl_append": jsonl,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+YÖK Akademik yerine geçen yerel HTTP sunucusu (benchmark fixture'ı)
+
+Scraper'ların kullandığı sayfaları deterministik sentetik veriyle sunar:
+arama sayfası (#aramaTerim / #searchButton, çerez banner'ı), 'Akademisyenler'
+sekmesi, sayfalı tr[id^='authorInfo_'] satırları, profil sayfaları ve SVG
+işbirlikçi grafiği (viewAuthorGraphs.jsp). Sonuç / işbirlikçi sayıları ve
+yapay gecikme ayarlanabilir; /__stats istek ve byte sayaçlarını döndürür.
+
+Kullanım:
+    python benchmarks/yok_standin.py [--port 8765] [--results 120] [--page-size 20]
+                                     [--collaborators 30] [--latency-ms 20]
+    YOK_BASE_URL=http://127.0.0.1:8765/ python run_server.py
+"""
+import argparse
+import html
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote_plus, urlsplit
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.helpers import load_fields
+
+FIRST_NAMES = ["AHMET", "MEHMET", "AYŞE", "FATMA", "İSMAİL", "IŞIL", "ŞULE", "ÇAĞRI", "GÜLŞEN", "ÖMER",
+               "EMRE", "ZEYNEP", "BURAK", "ELİF", "HÜLYA", "OĞUZ", "SEDA", "TUNCAY", "YASEMİN", "KEREM"]
+LAST_NAMES = ["YILMAZ", "KAYA", "DEMİR", "ŞAHİN", "ÇELİK", "ÖZTÜRK", "AYDIN", "IŞIK", "KILIÇ", "GÜNEŞ"]
+CITIES = ["ANKARA", "İSTANBUL", "İZMİR", "ISPARTA", "ZONGULDAK", "ERZURUM", "KONYA", "SAMSUN"]
+TITLES = ["PROFESÖR", "DOÇENT", "DOKTOR ÖĞRETİM ÜYESİ", "ARAŞTIRMA GÖREVLİSİ"]
+ASCII = str.maketrans("ÇĞİIÖŞÜçğıöşü", "CGIIOSUcgiosu")
+
+PROFILE_PATH = "/AkademikArama/AkademisyenGorevOgrenimBilgileri"
+# 1x1 şeffaf GIF (profil fotoğrafları)
+PIXEL_GIF = bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b")
+
+
+def turkish_upper(text: str) -> str:
+    return text.replace("i", "İ").replace("ı", "I").upper()
+
+
+class StandinSite:
+    """Sentetik YÖK verisi: aynı ayarlarla her zaman aynı sayfalar üretilir"""
+
+    def __init__(self, results: int = 120, page_size: int = 20, collaborators: int = 30,
+                 deleted_ratio: float = 0.1, latency_ms: float = 0, jitter_ms: float = 0, seed: int = 42):
+        self.results = results
+        self.page_size = max(1, page_size)
+        self.collaborators = collaborators
+        self.deleted_ratio = deleted_ratio
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.seed = seed
+        self.pairs = [(field["name"], specialty["name"])
+                      for field in load_fields() for specialty in field["specialties"]] or [("-", "-")]
+        # Arama sonuçlarında verilen isimler: profil sayfası aynı ismi gösterir
+        self._names: Dict[str, str] = {}
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+
+    # --- Veri ---
+
+    def _rng(self, key: str) -> random.Random:
+        return random.Random(zlib.crc32(f"{self.seed}:{key}".encode("utf-8")))
+
+    @staticmethod
+    def _author_id(prefix: str, i: int) -> str:
+        return f"{zlib.crc32(prefix.encode('utf-8')):08X}{i:08X}"
+
+    def author(self, author_id: str, name: Optional[str] = None) -> Dict:
+        """authorId'den deterministik akademisyen"""
+        rng = self._rng(author_id)
+        default_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        name = name or self._names.get(author_id) or default_name
+        green, blue = rng.choice(self.pairs)
+        _, other = rng.choice(self.pairs)
+        city = rng.choice(CITIES)
+        slug = ".".join(name.translate(ASCII).lower().split())
+        return {
+            "author_id": author_id,
+            "name": name,
+            "title": rng.choice(TITLES),
+            "header": f"{city} ÜNİVERSİTESİ/FEN FAKÜLTESİ/{turkish_upper(blue)} BÖLÜMÜ/",
+            "green_label": green,
+            "blue_label": blue,
+            "keywords": [other, f"{city.title()} Çalışmaları"],
+            "email": f"{slug}.{author_id[-4:].lower()}[at]{city.translate(ASCII).lower()}.edu.tr",
+        }
+
+    def search_result(self, query: str, index: int) -> Dict:
+        """Sorgunun index'inci sonucu (0'dan başlar); isimler sorgu kelimelerini içerir"""
+        key = turkish_upper(" ".join(query.split()))
+        author_id = self._author_id(f"search:{key}", index)
+        words = key.split() or ["AD"]
+        rng = self._rng(author_id)
+        name = " ".join(words) if index == 0 else f"{rng.choice(FIRST_NAMES)} {' '.join(words)}"
+        self._names[author_id] = name
+        return self.author(author_id, name)
+
+    def collaborators_of(self, author_id: str) -> List[Tuple[str, Optional[str]]]:
+        """(isim, authorId) listesi; silinmiş profillerin authorId'si yok"""
+        rng = self._rng(f"graph:{author_id}")
+        result = []
+        for j in range(self.collaborators):
+            collaborator_id = self._author_id(f"graph:{author_id}", j)
+            name = self.author(collaborator_id)["name"]
+            result.append((name, None if rng.random() < self.deleted_ratio else collaborator_id))
+        return result
+
+    @staticmethod
+    def profile_url(author_id: str) -> str:
+        return f"{PROFILE_PATH}?islem=direct&authorId={author_id}"
+
+    # --- Sayfalar ---
+
+    def search_page(self) -> str:
+        return """<!DOCTYPE html><html><head><meta charset="utf-8"><title>YÖK Akademik Arama</title></head><body>
+<div id="cookieBanner"><button type="button" onclick="this.parentNode.remove()">Tümünü Kabul Et</button></div>
+<form id="searchForm" action="/AkademikArama/AkademikAra" method="get">
+<input type="text" id="aramaTerim" name="aramaTerim" value="">
+<input type="hidden" name="islem" value="1">
+<button type="submit" id="searchButton">Ara</button>
+</form></body></html>"""
+
+    def overview_page(self, query: str) -> str:
+        authors_url = f"/AkademikArama/AkademisyenArama?aramaTerim={quote_plus(query)}&page=1"
+        return f"""<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>
+<ul class="nav nav-tabs"><li><a href="#">Yayınlar</a></li><li><a href="{authors_url}">Akademisyenler</a></li></ul>
+<p>'{html.escape(query)}' için {self.results} akademisyen bulundu.</p></body></html>"""
+
+    def results_page(self, query: str, page: int) -> str:
+        pages = max(1, -(-self.results // self.page_size))
+        page = min(max(1, page), pages)
+        rows = []
+        for i in range((page - 1) * self.page_size, min(page * self.page_size, self.results)):
+            a = self.search_result(query, i)
+            labels = (f'<a class="anahtarKelime" href="#">{html.escape(a["green_label"])}</a>   '
+                      f'<a class="anahtarKelime" href="#">{html.escape(a["blue_label"])}</a> '
+                      f'{html.escape(" ; ".join(a["keywords"]))}')
+            rows.append(f"""<tr id="authorInfo_{i + 1}">
+<td><img class="img-circle" src="/AkademikArama/authorimages/{a['author_id']}.jpg"></td>
+<td><h6>{html.escape(a['title'])}</h6><h4><a href="{self.profile_url(a['author_id'])}">{html.escape(a['name'])}</a></h4>
+<h6>{html.escape(a['header'])}</h6>{labels}</td>
+<td><a href="mailto:{a['email']}">{a['email']}</a></td></tr>""")
+        items = []
+        for p in range(1, pages + 1):
+            if p == page:
+                items.append(f'<li class="active"><a href="#">{p}</a></li>')
+            else:
+                items.append(f'<li><a href="/AkademikArama/AkademisyenArama?aramaTerim={quote_plus(query)}&page={p}">{p}</a></li>')
+        return f"""<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>
+<table class="table">{''.join(rows)}</table>
+<ul class="pagination">{''.join(items)}</ul></body></html>"""
+
+    def profile_page(self, author_id: str) -> str:
+        a = self.author(author_id)
+        return f"""<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>
+<table><tr><td><img class="img-circle" id="imgPicture" src="/AkademikArama/authorimages/{author_id}.jpg"></td>
+<td><h6>{html.escape(a['title'])}</h6><h4>{html.escape(a['name'])}</h4><h6>{html.escape(a['header'])}</h6>
+<span class="label label-success">{html.escape(a['green_label'])}</span>
+<span class="label label-primary">{html.escape(a['blue_label'])}</span> {html.escape(' ; '.join(a['keywords']))}<br>
+<a href="mailto:{a['email']}">{a['email']}</a></td></tr></table>
+<ul class="nav"><li><a href="viewAuthorGraphs.jsp">İşbirlikçiler</a></li></ul></body></html>"""
+
+    def graph_page(self, author_id: str) -> str:
+        """d3 benzeri SVG: ilk iki g kapsayıcı ve merkez düğüm, sonra işbirlikçiler
+
+        Düğümlere tıklanınca #pageUrl profil adresine ayarlanır; düğüm verisi
+        d3'teki gibi g.__data__ üzerinde ve gömülü graphData'da da durur.
+        """
+        nodes = [{"name": self.author(author_id)["name"], "url": self.profile_url(author_id)}]
+        for name, collaborator_id in self.collaborators_of(author_id):
+            nodes.append({"name": name, "url": self.profile_url(collaborator_id) if collaborator_id else ""})
+        groups = [f'<g class="node"><circle r="6"></circle><text>{html.escape(node["name"])}</text></g>'
+                  for node in nodes]
+        data = json.dumps({"nodes": nodes}, ensure_ascii=False).replace("</", "<\\/")
+        return f"""<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>
+<a id="pageUrl" target="_blank">Profile git</a>
+<svg width="960" height="600"><g class="graph">{''.join(groups)}</g></svg>
+<script>
+var graphData = {data};
+var link = document.getElementById('pageUrl');
+document.querySelectorAll('svg g.node').forEach(function (g, i) {{
+  g.__data__ = graphData.nodes[i];
+  g.addEventListener('click', function () {{
+    var url = graphData.nodes[i].url;
+    if (url) {{ link.href = url; }} else {{ link.removeAttribute('href'); }}
+  }});
+}});
+</script></body></html>"""
+
+    # --- Yönlendirme ---
+
+    def route(self, path: str, query: Dict[str, List[str]], cookies: Dict[str, str]) -> Tuple[int, str, bytes, Dict]:
+        """(status, content-type, gövde, ek başlıklar)"""
+        arg = lambda key, default="": (query.get(key) or [default])[0]
+        headers: Dict[str, str] = {}
+        if path in ("/AkademikArama", "/AkademikArama/"):
+            body = self.search_page()
+        elif path == "/AkademikArama/AkademikAra":
+            body = self.overview_page(arg("aramaTerim"))
+        elif path == "/AkademikArama/AkademisyenArama":
+            try:
+                page = int(arg("page", "1"))
+            except ValueError:
+                page = 1
+            body = self.results_page(arg("aramaTerim"), page)
+        elif path == PROFILE_PATH and arg("authorId"):
+            # Gerçek sitede olduğu gibi grafik sayfası son açılan profili sunucu tarafında hatırlar
+            headers["Set-Cookie"] = f"standinAuthor={arg('authorId')}; Path=/AkademikArama"
+            body = self.profile_page(arg("authorId"))
+        elif path == "/AkademikArama/viewAuthorGraphs.jsp" and cookies.get("standinAuthor"):
+            body = self.graph_page(cookies["standinAuthor"])
+        elif path.startswith("/AkademikArama/authorimages/"):
+            return 200, "image/gif", PIXEL_GIF, headers
+        elif path == "/__stats":
+            with self._stats_lock:
+                stats = {"requests": self.requests, "bytes_sent": self.bytes_sent}
+            return 200, "application/json", json.dumps(stats).encode("utf-8"), headers
+        else:
+            return 404, "text/html; charset=utf-8", b"<html><body>Not found</body></html>", headers
+        return 200, "text/html; charset=utf-8", body.encode("utf-8"), headers
+
+    def delay(self):
+        if self.latency_ms or self.jitter_ms:
+            time.sleep(max(0.0, self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000)
+
+    def count(self, size: int):
+        with self._stats_lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+
+def make_handler(site: StandinSite):
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive istemci bağlantıları yeniden kullanabilsin
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            cookies = {}
+            for item in (self.headers.get("Cookie") or "").split(";"):
+                key, _, value = item.strip().partition("=")
+                if key:
+                    cookies[key] = value
+            if parts.path != "/__stats":
+                site.delay()
+            status, content_type, body, headers = site.route(parts.path, parse_qs(parts.query), cookies)
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+            if parts.path != "/__stats":
+                site.count(len(body))
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_standin_server(site: StandinSite, host: str = "127.0.0.1", port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Sunucuyu arka plan thread'inde başlat; (server, base_url) döndür"""
+    server = ThreadingHTTPServer((host, port), make_handler(site))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="yok-standin", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+def add_site_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--results", type=int, default=120, help="Sorgu başına sonuç sayısı")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--collaborators", type=int, default=30, help="Profil başına işbirlikçi")
+    parser.add_argument("--deleted-ratio", type=float, default=0.1, help="Linksiz (silinmiş) işbirlikçi oranı")
+    parser.add_argument("--latency-ms", type=float, default=0, help="İstek başına yapay gecikme")
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def site_from_args(args) -> StandinSite:
+    return StandinSite(results=args.results, page_size=args.page_size, collaborators=args.collaborators,
+                       deleted_ratio=args.deleted_ratio, latency_ms=args.latency_ms,
+                       jitter_ms=args.jitter_ms, seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0: boş port seç")
+    add_site_arguments(parser)
+    args = parser.parse_args()
+
+    server, base_url = start_standin_server(site_from_args(args), args.host, args.port)
+    # İlk satır benchmark harness'ı tarafından okunur
+    print(base_url, flush=True)
+    print(f"✅ YÖK stand-in sunucusu: {base_url}AkademikArama/", file=sys.stderr)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
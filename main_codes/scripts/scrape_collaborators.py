@@ -13,6 +13,16 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
+from lxml import html as lxml_html
+
+# Proje root'unu Python path'e ekle (paylaşılan HTTP istemcisi ve ayrıştırıcı için)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from src.scraper.parsers import (GRAPH_DATA_SCRIPT, collaborators_from_graph_data, inner_text,
+                                 parse_collaborator_graph)
+from src.utils.helpers import get_setting, yok_base_url
+from src.utils.http_client import KeepAliveHttpClient
 
 def sanitize_filename(name: str) -> str:
     return re.sub(r'[^A-Za-z0-9ĞÜŞİÖÇğüşiöç ]+', '_', name).strip().replace(" ", "_")
@@ -49,12 +59,85 @@ def get_profile_url_by_id(session_id, profile_id):
         print(f"[ERROR] main_profile.json okunamadı: {e}", flush=True)
         return None
 
+def parse_collaborator_html(idx, isim, href, page_html):
+    """İşbirlikçi detay sayfasını (HTML) kayda çevir"""
+    info = ""
+    title = ''
+    green_label = ''
+    blue_label = ''
+    keywords_str = ''
+    email = ''
+    doc = lxml_html.fromstring(page_html) if page_html else None
+    tds = doc.xpath("//td[h6]") if doc is not None else []
+    if not tds:
+        photo_url = DEFAULT_PHOTO_URL
+        deleted = True
+    else:
+        deleted = False
+        info = inner_text(tds[0])
+        info_lines = info.splitlines()
+        title = info_lines[0].strip() if len(info_lines) > 1 else isim
+        # Label ve keywordleri ayıkla (HTML span class ile)
+        green_span = tds[0].xpath(".//span[contains(concat(' ', normalize-space(@class), ' '), ' label-success ')]")
+        if green_span:
+            green_label = inner_text(green_span[0]).strip()
+        blue_span = tds[0].xpath(".//span[contains(concat(' ', normalize-space(@class), ' '), ' label-primary ')]")
+        if blue_span:
+            blue_label = inner_text(blue_span[0]).strip()
+            td_html = lxml_html.tostring(tds[0], encoding="unicode")
+            m = re.search(r'<span[^>]*label-primary[^>]*>.*?</span>([^<]*)', td_html)
+            if m:
+                kw = m.group(1).strip()
+                if kw:
+                    keywords_str = kw
+        info = info_lines[2].strip() if len(info_lines) > 2 else ''
+        email_link = tds[0].xpath(".//a[starts-with(@href, 'mailto')]")
+        if email_link:
+            email = inner_text(email_link[0]).strip().replace('[at]', '@')
+        img = doc.xpath("//img[contains(concat(' ', normalize-space(@class), ' '), ' img-circle ')]") \
+            or doc.xpath("//img[@id='imgPicture']")
+        photo_url = urljoin(href, img[0].get("src")) if img and img[0].get("src") else DEFAULT_PHOTO_URL
+    return {
+        "id": idx,
+        "name": isim,
+        "title": title,
+        "info": info,
+        "green_label": green_label,
+        "blue_label": blue_label,
+        "keywords": keywords_str,
+        "photoUrl": photo_url,
+        "status": "completed",
+        "deleted": deleted,
+        "url": href if not deleted else "",
+        "email": email
+    }
+
+def fetch_collaborator(idx, obj):
+    """Tek işbirlikçinin detay sayfasını çek (thread içinde çalışır)"""
+    href = obj['href']
+    page_html = http_client.get(href).text if href else ""
+    return parse_collaborator_html(idx, obj['name'], href, page_html)
+
+def write_collaborators(items, durable=False):
+    """collaborators.json'u atomik olarak yaz; fsync sadece son yazımda"""
+    tmp_path = collaborators_json_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False, indent=2)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, collaborators_json_path)
+
 # Argparse ekle
 parser = argparse.ArgumentParser()
 parser.add_argument('name')
 parser.add_argument('session_id')
 parser.add_argument('--profile-id', type=int, help='Profil ID (main_profile.json\'dan)')
 parser.add_argument('--profile-url', type=str, help='Profil URL\'i (opsiyonel)')
+parser.add_argument('--concurrency', type=int, default=get_setting("scraping.collaborator_concurrency", 6),
+                    help='Eşzamanlı detay sayfası isteği sayısı')
+parser.add_argument('--max-collaborators', type=int, default=get_setting("scraping.max_collaborators"),
+                    help='En fazla işlenecek işbirlikçi sayısı')
 args = parser.parse_args()
 
 target_name = args.name
@@ -62,7 +145,7 @@ session_id = args.session_id
 profile_url = args.profile_url
 profile_id = args.profile_id
 
-BASE = "https://akademik.yok.gov.tr/"
+BASE = yok_base_url()
 DEFAULT_PHOTO_URL = "/default_photo.jpg"
 collaborators_json_path = os.path.join(os.path.dirname(__file__), "..", "public", "collaborator-sessions", session_id, "collaborators.json")
 
@@ -84,6 +167,7 @@ driver = webdriver.Chrome(
 driver.set_window_size(1920, 1080)
 
 collaborators = []
+http_client = KeepAliveHttpClient(max_connections_per_host=max(1, args.concurrency))
 
 try:
     # Profile ID ile URL'i al
@@ -129,6 +213,14 @@ try:
     WebDriverWait(driver, 10).until(
         lambda d: len(d.find_elements(By.CSS_SELECTOR, "svg g")) > 2
     )
+    # Grafik verisi tek seferde okunur; bulunamazsa düğümlere tek tek tıklanır
+    graph_url = driver.current_url
+    data = driver.execute_script(GRAPH_DATA_SCRIPT)
+    isimler_ve_linkler = None
+    if data:
+        isimler_ve_linkler = collaborators_from_graph_data(data.get("nodes"), data.get("links"), graph_url, profile_url)
+    if isimler_ve_linkler is None:
+        isimler_ve_linkler = parse_collaborator_graph(driver.page_source, graph_url, profile_url)
     script = """
 const gs = document.querySelectorAll('svg g');
 const results = [];
@@ -140,94 +232,26 @@ for (let i = 2; i < gs.length; i++) {
 }
 return results;
 """
-    isimler_ve_linkler = driver.execute_script(script)
-    for idx, obj in enumerate(isimler_ve_linkler, start=1):
-        isim = obj['name']
-        href = obj['href']
-        info = ""
-        deleted = False
-        title = ''
-        header = ''
-        green_label = ''
-        blue_label = ''
-        keywords_str = ''
-        photo_url = ''
-        email = ''  # <-- burada email'i başta boş string olarak tanımla
-        if not href:
-            photo_url = DEFAULT_PHOTO_URL
-            deleted = True
-        else:
-            driver.get(href)
-            tds = driver.find_elements(By.XPATH, "//td[h6]")
-            if not tds:
-                photo_url = DEFAULT_PHOTO_URL
-                deleted = True
-            else:
-                info = tds[0].text
-                info_lines = info.splitlines()
-                if len(info_lines) > 1:
-                    title = info_lines[0].strip()
-                    name = info_lines[1].strip()
-                else:
-                    title = isim
-                    name = isim
-                header = info_lines[2].strip() if len(info_lines) > 2 else ''
-                # Label ve keywordleri ayıkla (HTML span class ile)
-                green_label = ''
-                blue_label = ''
-                keywords_str = ''
-                try:
-                    green_span = tds[0].find_element(By.CSS_SELECTOR, 'span.label-success')
-                    green_label = green_span.text.strip()
-                except Exception:
-                    pass
-                try:
-                    blue_span = tds[0].find_element(By.CSS_SELECTOR, 'span.label-primary')
-                    blue_label = blue_span.text.strip()
-                    td_html = tds[0].get_attribute('innerHTML')
-                    import re
-                    if isinstance(td_html, str):
-                        m = re.search(r'<span[^>]*label-primary[^>]*>.*?</span>([^<]*)', td_html)
-                        if m:
-                            kw = m.group(1).strip()
-                            if kw:
-                                keywords_str = kw
-                except Exception:
-                    pass
-                info = info_lines[2].strip() if len(info_lines) > 2 else ''
-                try:
-                    email_link = tds[0].find_element(By.CSS_SELECTOR, "a[href^='mailto']")
-                    email = email_link.text.strip().replace('[at]', '@')
-                except Exception:
-                    email = ''
-                try:
-                    img = driver.find_element(By.CSS_SELECTOR, "img.img-circle")
-                    photo_url = img.get_attribute("src")
-                except Exception:
-                    try:
-                        img = driver.find_element(By.CSS_SELECTOR, "img#imgPicture")
-                        photo_url = img.get_attribute("src")
-                    except Exception:
-                        photo_url = DEFAULT_PHOTO_URL
-        collaborators.append({
-            "id": idx,
-            "name": isim,
-            "title": title,
-            "info": info,
-            "green_label": green_label,
-            "blue_label": blue_label,
-            "keywords": keywords_str,
-            "photoUrl": photo_url,
-            "status": "completed",
-            "deleted": deleted,
-            "url": href if not deleted else "",
-            "email": email
-        })
-        with open(collaborators_json_path, "w", encoding="utf-8") as f:
-            json.dump(collaborators, f, ensure_ascii=False, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
-        time.sleep(0.5)  # Progressive loading için kısa bekleme
+    if isimler_ve_linkler is None:
+        isimler_ve_linkler = driver.execute_script(script)
+    if args.max_collaborators:
+        isimler_ve_linkler = isimler_ve_linkler[:args.max_collaborators]
+
+    # Detay sayfaları HTTP işçileriyle paralel çekilir, tamamlanma sırasıyla yazılır
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        futures = [
+            executor.submit(fetch_collaborator, idx, obj)
+            for idx, obj in enumerate(isimler_ve_linkler, start=1)
+        ]
+        for future in as_completed(futures):
+            try:
+                collaborators.append(future.result())
+            except Exception as e:
+                print(f"[ERROR] İşbirlikçi detayı çekilemedi: {e}", flush=True)
+                continue
+            collaborators.sort(key=lambda c: c["id"])
+            write_collaborators(collaborators)
+    write_collaborators(collaborators, durable=True)
     # --- DONE dosyasını sadece işbirlikçi varsa ve scraping bittiyse oluştur ---
     if collaborators:
         # Dosya sistemini tamamen senkronize et (Linux/Unix)
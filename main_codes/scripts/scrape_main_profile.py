@@ -127,7 +127,8 @@ SESSION_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "collabora
 os.makedirs(SESSION_DIR, exist_ok=True)
 print(f"[INFO] Session klasörü oluşturuldu: {SESSION_DIR}", flush=True)
 
-BASE = "https://akademik.yok.gov.tr/"
+# Benchmark'larda yerel YÖK sunucusuna yönlendirilebilir
+BASE = os.environ.get("YOK_BASE_URL", "https://akademik.yok.gov.tr/").rstrip("/") + "/"
 DEFAULT_PHOTO_URL = "/default_photo.jpg"
 
 options = webdriver.ChromeOptions()
@@ -5,10 +5,12 @@ Real-time streaming scraping için
 """
 import asyncio
 import json
+import sys
 import time
 import uuid
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
 
 from mcp.server import Server
 from mcp.types import (
@@ -28,6 +30,285 @@ import mcp.types as types
 # MCP Server
 server = Server("academic-scraper")
 
+# Scraping iş öncelikleri (küçük değer önce çalışır)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class QueueFullError(Exception):
+    """Scheduler kuyruğu dolu"""
+
+
+class ScrapeScheduler:
+    """Scraping işleri için kabul kontrolü ve kuyruk
+
+    Aynı anda en fazla max_running iş çalışır, fazlası kuyrukta bekler.
+    İşler tutacakları tarayıcı sayısını (drivers) bildirir; toplamı driver
+    havuzunu (max_drivers) aşacak iş, driver boşalana kadar kuyrukta kalır.
+    Sıradaki iş önce önceliğe (bekleyen interaktif çağrılar arka plan
+    işlerinden önce), aynı öncelikte çağıranlar arasında sırayla
+    (round-robin) seçilir; driver bekleyen işler, sığan (ör. HTTP) işleri
+    bekletmez. Tüm metodlar event loop thread'inden çağrılır.
+    """
+
+    def __init__(self, max_running: int = 10, max_queued: int = 100, max_drivers: Optional[int] = None):
+        self.max_running = max(1, max_running)
+        self.max_queued = max_queued
+        self.max_drivers = max(1, max_drivers) if max_drivers is not None else self.max_running
+        self._running: Dict[str, str] = {}
+        self._drivers: Dict[str, int] = {}
+        self._queues: Dict[int, "OrderedDict[str, Deque]"] = {
+            PRIORITY_INTERACTIVE: OrderedDict(),
+            PRIORITY_BACKGROUND: OrderedDict(),
+        }
+        self._waiting: Dict[str, asyncio.Future] = {}
+        self._wait_times: Deque[float] = deque(maxlen=256)
+        self.admitted = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_settings(cls) -> "ScrapeScheduler":
+        from src.scraper.driver_pool import configured_pool_size
+        from src.utils.helpers import get_setting
+        return cls(
+            max_running=get_setting("session.max_sessions", 10),
+            max_queued=get_setting("session.max_queued_jobs", 100),
+            max_drivers=configured_pool_size(),
+        )
+
+    def submit(self, session_id: str, caller_id: str = "default",
+               priority: int = PRIORITY_BACKGROUND, drivers: int = 0) -> asyncio.Future:
+        """İşi kabul et; dönen future iş çalışabilir olduğunda tamamlanır
+
+        drivers: işin havuzdan tutacağı driver sayısı (HTTP motoru için 0)
+        """
+        if len(self._waiting) >= self.max_queued:
+            self.rejected += 1
+            raise QueueFullError(f"Scraping kuyruğu dolu ({self.max_queued} iş bekliyor)")
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues[priority].setdefault(caller_id, deque())
+        queue.append((session_id, future, time.time(), min(max(0, drivers), self.max_drivers)))
+        self._waiting[session_id] = future
+        self._dispatch()
+        return future
+
+    async def wait(self, session_id: str, ticket: asyncio.Future):
+        """Sıra gelene kadar bekle"""
+        try:
+            await ticket
+        except asyncio.CancelledError:
+            if ticket.done() and not ticket.cancelled():
+                self.release(session_id)
+            else:
+                self._waiting.pop(session_id, None)
+            raise
+
+    def release(self, session_id: str):
+        """Slotu bırak ve sıradaki işleri başlat"""
+        self._running.pop(session_id, None)
+        self._drivers.pop(session_id, None)
+        self._dispatch()
+
+    def _dispatch(self):
+        """Slot ve driver yettiği sürece sıradaki işleri başlat"""
+        while len(self._running) < self.max_running:
+            entry = self._pop_next()
+            if entry is None:
+                break
+            caller_id, (next_id, future, queued_at, drivers) = entry
+            self._waiting.pop(next_id, None)
+            if future.done():
+                # Beklerken iptal edilmiş
+                continue
+            self._admit(next_id, caller_id, time.time() - queued_at, drivers)
+            future.set_result(None)
+
+    def is_scheduled(self, session_id: str) -> bool:
+        """Session çalışıyor veya kuyrukta mı"""
+        return session_id in self._running or session_id in self._waiting
+
+    def _admit(self, session_id: str, caller_id: str, waited: float, drivers: int = 0):
+        self._running[session_id] = caller_id
+        if drivers:
+            self._drivers[session_id] = drivers
+        self._wait_times.append(waited)
+        self.admitted += 1
+
+    def _pop_next(self):
+        """Sıradaki çalışabilir iş: driver'ı yetmeyen işler atlanır, sıraları korunur"""
+        free_drivers = self.max_drivers - sum(self._drivers.values())
+        for priority in sorted(self._queues):
+            callers = self._queues[priority]
+            for caller_id, queue in list(callers.items()):
+                for index, entry in enumerate(queue):
+                    if entry[3] <= free_drivers or entry[1].done():
+                        break
+                else:
+                    continue
+                del queue[index]
+                if queue:
+                    callers.move_to_end(caller_id)
+                else:
+                    del callers[caller_id]
+                return caller_id, entry
+        return None
+
+    def _iter_order(self) -> Iterator[str]:
+        """Kuyruktaki session'ları çalışacakları sırayla üret"""
+        for priority in sorted(self._queues):
+            queues = [list(queue) for queue in self._queues[priority].values()]
+            depth = 0
+            while any(depth < len(queue) for queue in queues):
+                for queue in queues:
+                    if depth < len(queue) and not queue[depth][1].done():
+                        yield queue[depth][0]
+                depth += 1
+
+    def position(self, session_id: str) -> Optional[int]:
+        """Kuyruktaki sıra (1 = sıradaki iş); kuyrukta değilse None"""
+        if session_id not in self._waiting:
+            return None
+        for index, queued_id in enumerate(self._iter_order(), start=1):
+            if queued_id == session_id:
+                return index
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._wait_times)
+        return {
+            "running": len(self._running),
+            "queued": len(self._waiting),
+            "max_running": self.max_running,
+            "drivers_in_use": sum(self._drivers.values()),
+            "max_drivers": self.max_drivers,
+            "max_queued": self.max_queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "queue_wait_p50": round(waits[len(waits) // 2], 3) if waits else 0.0,
+            "queue_wait_p95": round(waits[int(len(waits) * 0.95)], 3) if waits else 0.0,
+        }
+
+
+_scheduler: Optional[ScrapeScheduler] = None
+
+
+def get_scheduler() -> ScrapeScheduler:
+    """Process genelindeki scraping scheduler'ı"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ScrapeScheduler.from_settings()
+    return _scheduler
+
+
+class ProgressStreamer:
+    """Kısmi sonuçları MCP progress bildirimleri ile toplu olarak gönder
+
+    Her bildirimin message alanı bir JSON nesnesidir:
+    {"type": "partial", "profiles": [...], "collaborators": [...]} veya
+    {"type": "step", "step": "..."}. İlk kayıt beklemeden, sonrakiler
+    batch_size dolunca veya flush_interval geçince gönderilir.
+    """
+
+    def __init__(self, ctx, progress_token, batch_size: int = 10, flush_interval: float = 1.0):
+        self.ctx = ctx
+        self.progress_token = progress_token
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.progress = 0.0
+        self.notifications = 0
+        self._buffer: Dict[str, List[Dict]] = {"profiles": [], "collaborators": []}
+        self._buffered = 0
+        self._records_sent = False
+        self._last_flush = time.monotonic()
+
+    @classmethod
+    def for_current_request(cls) -> Optional["ProgressStreamer"]:
+        """İstekte progress token varsa streamer oluştur"""
+        try:
+            ctx = server.request_context
+        except LookupError:
+            return None
+        progress_token = ctx.meta.progressToken if ctx.meta else None
+        if progress_token is None:
+            return None
+        from src.utils.helpers import get_setting
+        return cls(
+            ctx,
+            progress_token,
+            batch_size=get_setting("streaming.batch_size", 10),
+            flush_interval=get_setting("streaming.flush_interval", 1.0),
+        )
+
+    async def _send(self, payload: Dict[str, Any]):
+        try:
+            await self.ctx.session.send_progress_notification(
+                progress_token=self.progress_token,
+                progress=self.progress,
+                total=100,
+                message=json.dumps(payload, ensure_ascii=False),
+                related_request_id=str(self.ctx.request_id),
+            )
+            self.notifications += 1
+        except Exception as e:
+            print(f"⚠️ Progress bildirimi gönderilemedi: {e}", file=sys.stderr)
+
+    async def add(self, kind: str, record: Dict, progress: Optional[float] = None):
+        """Kaydı tampona ekle, gerekiyorsa gönder"""
+        if progress is not None:
+            self.progress = progress
+        self._buffer[kind].append(record)
+        self._buffered += 1
+        if (not self._records_sent or self._buffered >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            await self.flush()
+
+    async def notify(self, payload: Dict[str, Any], progress: Optional[float] = None):
+        """Bekleyen kayıtları gönder, ardından özel bir olay bildir"""
+        await self.flush()
+        if progress is not None:
+            self.progress = progress
+        await self._send(payload)
+
+    async def step(self, progress: float, step: str):
+        """Aşama değişimi: bekleyen kayıtları gönder, ardından aşamayı bildir"""
+        await self.flush()
+        self.progress = progress
+        await self._send({"type": "step", "step": step})
+
+    async def flush(self):
+        """Tampondaki kayıtları tek bildirimde gönder"""
+        self._last_flush = time.monotonic()
+        if not self._buffered:
+            return
+        payload = {"type": "partial", **self._buffer}
+        self._buffer = {"profiles": [], "collaborators": []}
+        self._buffered = 0
+        self._records_sent = True
+        await self._send(payload)
+
+
+async def wait_for_turn(session_id: str, ticket: asyncio.Future):
+    """Sıra bekle; çalışmadan iptal edilen session hata ile biter (reaper bellekten atabilsin)"""
+    try:
+        await get_scheduler().wait(session_id, ticket)
+    except asyncio.CancelledError:
+        # İş hiç başlamadı (slot alınmışsa scheduler.wait bıraktı)
+        from src.scraper.session_manager import TERMINAL_STATUSES, get_session
+        session = get_session(session_id)
+        if session is not None and session.status not in TERMINAL_STATUSES:
+            session.mark_failed("Sırada beklerken iptal edildi")
+        raise
+
+async def run_admitted(session_id: str, ticket: asyncio.Future, job: Callable):
+    """Scheduler izin verince işi çalıştır, bitince slotu bırak"""
+    scheduler = get_scheduler()
+    await wait_for_turn(session_id, ticket)
+    try:
+        return await job()
+    finally:
+        scheduler.release(session_id)
+
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """MCP Tools listesi"""
@@ -53,17 +334,128 @@ async def handle_list_tools() -> List[Tool]:
                     },
                     "email": {
                         "type": "string",
-                        "description": "Email adresi (opsiyonel - tam eşleşme için)"
+                        "description": "Email adresi (opsiyonel - tam eşleşme için; daha önce görülen email ise arama yapılmadan doğrudan profile gidilir)"
                     },
                     "wait_for_completion": {
                         "type": "boolean",
                         "description": "Tamamlanmasını bekle (true) veya session başlat (false)",
-                        "default": true
+                        "default": True
+                    },
+                    "engine": {
+                        "type": "string",
+                        "enum": ["selenium", "http"],
+                        "description": "Scraping motoru: selenium (tarayıcı) veya http (tarayıcısız, daha hızlı)"
+                    },
+                    "cache_max_age": {
+                        "type": "number",
+                        "description": "Profil cache'inden kabul edilecek en eski kayıt yaşı (saniye, 0 = cache kullanma)"
+                    },
+                    "caller_id": {
+                        "type": "string",
+                        "description": "Çağıran istemci kimliği - kuyrukta çağıranlar arasında adil sıralama için (opsiyonel)"
                     }
                 },
                 "required": ["name"]
             }
         ),
+        Tool(
+            name="scrape_many_profiles",
+            description="Birden çok akademisyeni tek batch session'da ara - paylaşılan tarayıcı/HTTP kaynakları, authorId ile tekilleştirme",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "queries": {
+                        "type": "array",
+                        "description": "Aranacak sorgular",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string", "description": "Akademisyen adı"},
+                                "email": {"type": "string", "description": "Email adresi (opsiyonel)"},
+                                "field_id": {"type": "integer", "description": "Alan ID (opsiyonel)"},
+                                "specialty_ids": {
+                                    "type": "array",
+                                    "items": {"type": "integer"},
+                                    "description": "Uzmanlık ID'leri (opsiyonel)"
+                                }
+                            },
+                            "required": ["name"]
+                        }
+                    },
+                    "engine": {
+                        "type": "string",
+                        "enum": ["selenium", "http"],
+                        "description": "Scraping motoru"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Aynı anda çalışan sorgu sayısı (varsayılan: batch.concurrency)"
+                    },
+                    "cache_max_age": {
+                        "type": "number",
+                        "description": "Cache'ten kabul edilecek en eski kayıt yaşı (saniye, 0 = cache kullanma)"
+                    },
+                    "wait_for_completion": {
+                        "type": "boolean",
+                        "description": "Tamamlanmasını bekle (true) veya batch session başlat (false)",
+                        "default": False
+                    },
+                    "caller_id": {
+                        "type": "string",
+                        "description": "Çağıran istemci kimliği (opsiyonel)"
+                    }
+                },
+                "required": ["queries"]
+            }
+        ),
+        Tool(
+            name="crawl_collaboration_network",
+            description="Seed profillerden başlayarak YÖK işbirlikçi grafiğini çok adımlı (BFS) tara - düğümler ve kenarlar session dizinine yazılır",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "seeds": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Seed profil URL'leri veya (cache'te kaydı olan) authorId'ler"
+                    },
+                    "seed_session_id": {
+                        "type": "string",
+                        "description": "Profilleri seed olarak kullanılacak session ID (opsiyonel)"
+                    },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "En fazla adım sayısı (varsayılan: crawl.max_depth)"
+                    },
+                    "max_nodes": {
+                        "type": "integer",
+                        "description": "Düğüm bütçesi (varsayılan: crawl.max_nodes)"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Aynı anda genişletilen düğüm sayısı (selenium motorunda havuz boyutu ile sınırlı)"
+                    },
+                    "engine": {
+                        "type": "string",
+                        "enum": ["selenium", "http"],
+                        "description": "Grafik okuma motoru: http (tarayıcısız, gerekirse Selenium'a düşer) veya selenium (varsayılan: crawl.engine)"
+                    },
+                    "cache_max_age": {
+                        "type": "number",
+                        "description": "Cache'teki grafiklerin kabul edilecek en eski yaşı (saniye, 0 = cache kullanma)"
+                    },
+                    "wait_for_completion": {
+                        "type": "boolean",
+                        "description": "Tamamlanmasını bekle (true) veya arka planda tara (false)",
+                        "default": False
+                    },
+                    "caller_id": {
+                        "type": "string",
+                        "description": "Çağıran istemci kimliği (opsiyonel)"
+                    }
+                }
+            }
+        ),
         Tool(
             name="get_session_status",
             description="Session durumunu kontrol et",
@@ -88,20 +480,300 @@ async def handle_list_tools() -> List[Tool]:
         ),
         Tool(
             name="get_session_results",
-            description="Session sonuçlarını getir (profiles ve collaborators)",
+            description="Session sonuçlarını sayfa sayfa getir (profiles ve collaborators)",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "session_id": {
                         "type": "string",
                         "description": "Session ID"
+                    },
+                    "kind": {
+                        "type": "string",
+                        "enum": ["all", "profiles", "collaborators"],
+                        "description": "Getirilecek kayıt türü",
+                        "default": "all"
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Atlanacak kayıt sayısı (cursor verilmediyse)",
+                        "default": 0
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Sayfadaki en fazla kayıt sayısı (opsiyonel, en az 1)"
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "Önceki yanıttaki next_cursor değeri"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Sadece bu alanları döndür (örn. [\"name\", \"email\", \"url\"])"
+                    },
+                    "omit_heavy": {
+                        "type": "boolean",
+                        "description": "info ve photoUrl gibi büyük alanları atla",
+                        "default": False
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "Yanıttaki kayıtlar için byte bütçesi (varsayılan: results.max_response_bytes)"
+                    },
+                    "pretty": {
+                        "type": "boolean",
+                        "description": "Girintili JSON döndür",
+                        "default": False
                     }
                 },
                 "required": ["session_id"]
             }
+        ),
+        Tool(
+            name="resume_session",
+            description="Yarım kalmış (hata almış veya server yeniden başlamış) bir scraping session'ına checkpoint'inden devam et",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "session_id": {
+                        "type": "string",
+                        "description": "Devam edilecek session ID"
+                    },
+                    "wait_for_completion": {
+                        "type": "boolean",
+                        "description": "Tamamlanmasını bekle (true) veya arka planda devam et (false)",
+                        "default": False
+                    },
+                    "caller_id": {
+                        "type": "string",
+                        "description": "Çağıran istemci kimliği (opsiyonel)"
+                    }
+                },
+                "required": ["session_id"]
+            }
+        ),
+        Tool(
+            name="search_local_profiles",
+            description="Daha önce toplanan profil ve işbirlikçiler içinde tam metin arama (ağa çıkmadan, BM25 sıralı)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Arama ifadesi: kelimeler (VE), OR, NOT / -kelime, \"öbek\", önek*, parantez"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "En fazla sonuç",
+                        "default": 20
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Atlanacak sonuç sayısı",
+                        "default": 0
+                    },
+                    "field_id": {
+                        "type": "integer",
+                        "description": "Alan ID ile filtrele (opsiyonel)"
+                    },
+                    "specialty_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "Uzmanlık ID'leri ile filtrele (opsiyonel)"
+                    }
+                },
+                "required": ["query"]
+            }
+        ),
+        Tool(
+            name="resolve_profile",
+            description="Email veya (hatalı yazılmış olabilecek) isimden daha önce görülen akademisyenleri bul (ağa çıkmadan)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "İsim - Türkçe karakter / noktalı-noktasız i farkları ve yazım hataları tolere edilir"
+                    },
+                    "email": {
+                        "type": "string",
+                        "description": "Email - tam eşleşme"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "En fazla isim adayı",
+                        "default": 10
+                    },
+                    "min_similarity": {
+                        "type": "number",
+                        "description": "Trigram benzerlik eşiği (0-1)",
+                        "default": 0.3
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="graph_shortest_path",
+            description="Toplanan işbirliği grafiğinde iki akademisyen arasındaki en kısa bağlantı zinciri",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "source": {"type": "string", "description": "authorId veya profil URL'i"},
+                    "target": {"type": "string", "description": "authorId veya profil URL'i"},
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "En fazla yol uzunluğu",
+                        "default": 6
+                    }
+                },
+                "required": ["source", "target"]
+            }
+        ),
+        Tool(
+            name="graph_common_neighbors",
+            description="İki akademisyenin ortak işbirlikçileri (toplanan grafikten)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "a": {"type": "string", "description": "authorId veya profil URL'i"},
+                    "b": {"type": "string", "description": "authorId veya profil URL'i"}
+                },
+                "required": ["a", "b"]
+            }
+        ),
+        Tool(
+            name="graph_neighborhood",
+            description="Bir akademisyenin k adım içindeki işbirliği komşuluğu",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "author": {"type": "string", "description": "authorId veya profil URL'i"},
+                    "hops": {
+                        "type": "integer",
+                        "description": "Adım sayısı (1-3)",
+                        "default": 1
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "En fazla düğüm",
+                        "default": 100
+                    }
+                },
+                "required": ["author"]
+            }
+        ),
+        Tool(
+            name="graph_degree_ranking",
+            description="Toplanan grafikte en çok işbirlikçisi olan akademisyenler",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "top": {
+                        "type": "integer",
+                        "description": "Kaç akademisyen",
+                        "default": 20
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="manage_query_cache",
+            description="Arama sorgusu sonuç cache'ini listele, istatistiklerini getir veya temizle",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "action": {
+                        "type": "string",
+                        "enum": ["list", "stats", "purge"],
+                        "description": "Yapılacak işlem",
+                        "default": "stats"
+                    },
+                    "key": {
+                        "type": "string",
+                        "description": "purge için sorgu anahtarı (opsiyonel)"
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "purge için akademisyen adı (opsiyonel, tüm varyasyonları siler)"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="get_metrics",
+            description="Process genelindeki scraping aşama süreleri (histogram, p50/p95) ve olay sayaçları",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "prometheus"],
+                        "description": "Çıktı formatı",
+                        "default": "json"
+                    },
+                    "reset": {
+                        "type": "boolean",
+                        "description": "Okuduktan sonra process metriklerini sıfırla",
+                        "default": False
+                    }
+                }
+            }
         )
     ]
 
+def new_session_id() -> str:
+    """Benzersiz session ID üret"""
+    return f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
+
+def query_from_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache kaydı için sorgu alanları"""
+    return {key: arguments.get(key) for key in ("name", "field_id", "specialty_ids", "email")}
+
+def create_scraper(engine: str = None):
+    """İstenen motora göre scraper oluştur"""
+    from src.scraper.driver_pool import get_driver_pool
+    from src.utils.helpers import get_setting
+    
+    engine = engine or get_setting("scraping.engine", "selenium")
+    if engine == "http":
+        from src.scraper.http_scraper import HttpAcademicScraper
+        return HttpAcademicScraper(driver_pool=get_driver_pool())
+    
+    from src.scraper.academic_scraper import StreamingAcademicScraper
+    return StreamingAcademicScraper(driver_pool=get_driver_pool())
+
+def scrape_drivers(engine: str = None, workers: int = 1) -> int:
+    """İşin havuzdan tutacağı driver sayısı (HTTP motoru tarayıcı tutmaz)"""
+    from src.utils.helpers import get_setting
+    
+    engine = engine or get_setting("scraping.engine", "selenium")
+    return 0 if engine == "http" else workers
+
+def create_network_crawler(session, query: Dict[str, Any], on_progress: Optional[Callable] = None):
+    """Checkpoint sorgusundan ağ tarayıcısı oluştur
+
+    HTTP motorunda grafikler önce tarayıcısız okunur, olmazsa Selenium'a düşülür.
+    """
+    from src.scraper.driver_pool import get_driver_pool
+    from src.scraper.network_crawler import NetworkCrawler
+    
+    engine = query["engine"]
+    concurrency = query["concurrency"]
+    if engine != "http":
+        # Her worker havuzdan bir driver tutar
+        concurrency = min(concurrency, get_driver_pool().size)
+    return NetworkCrawler(
+        session,
+        scraper_factory=lambda: create_scraper(engine),
+        max_depth=query["max_depth"],
+        max_nodes=query["max_nodes"],
+        concurrency=concurrency,
+        cache_max_age=query.get("cache_max_age"),
+        on_progress=on_progress
+    )
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Tool çağrı handler"""
@@ -109,47 +781,170 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
     if name == "scrape_academic_profiles":
         # Lazy loading - Selenium import'larını sadece gerektiğinde yap
         try:
-            from src.scraper.academic_scraper import StreamingAcademicScraper
-            from src.scraper.session_manager import create_session, get_session, list_sessions
+            from src.scraper.query_cache import STALE, get_query_cache, make_query_key
+            from src.scraper.records import to_dicts
+            from src.scraper.session_manager import create_session, get_session, list_sessions, remove_session
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Scraping modülleri yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        # wait_for_completion parametresini kontrol et
+        wait_for_completion = arguments.get("wait_for_completion", True)
+        
+        # Sorgu cache'i: taze kayıt hemen, bayat kayıt hemen + arka planda yenileme
+        query_cache = get_query_cache()
+        cache_key = make_query_key(arguments["name"], arguments.get("field_id"),
+                                   arguments.get("specialty_ids"), arguments.get("email"))
+        if arguments.get("cache_max_age") != 0:
+            entry, state = query_cache.lookup(cache_key, max_age=arguments.get("cache_max_age"))
+            if entry:
+                if state == STALE and query_cache.begin_refresh(cache_key):
+                    asyncio.create_task(refresh_query_cache(cache_key, dict(arguments)))
+                cache_info = {
+                    "state": state,
+                    "age": round(time.time() - entry["stored_at"], 1)
+                }
+                if not wait_for_completion:
+                    # Yeni scraping başlatılmaz: sonuçlar cache'lenen session'da
+                    response = {
+                        "type": "session_started",
+                        "data": {
+                            "session_id": entry["session_id"],
+                            "message": f"'{arguments['name']}' için {len(entry['profiles'])} profil bulundu (cache)",
+                            "status": "completed",
+                            "total_profiles": len(entry["profiles"]),
+                            "total_collaborators": len(entry["collaborators"]),
+                            "cache": cache_info,
+                            "results_with": f"get_session_results tool'u ile session_id: {entry['session_id']}"
+                        }
+                    }
+                    return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
+                streamer = ProgressStreamer.for_current_request()
+                if streamer:
+                    # Cache'teki kayıtlar da bildirimlerle gönderilir: yanıt küçük kalır
+                    for kind in ("profiles", "collaborators"):
+                        for record in to_dicts(entry[kind]):
+                            await streamer.add(kind, record, 100)
+                    await streamer.flush()
+                    response = {
+                        "type": "completed",
+                        "data": {
+                            "session_id": entry["session_id"],
+                            "total_profiles": len(entry["profiles"]),
+                            "total_collaborators": len(entry["collaborators"]),
+                            "streamed": True,
+                            "notifications": streamer.notifications,
+                            "message": f"'{arguments['name']}' için {len(entry['profiles'])} profil bulundu (cache)",
+                            "results_with": f"get_session_results tool'u ile session_id: {entry['session_id']}",
+                            "cache": cache_info
+                        }
+                    }
+                    return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
+                response = {
+                    "type": "completed",
+                    "data": {
+                        "session_id": entry["session_id"],
+                        "profiles": to_dicts(entry["profiles"]),
+                        "collaborators": to_dicts(entry["collaborators"]),
+                        "total_profiles": len(entry["profiles"]),
+                        "total_collaborators": len(entry["collaborators"]),
+                        "message": f"'{arguments['name']}' için {len(entry['profiles'])} profil bulundu (cache)",
+                        "cache": cache_info
+                    }
+                }
+                return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
+        
+        try:
+            scraper = create_scraper(arguments.get("engine"))
         except ImportError as e:
             return [types.TextContent(type="text", text=json.dumps({
                 "error": f"Scraping modülleri yüklenemedi: {str(e)}"
             }, ensure_ascii=False))]
         
         # Yeni session oluştur
-        session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
+        session_id = new_session_id()
         
         # Session'ı başlat
-        create_session(session_id)
+        session = create_session(session_id)
         
-        # wait_for_completion parametresini kontrol et
-        wait_for_completion = arguments.get("wait_for_completion", True)
+        # Kabul kontrolü: bekleyen çağrılar arka plan işlerinden önce çalışır
+        scheduler = get_scheduler()
+        try:
+            ticket = scheduler.submit(
+                session_id,
+                caller_id=arguments.get("caller_id") or "default",
+                priority=PRIORITY_INTERACTIVE if wait_for_completion else PRIORITY_BACKGROUND,
+                drivers=scrape_drivers(arguments.get("engine"))
+            )
+        except QueueFullError as e:
+            remove_session(session_id)
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": str(e)
+            }, ensure_ascii=False))]
+        
+        if not ticket.done():
+            session.status = "queued"
+            session.current_step = "Sırada bekliyor"
         
         if wait_for_completion:
             # Direkt scraping yap ve sonucu bekle
-            scraper = StreamingAcademicScraper()
             profiles = []
             collaborators = []
             
+            # İstemci progress token gönderdiyse kısmi sonuçlar bildirimlerle akar
+            streamer = ProgressStreamer.for_current_request()
+            
+            await wait_for_turn(session_id, ticket)
             try:
                 async for update in scraper.scrape_profiles_streaming(
                     name=arguments["name"],
                     session_id=session_id,
                     field_id=arguments.get("field_id"),
                     specialty_ids=arguments.get("specialty_ids"),
-                    email=arguments.get("email")
+                    email=arguments.get("email"),
+                    cache_max_age=arguments.get("cache_max_age")
                 ):
-                    if update.get("type") == "profile_added":
+                    update_type = update.get("type")
+                    if update_type in ("profile_added", "email_match"):
                         profiles.append(update["data"]["profile"])
-                    elif update.get("type") == "collaborator_added":
+                        if streamer:
+                            await streamer.add("profiles", update["data"]["profile"], update["data"].get("progress"))
+                    elif update_type == "collaborator_added":
                         collaborators.append(update["data"]["collaborator"])
-                    elif update.get("type") == "completed":
+                        if streamer:
+                            await streamer.add("collaborators", update["data"]["collaborator"], update["data"].get("progress"))
+                    elif update_type == "progress":
+                        if streamer:
+                            await streamer.step(update["data"]["progress"], update["data"]["step"])
+                    elif update_type == "completed":
                         break
-                    elif update.get("type") == "error":
+                    elif update_type == "error":
+                        if streamer:
+                            await streamer.flush()
                         return [types.TextContent(type="text", text=json.dumps({
                             "error": update["data"]["message"]
                         }, ensure_ascii=False))]
                 
+                query_cache.store(cache_key, query_from_arguments(arguments), profiles, collaborators, session_id)
+                
+                if streamer:
+                    await streamer.flush()
+                    # Kayıtlar bildirimlerle gönderildi: yanıt küçük kalır
+                    response = {
+                        "type": "completed",
+                        "data": {
+                            "session_id": session_id,
+                            "total_profiles": len(profiles),
+                            "total_collaborators": len(collaborators),
+                            "streamed": True,
+                            "notifications": streamer.notifications,
+                            "message": f"'{arguments['name']}' için {len(profiles)} profil bulundu",
+                            "results_with": f"get_session_results tool'u ile session_id: {session_id}"
+                        }
+                    }
+                    return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
+                
                 # Sonuçları döndür
                 response = {
                     "type": "completed",
@@ -169,18 +964,21 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
                 return [types.TextContent(type="text", text=json.dumps({
                     "error": f"Scraping hatası: {str(e)}"
                 }, ensure_ascii=False))]
+            
+            finally:
+                scheduler.release(session_id)
         
         else:
-            # Background task olarak scraping'i başlat
-            asyncio.create_task(
-                run_scraping_background(
-                    session_id=session_id,
-                    name=arguments["name"],
-                    field_id=arguments.get("field_id"),
-                    specialty_ids=arguments.get("specialty_ids"),
-                    email=arguments.get("email")
-                )
-            )
+            # Background task olarak scraping'i başlat (sırası gelince)
+            asyncio.create_task(run_admitted(session_id, ticket, lambda: run_scraping_background(
+                session_id=session_id,
+                name=arguments["name"],
+                field_id=arguments.get("field_id"),
+                specialty_ids=arguments.get("specialty_ids"),
+                email=arguments.get("email"),
+                cache_max_age=arguments.get("cache_max_age"),
+                scraper=scraper
+            )))
             
             # Hemen session bilgisi döndür
             response = {
@@ -188,7 +986,8 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
                 "data": {
                     "session_id": session_id,
                     "message": f"'{arguments['name']}' için scraping başlatıldı",
-                    "status": "running",
+                    "status": "running" if ticket.done() else "queued",
+                    "queue_position": scheduler.position(session_id),
                     "timestamp": time.time(),
                     "check_status_with": f"get_session_status tool'u ile session_id: {session_id} kullanarak durumu kontrol edebilirsiniz"
                 }
@@ -196,23 +995,211 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             
             return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
     
+    elif name == "scrape_many_profiles":
+        # Lazy loading
+        try:
+            from src.scraper.batch import BatchScrapeRunner
+            from src.scraper.session_manager import create_session, remove_session
+            from src.utils.helpers import get_setting
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Scraping modülleri yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        queries = [query for query in arguments.get("queries") or [] if (query.get("name") or "").strip()]
+        max_queries = get_setting("batch.max_queries", 1000)
+        if not queries or len(queries) > max_queries:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"1 ile {max_queries} arasında sorgu gönderilmeli"
+            }, ensure_ascii=False))]
+        
+        engine = arguments.get("engine") or get_setting("scraping.engine", "selenium")
+        concurrency = arguments.get("concurrency") or get_setting("batch.concurrency", 2)
+        if engine != "http":
+            # Her worker havuzdan bir driver tutar
+            from src.scraper.driver_pool import get_driver_pool
+            concurrency = min(concurrency, get_driver_pool().size)
+        
+        session_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
+        session = create_session(session_id)
+        
+        # Batch scheduler'da tek iş olarak sayılır
+        scheduler = get_scheduler()
+        wait_for_completion = arguments.get("wait_for_completion", False)
+        try:
+            ticket = scheduler.submit(
+                session_id,
+                caller_id=arguments.get("caller_id") or "default",
+                priority=PRIORITY_INTERACTIVE if wait_for_completion else PRIORITY_BACKGROUND,
+                drivers=scrape_drivers(engine, concurrency)
+            )
+        except QueueFullError as e:
+            remove_session(session_id)
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": str(e)
+            }, ensure_ascii=False))]
+        if not ticket.done():
+            session.status = "queued"
+            session.current_step = "Sırada bekliyor"
+        
+        streamer = ProgressStreamer.for_current_request() if wait_for_completion else None
+        
+        async def on_query_done(summary: Dict[str, Any]):
+            if streamer:
+                done = runner.stats["completed_queries"] + runner.stats["failed_queries"]
+                await streamer.notify({"type": "query_completed", **summary}, progress=done / len(queries) * 100)
+        
+        runner = BatchScrapeRunner(
+            session,
+            queries,
+            scraper_factory=lambda: create_scraper(engine),
+            concurrency=concurrency,
+            cache_max_age=arguments.get("cache_max_age"),
+            on_query_done=on_query_done
+        )
+        job = run_admitted(session_id, ticket, runner.run)
+        
+        if wait_for_completion:
+            stats = await job
+            response = {
+                "type": "completed",
+                "data": {
+                    "session_id": session_id,
+                    "stats": stats,
+                    "results_with": f"get_session_results tool'u ile session_id: {session_id}"
+                }
+            }
+        else:
+            asyncio.create_task(job)
+            response = {
+                "type": "session_started",
+                "data": {
+                    "session_id": session_id,
+                    "message": f"{len(queries)} sorgu için toplu arama başlatıldı",
+                    "status": "running" if ticket.done() else "queued",
+                    "queue_position": scheduler.position(session_id),
+                    "concurrency": runner.concurrency,
+                    "check_status_with": f"get_session_status tool'u ile session_id: {session_id} kullanarak durumu kontrol edebilirsiniz"
+                }
+            }
+        return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
+    
+    elif name == "crawl_collaboration_network":
+        # Lazy loading
+        try:
+            from src.scraper.network_crawler import resolve_seeds
+            from src.scraper.profile_cache import get_profile_cache
+            from src.scraper.session_manager import create_session, remove_session
+            from src.utils.helpers import get_setting
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Scraping modülleri yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        seeds, unresolved = resolve_seeds(arguments.get("seeds") or [], arguments.get("seed_session_id"),
+                                          get_profile_cache())
+        if not seeds:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": "Geçerli seed bulunamadı (profil URL'i, cache'te kaydı olan authorId veya seed_session_id gerekli)",
+                "unresolved_seeds": unresolved
+            }, ensure_ascii=False))]
+        
+        session_id = f"crawl_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
+        session = create_session(session_id)
+        query = {
+            "seeds": [seed["url"] for seed in seeds],
+            "max_depth": arguments.get("max_depth") or get_setting("crawl.max_depth", 2),
+            "max_nodes": arguments.get("max_nodes") or get_setting("crawl.max_nodes", 500),
+            "concurrency": arguments.get("concurrency") or get_setting("crawl.concurrency", 2),
+            "engine": arguments.get("engine") or get_setting("crawl.engine", "http"),
+            "cache_max_age": arguments.get("cache_max_age")
+        }
+        
+        # Tarama scheduler'da tek iş olarak sayılır
+        scheduler = get_scheduler()
+        wait_for_completion = arguments.get("wait_for_completion", False)
+        try:
+            ticket = scheduler.submit(
+                session_id,
+                caller_id=arguments.get("caller_id") or "default",
+                priority=PRIORITY_INTERACTIVE if wait_for_completion else PRIORITY_BACKGROUND,
+                drivers=scrape_drivers(query["engine"], query["concurrency"])
+            )
+        except QueueFullError as e:
+            remove_session(session_id)
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": str(e)
+            }, ensure_ascii=False))]
+        if not ticket.done():
+            session.status = "queued"
+            session.current_step = "Sırada bekliyor"
+        
+        streamer = ProgressStreamer.for_current_request() if wait_for_completion else None
+        
+        async def on_progress(stats: Dict[str, Any]):
+            if streamer:
+                await streamer.notify({"type": "crawl_progress", **stats}, progress=stats["progress"])
+        
+        crawler = create_network_crawler(session, query, on_progress)
+        crawler.start(seeds, query)
+        job = run_admitted(session_id, ticket, crawler.run)
+        
+        if wait_for_completion:
+            stats = await job
+            response = {
+                "type": "completed",
+                "data": {
+                    "session_id": session_id,
+                    "status": session.status,
+                    "stats": stats,
+                    "unresolved_seeds": unresolved,
+                    "error_message": session.error_message or None,
+                    "files": [f"sessions/{session_id}/nodes.jsonl", f"sessions/{session_id}/edges.jsonl"]
+                }
+            }
+        else:
+            asyncio.create_task(job)
+            response = {
+                "type": "session_started",
+                "data": {
+                    "session_id": session_id,
+                    "message": f"{len(seeds)} seed ile ağ taraması başlatıldı",
+                    "status": "running" if ticket.done() else "queued",
+                    "queue_position": scheduler.position(session_id),
+                    "unresolved_seeds": unresolved,
+                    "check_status_with": f"get_session_status tool'u ile session_id: {session_id} kullanarak durumu kontrol edebilirsiniz"
+                }
+            }
+        return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
+    
     elif name == "get_session_status":
         # Lazy loading
         try:
-            from src.scraper.session_manager import get_session
+            from src.scraper.session_manager import get_session_summary
         except ImportError as e:
             return [types.TextContent(type="text", text=json.dumps({
                 "error": f"Session modülü yüklenemedi: {str(e)}"
             }, ensure_ascii=False))]
         
         session_id = arguments["session_id"]
-        session = get_session(session_id)
+        # Bellekten atılmış session'lar için kayıtlar yüklenmeden özet döner
+        status = get_session_summary(session_id)
         
-        if session:
-            status = session.get_status()
-        else:
+        if status is None:
             status = {"session_id": session_id, "status": "not_found"}
         
+        scheduler = get_scheduler()
+        queue_position = scheduler.position(session_id)
+        if queue_position is not None:
+            status["queue_position"] = queue_position
+        status["scheduler"] = scheduler.stats()
+        
+        try:
+            from src.scraper.profile_cache import get_profile_cache
+            status["profile_cache"] = get_profile_cache().stats()
+        except Exception as e:
+            status["profile_cache"] = {"error": str(e)}
+        
         return [types.TextContent(type="text", text=json.dumps(status, ensure_ascii=False, indent=2))]
     
     elif name == "list_active_sessions":
@@ -228,6 +1215,39 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
         return [types.TextContent(type="text", text=json.dumps(sessions_info, ensure_ascii=False, indent=2))]
     
     elif name == "get_session_results":
+        # Lazy loading
+        try:
+            from src.scraper.session_manager import read_results_page
+            from src.utils.helpers import get_setting
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Session modülü yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        session_id = arguments["session_id"]
+        kind = arguments.get("kind", "all")
+        try:
+            results = read_results_page(
+                session_id,
+                kinds=None if kind == "all" else [kind],
+                offset=max(0, arguments.get("offset") or 0),
+                limit=arguments.get("limit"),
+                cursor=arguments.get("cursor"),
+                fields=arguments.get("fields"),
+                omit_heavy=arguments.get("omit_heavy", False),
+                max_bytes=arguments.get("max_bytes") or get_setting("results.max_response_bytes", 200_000)
+            )
+        except ValueError as e:
+            results = {"session_id": session_id, "error": str(e)}
+        
+        if results is None:
+            results = {"session_id": session_id, "error": "Session bulunamadı"}
+        
+        indent = 2 if arguments.get("pretty") else None
+        separators = None if indent else (",", ":")
+        return [types.TextContent(type="text", text=json.dumps(results, ensure_ascii=False, indent=indent, separators=separators))]
+    
+    elif name == "resume_session":
         # Lazy loading
         try:
             from src.scraper.session_manager import get_session
@@ -238,48 +1258,314 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
         
         session_id = arguments["session_id"]
         session = get_session(session_id)
+        scheduler = get_scheduler()
+        if session is None:
+            error = "Session bulunamadı"
+        elif scheduler.is_scheduled(session_id):
+            error = "Session zaten çalışıyor veya kuyrukta"
+        elif not session.resumable:
+            error = "Session tamamlanmış veya checkpoint'i yok"
+        else:
+            error = None
+        if error:
+            return [types.TextContent(type="text", text=json.dumps({
+                "session_id": session_id, "error": error
+            }, ensure_ascii=False))]
         
-        if session:
-            results = {
-                "session_id": session_id,
-                "profiles": session.profiles,
-                "collaborators": session.collaborators,
-                "status": session.status,
-                "progress": session.progress,
-                "total_profiles": len(session.profiles),
-                "total_collaborators": len(session.collaborators)
+        wait_for_completion = arguments.get("wait_for_completion", False)
+        query = session.checkpoint["query"]
+        crawl = session.checkpoint.get("stage") == "crawl"
+        if crawl:
+            # Motor kaydı olmayan eski taramalar Selenium ile başlamıştı
+            query.setdefault("engine", "selenium")
+        try:
+            ticket = scheduler.submit(
+                session_id,
+                caller_id=arguments.get("caller_id") or "default",
+                priority=PRIORITY_INTERACTIVE if wait_for_completion else PRIORITY_BACKGROUND,
+                drivers=scrape_drivers(query["engine"], query["concurrency"]) if crawl else scrape_drivers(query.get("engine"))
+            )
+        except QueueFullError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": str(e)
+            }, ensure_ascii=False))]
+        
+        # Hata durumu temizlenir; kayıtlar ve checkpoint korunur
+        session.status = "running" if ticket.done() else "queued"
+        session.error_message = ""
+        session.finished_at = None
+        
+        if crawl:
+            # Ağ taraması: düğüm / kenar dosyalarından devam
+            crawler = create_network_crawler(session, query)
+            crawler.load()
+            job = run_admitted(session_id, ticket, crawler.run)
+            checkpoint_info = {
+                "stage": "crawl",
+                "nodes": crawler.stats["nodes"],
+                "edges": crawler.stats["edges"],
+                "expanded": crawler.stats["expanded"]
             }
         else:
-            results = {"session_id": session_id, "error": "Session bulunamadı"}
+            job = run_admitted(session_id, ticket, lambda: run_scraping_background(
+                session_id=session_id,
+                name=query["name"],
+                field_id=query.get("field_id"),
+                specialty_ids=query.get("specialty_ids"),
+                email=query.get("email"),
+                cache_max_age=query.get("cache_max_age"),
+                scraper=create_scraper(query.get("engine")),
+                resume=True
+            ))
+            checkpoint_info = {
+                "stage": session.checkpoint.get("stage"),
+                "page": session.checkpoint.get("page"),
+                "profiles_done": len(session.checkpoint.get("seen_author_ids") or ()),
+                "collaborators_done": len(session.checkpoint.get("completed_indices") or ())
+            }
+        if wait_for_completion:
+            await job
+            response = {
+                "type": "completed",
+                "data": {
+                    "session_id": session_id,
+                    "status": session.status,
+                    "resumed_from": checkpoint_info,
+                    "total_profiles": len(session.profiles),
+                    "total_collaborators": len(session.collaborators),
+                    "crawl": session.crawl,
+                    "error_message": session.error_message or None,
+                    "results_with": f"get_session_results tool'u ile session_id: {session_id}"
+                }
+            }
+        else:
+            asyncio.create_task(job)
+            response = {
+                "type": "session_resumed",
+                "data": {
+                    "session_id": session_id,
+                    "status": session.status,
+                    "queue_position": scheduler.position(session_id),
+                    "resumed_from": checkpoint_info,
+                    "check_status_with": f"get_session_status tool'u ile session_id: {session_id} kullanarak durumu kontrol edebilirsiniz"
+                }
+            }
+        return [types.TextContent(type="text", text=json.dumps(response, ensure_ascii=False))]
+    
+    elif name == "search_local_profiles":
+        # Lazy loading
+        try:
+            from src.scraper.search_index import get_search_index
+            from src.utils.taxonomy import get_taxonomy
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Arama modülü yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        profile_filter = get_taxonomy().compile_filter(arguments.get("field_id"), arguments.get("specialty_ids"))
+        # İlk sorgu tüm session'ları indeksler: event loop'u bloklama
+        result = await asyncio.to_thread(
+            get_search_index().search,
+            arguments["query"],
+            limit=max(1, min(arguments.get("limit") or 20, 200)),
+            offset=max(0, arguments.get("offset") or 0),
+            profile_filter=profile_filter
+        )
+        return [types.TextContent(type="text", text=json.dumps(result, ensure_ascii=False))]
+    
+    elif name == "resolve_profile":
+        # Lazy loading
+        try:
+            from src.scraper.resolution_index import SUMMARY_FIELDS, get_resolution_index
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Çözümleme modülü yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        if not arguments.get("name") and not arguments.get("email"):
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": "name veya email verilmeli"
+            }, ensure_ascii=False))]
         
-        return [types.TextContent(type="text", text=json.dumps(results, ensure_ascii=False, indent=2))]
+        index = get_resolution_index()
+        result = {}
+        if arguments.get("email"):
+            # İlk sorgu tüm session'ları indeksler: event loop'u bloklama
+            known = await asyncio.to_thread(index.lookup_email, arguments["email"])
+            result["email_match"] = known and {
+                key: known.get(key) or "" for key in ("author_id", *SUMMARY_FIELDS, "session_id")
+            }
+        if arguments.get("name"):
+            min_similarity = arguments.get("min_similarity")
+            result["name_matches"] = await asyncio.to_thread(
+                index.fuzzy_names,
+                arguments["name"],
+                limit=max(1, min(arguments.get("limit") or 10, 100)),
+                min_similarity=0.3 if min_similarity is None else max(0.0, min(min_similarity, 1.0))
+            )
+        return [types.TextContent(type="text", text=json.dumps(result, ensure_ascii=False))]
+    
+    elif name in ("graph_shortest_path", "graph_common_neighbors", "graph_neighborhood", "graph_degree_ranking"):
+        # Lazy loading
+        try:
+            from src.scraper.graph_index import get_graph_index
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Grafik modülü yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        # İlk sorguda / session bitince grafik kurulur: event loop'u bloklama
+        graph = await asyncio.to_thread(get_graph_index().graph)
+        
+        def resolve(key: str) -> int:
+            index = graph.resolve(arguments.get(key))
+            if index is None:
+                raise KeyError(f"Grafikte bulunamadı: {arguments.get(key)}")
+            return index
+        
+        try:
+            if name == "graph_shortest_path":
+                path = graph.shortest_path(resolve("source"), resolve("target"),
+                                           max_depth=arguments.get("max_depth") or 6)
+                result = {
+                    "found": path is not None,
+                    "length": len(path) - 1 if path else None,
+                    "path": [graph.describe(i) for i in path or []]
+                }
+            elif name == "graph_common_neighbors":
+                common = graph.common_neighbors(resolve("a"), resolve("b"))
+                result = {"count": len(common), "common_neighbors": [graph.describe(i) for i in common]}
+            elif name == "graph_neighborhood":
+                hops = max(1, min(arguments.get("hops") or 1, 3))
+                nodes = graph.neighborhood(resolve("author"), hops, limit=arguments.get("limit") or 100)
+                result = {
+                    "hops": hops,
+                    "count": len(nodes),
+                    "nodes": [dict(graph.describe(i), distance=distance) for i, distance in nodes]
+                }
+            else:
+                result = {"ranking": [graph.describe(i) for i in graph.top_degree(arguments.get("top") or 20)]}
+        except KeyError as e:
+            result = {"error": e.args[0]}
+        
+        result["graph"] = {"nodes": graph.node_count, "edges": graph.edge_count}
+        return [types.TextContent(type="text", text=json.dumps(result, ensure_ascii=False))]
+    
+    elif name == "manage_query_cache":
+        # Lazy loading
+        try:
+            from src.scraper.query_cache import get_query_cache
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Cache modülü yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        query_cache = get_query_cache()
+        action = arguments.get("action", "stats")
+        if action == "list":
+            result = {"entries": query_cache.list_entries()}
+        elif action == "purge":
+            removed = query_cache.purge(key=arguments.get("key"), name=arguments.get("name"))
+            result = {"removed": removed}
+        else:
+            result = query_cache.stats()
+        
+        return [types.TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+    
+    elif name == "get_metrics":
+        # Lazy loading
+        try:
+            from src.utils.metrics import get_metrics
+        except ImportError as e:
+            return [types.TextContent(type="text", text=json.dumps({
+                "error": f"Metrik modülü yüklenemedi: {str(e)}"
+            }, ensure_ascii=False))]
+        
+        metrics = get_metrics()
+        if arguments.get("format") == "prometheus":
+            text = metrics.prometheus_text()
+        else:
+            text = json.dumps(metrics.snapshot(), ensure_ascii=False, indent=2)
+        if arguments.get("reset"):
+            metrics.reset()
+        return [types.TextContent(type="text", text=text)]
+
+async def refresh_query_cache(cache_key: str, arguments: Dict[str, Any]):
+    """Bayat sorgu cache kaydını arka planda yenile"""
+    from src.scraper.query_cache import get_query_cache
+    from src.scraper.session_manager import create_session
+    
+    query_cache = get_query_cache()
+    session_id = new_session_id()
+    profiles = []
+    collaborators = []
+    scheduler = get_scheduler()
+    ticket = None
+    try:
+        create_session(session_id)
+        ticket = scheduler.submit(session_id, caller_id="query_cache", priority=PRIORITY_BACKGROUND,
+                                  drivers=scrape_drivers(arguments.get("engine")))
+        await wait_for_turn(session_id, ticket)
+        scraper = create_scraper(arguments.get("engine"))
+        async for update in scraper.scrape_profiles_streaming(
+            name=arguments["name"],
+            session_id=session_id,
+            field_id=arguments.get("field_id"),
+            specialty_ids=arguments.get("specialty_ids"),
+            email=arguments.get("email"),
+            cache_max_age=arguments.get("cache_max_age")
+        ):
+            update_type = update.get("type")
+            if update_type in ("profile_added", "email_match"):
+                profiles.append(update["data"]["profile"])
+            elif update_type == "collaborator_added":
+                collaborators.append(update["data"]["collaborator"])
+            elif update_type == "error":
+                return
+        query_cache.store(cache_key, query_from_arguments(arguments), profiles, collaborators, session_id)
+    except Exception as e:
+        print(f"Sorgu cache yenileme hatası: {e}", file=sys.stderr)
+    finally:
+        if ticket is not None and ticket.done() and not ticket.cancelled():
+            scheduler.release(session_id)
+        query_cache.end_refresh(cache_key)
 
 async def run_scraping_background(session_id: str, name: str, field_id: int = None, 
-                                 specialty_ids: List[int] = None, email: str = None):
-    """Background'da scraping çalıştır"""
+                                 specialty_ids: List[int] = None, email: str = None,
+                                 cache_max_age: float = None, scraper=None, resume: bool = False):
+    """Background'da scraping çalıştır (resume=True ise checkpoint'ten devam)"""
     # Lazy loading
     try:
-        from src.scraper.academic_scraper import StreamingAcademicScraper
         from src.scraper.session_manager import get_session
+        if scraper is None:
+            scraper = create_scraper()
     except ImportError as e:
         print(f"Background scraping hatası: {e}", file=sys.stderr)
         return
     
-    scraper = StreamingAcademicScraper()
-    
     try:
         async for update in scraper.scrape_profiles_streaming(
             name=name,
             session_id=session_id,
             field_id=field_id,
             specialty_ids=specialty_ids,
-            email=email
+            email=email,
+            cache_max_age=cache_max_age,
+            resume=resume
         ):
             # Session'a update'i kaydet (real-time için)
             session = get_session(session_id)
             if session:
                 session.last_update = update
                 session.last_update_time = time.time()
+        
+        # Başarılı sonucu sorgu cache'ine yaz
+        session = get_session(session_id)
+        if session and session.status != "error":
+            from src.scraper.query_cache import get_query_cache, make_query_key
+            query = {"name": name, "field_id": field_id, "specialty_ids": specialty_ids, "email": email}
+            get_query_cache().store(make_query_key(**query), query, list(session.profiles),
+                                    list(session.collaborators), session_id)
     
     except Exception as e:
         session = get_session(session_id)
@@ -287,17 +1573,62 @@ async def run_scraping_background(session_id: str, name: str, field_id: int = No
             session.error_message = str(e)
             session.status = "error"
 
+def warm_up_driver_pool():
+    """WebDriver havuzunu önceden ısıt (ayarlarda açıksa)"""
+    try:
+        from src.scraper.driver_pool import get_driver_pool
+        pool = get_driver_pool()
+        if pool.warm_up_enabled:
+            pool.warm_up()
+    except Exception as e:
+        print(f"⚠️ WebDriver havuzu ısıtılamadı: {e}", file=sys.stderr)
+
+def shutdown_driver_pool():
+    """WebDriver havuzunu kapat"""
+    try:
+        from src.scraper.driver_pool import shutdown_driver_pool as _shutdown
+        _shutdown()
+    except ImportError:
+        pass
+
+def shutdown_parser_pool():
+    """Sayfa ayrıştırma havuzunu kapat"""
+    try:
+        from src.scraper.parser_pool import shutdown_parser_pool as _shutdown
+        _shutdown()
+    except ImportError:
+        pass
+
 async def main():
     """MCP Server başlat"""
     # JSON-RPC protokolü için stderr'e print yapmıyoruz
     # stdio transport
     from mcp.server.stdio import stdio_server
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    
+    from src.scraper.session_manager import start_session_reaper, stop_session_reaper
+    from src.utils.metrics import start_metrics_exporter, stop_metrics_exporter
+    
+    # Chrome oturumlarını arka planda hazırla
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(None, warm_up_driver_pool)
+    
+    # Bitmiş session'ları periyodik olarak bellekten at
+    start_session_reaper()
+    # metrics.prometheus_file ayarlıysa metrikler periyodik olarak dosyaya yazılır
+    start_metrics_exporter()
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        stop_session_reaper()
+        stop_metrics_exporter()
+        await asyncio.to_thread(shutdown_driver_pool)
+        shutdown_parser_pool()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -2,112 +2,388 @@
 Akademik scraping logic
 """
 import asyncio
+import functools
 import json
 import sys
 import time
-from typing import Any, Dict, Generator, List, Optional
-from selenium import webdriver
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Generator, List, Optional, Tuple
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
-from ..utils.helpers import load_fields, get_field_name_by_id, get_specialty_name_by_id, parse_labels_and_keywords
-from .session_manager import AcademicScrapingSession
+from .driver_pool import SEARCH_URL, PooledDriver, WebDriverPool, accept_cookie_banner, create_driver
+from .parser_pool import get_parser_pool
+from .parsers import (GRAPH_DATA_SCRIPT, collaborators_from_graph_data, parse_collaborator_graph,
+                      parse_collaborator_page, parse_result_rows)
+from .profile_cache import ProfileCache, get_profile_cache
+from .resolution_index import get_resolution_index
+from ..utils.helpers import extract_author_id, get_setting, parse_labels_and_keywords
+from ..utils.taxonomy import get_taxonomy
+from ..utils.http_client import get_http_client
+from ..utils.metrics import span
+from .session_manager import AcademicScrapingSession, get_or_create_session
 
 
 class StreamingAcademicScraper:
     """Streaming Academic Scraper - Real-time progress updates ile"""
     
-    def __init__(self):
+    ENGINE = "selenium"
+    
+    def __init__(self, driver_pool: Optional[WebDriverPool] = None,
+                 profile_cache: Optional[ProfileCache] = None):
         self.driver = None
+        self.driver_pool = driver_pool
+        self._lease: Optional[PooledDriver] = None
+        # Havuz dışı driver için tek thread'lik executor
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.session = None
-        self.fields_data = load_fields()
+        self.taxonomy = get_taxonomy()
+        self.profile_cache = profile_cache if profile_cache is not None else get_profile_cache()
+        self.cache_max_age: Optional[float] = None
+        # script: alanlar canlı DOM'dan execute_script ile; snapshot: page_source
+        # alınıp havuzda ayrıştırılır, tarayıcı bu sırada sonraki sayfaya geçer
+        self.extraction = get_setting("scraping.extraction", "script")
+        # HTTP ile çekilen işbirlikçi sayfaları için scraping'e ait cookie jar
+        self.http = get_http_client().session()
         
     def setup_driver(self):
-        """WebDriver kurulumu"""
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-web-security")
-        options.add_argument("--allow-running-insecure-content")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-plugins")
-        options.add_argument("--disable-images")
-        options.add_argument("--disable-css")
-        options.add_argument("--disable-background-timer-throttling")
-        options.add_argument("--disable-backgrounding-occluded-windows")
-        options.add_argument("--disable-renderer-backgrounding")
-        options.add_argument("--disable-features=TranslateUI")
-        options.add_argument("--disable-ipc-flooding-protection")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        # Performans optimizasyonu
-        prefs = {
-            "profile.managed_default_content_settings.images": 2,
-            "profile.managed_default_content_settings.stylesheets": 2,
-            "profile.managed_default_content_settings.fonts": 2,
-            "profile.managed_default_content_settings.javascript": 1,  # JavaScript'i açık tut
-        }
-        options.add_experimental_option("prefs", prefs)
-        
-        try:
-            # Windows için özel ChromeDriver kurulumu
-            from webdriver_manager.chrome import ChromeDriverManager
-            import os
-            
-            import sys
-            print("🔧 ChromeDriver kurulumu başlatılıyor...", file=sys.stderr)
-            
-            # Windows için driver path'i ayarla
-            driver_path = ChromeDriverManager().install()
-            print(f"✅ ChromeDriver bulundu: {driver_path}", file=sys.stderr)
+        """WebDriver kurulumu (havuz kullanılmıyorsa)"""
+        self.driver = create_driver()
+    
+    async def _run(self, fn, *args):
+        """Selenium işini driver'a ait tek thread'de çalıştır, event loop'u bloklama"""
+        loop = asyncio.get_running_loop()
+        if self._lease:
+            return await asyncio.wrap_future(self._lease.submit(fn, *args), loop=loop)
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+    
+    async def _acquire_driver(self):
+        """Havuzdan hazır driver al veya yenisini başlat"""
+        with span("driver_startup", self.session):
+            if self.driver_pool:
+                self._lease = await asyncio.to_thread(self.driver_pool.acquire)
+                self.driver = self._lease.driver
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webdriver")
+                await self._run(self.setup_driver)
+    
+    async def _release_driver(self):
+        """Driver'ı havuza iade et veya kapat"""
+        if self._lease:
+            lease = self._lease
+            self.driver = None
+            try:
+                # Sıfırlama da driver'ın kendi thread'inde yapılır
+                await self._run(self.driver_pool.release, lease)
+            finally:
+                self._lease = None
+        elif self.driver:
+            try:
+                await self._run(self.driver.quit)
+                print("✅ WebDriver kapatıldı", file=sys.stderr)
+            except Exception as quit_error:
+                print(f"⚠️ WebDriver kapatma hatası: {quit_error}", file=sys.stderr)
+            self.driver = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _get(self, url: str):
+        """Sayfa yükle (havuz sayaçlarını güncelleyerek)"""
+        if self._lease:
+            self._lease.get(url)
+        else:
+            self.driver.get(url)
+    
+    def _note_navigation(self):
+        """Tıklama ile olan sayfa geçişini havuza bildir"""
+        if self._lease:
+            self._lease.note_navigation()
+    
+    def _open_search_page(self):
+        """Arama sayfasını aç (havuzdan gelen driver zaten hazırsa atla)"""
+        with span("search_page", self.session):
+            if self._lease:
+                if not self._lease.on_search_page:
+                    self._lease.open_search_page()
+                self._lease.on_search_page = False
+                return
             
-            self.driver = webdriver.Chrome(
-                service=Service(driver_path),
-                options=options
+            self.driver.get(SEARCH_URL)
+        with span("cookie_banner", self.session):
+            accept_cookie_banner(self.driver)
+    
+    def _submit_search(self, name: str):
+        """İsmi arat ve Akademisyenler sekmesine geç"""
+        with span("search", self.session):
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.ID, "aramaTerim"))
             )
-            self.driver.set_window_size(1920, 1080)
-            print("✅ Chrome WebDriver başarıyla başlatıldı", file=sys.stderr)
             
+            search_box = self.driver.find_element(By.ID, "aramaTerim")
+            search_box.send_keys(name)
+            self.driver.find_element(By.ID, "searchButton").click()
+            self._note_navigation()
+            
+            # Akademisyenler sekmesine geç
+            WebDriverWait(self.driver, 10).until(
+                EC.element_to_be_clickable((By.LINK_TEXT, "Akademisyenler"))
+            ).click()
+            self._note_navigation()
+    
+    def _read_result_page(self) -> Optional[List[Dict]]:
+        """Sonuç satırlarını bekle ve oku; satır yoksa None"""
+        try:
+            with span("results_wait", self.session):
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "tr[id^='authorInfo_']"))
+                )
+        except:
+            return None
+        with span("row_extraction", self.session):
+            return self._extract_result_rows()
+    
+    def _snapshot_result_page(self) -> Optional[Tuple[str, str]]:
+        """Sonuç satırlarını bekle ve sayfanın HTML'ini al; satır yoksa None"""
+        try:
+            with span("results_wait", self.session):
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "tr[id^='authorInfo_']"))
+                )
+        except:
+            return None
+        with span("page_snapshot", self.session):
+            return self.driver.page_source, self.driver.current_url
+    
+    def _snapshot_page(self, url: str) -> Tuple[str, str]:
+        """Sayfayı yükle ve HTML'ini al"""
+        self._get(url)
+        with span("page_snapshot", self.session):
+            return self.driver.page_source, self.driver.current_url
+    
+    def _parse_in_pool(self, parser, *args) -> "asyncio.Future":
+        """Saf ayrıştırıcıyı havuzda başlat (sonuç beklenmeden döner)"""
+        return asyncio.wrap_future(get_parser_pool().submit(parser, *args))
+    
+    async def _parsed(self, future: "asyncio.Future"):
+        """Havuzdaki ayrıştırmanın sonucunu bekle"""
+        with span("parse_wait", self.session):
+            return await future
+    
+    async def _try_next_page(self) -> bool:
+        """Sonraki sonuç sayfasına geç; hata da son sayfa gibi değerlendirilir"""
+        try:
+            return await self._run(self._go_to_next_page)
         except Exception as e:
-            # Fallback: Selenium'in otomatik driver'ını kullan
-            print(f"❌ ChromeDriverManager hatası: {e}", file=sys.stderr)
-            print("🔄 Selenium otomatik driver kullanılıyor...", file=sys.stderr)
+            print(f"Pagination hatası: {e}", file=sys.stderr)
+            return False
+    
+    async def _iter_result_pages(self, page_num: int) -> AsyncIterator[List[Dict]]:
+        """Sonuç sayfalarının profil satırlarını sırayla üret
+        
+        Sonraki sayfa istendiğinde önceki sayfa bitmiş sayılır ve checkpoint
+        ilerletilir. Snapshot modunda sayfa HTML'i havuzda ayrıştırılırken
+        tarayıcı sonraki sayfaya geçmiş olur.
+        """
+        if self.extraction != "snapshot":
+            while True:
+                # Sayfadaki tüm satırlar tek round-trip ile
+                profile_rows = await self._run(self._read_result_page)
+                if not profile_rows:
+                    return
+                yield profile_rows
+                if not await self._try_next_page():
+                    return
+                page_num += 1
+                self.session.update_checkpoint(page=page_num)
+                # Sayfa değişimi için bekle (hızlandırıldı)
+                await asyncio.sleep(0.3)
+        
+        snapshot = await self._run(self._snapshot_result_page)
+        while snapshot:
+            parsing = self._parse_in_pool(parse_result_rows, *snapshot, 1)
+            has_next = await self._try_next_page()
+            if has_next:
+                await asyncio.sleep(0.3)
+            profile_rows = await self._parsed(parsing)
+            if not profile_rows:
+                return
+            yield profile_rows
+            if not has_next:
+                return
+            page_num += 1
+            self.session.update_checkpoint(page=page_num)
+            snapshot = await self._run(self._snapshot_result_page)
+    
+    def _go_to_next_page(self) -> bool:
+        """Pagination'da sonraki sayfaya tıkla; son sayfadaysa False"""
+        with span("pagination", self.session):
+            pagination = self.driver.find_element(By.CSS_SELECTOR, "ul.pagination")
+            active_li = pagination.find_element(By.CSS_SELECTOR, "li.active")
+            all_lis = pagination.find_elements(By.TAG_NAME, "li")
+            active_index = all_lis.index(active_li)
+            
+            if active_index == len(all_lis) - 1:
+                return False
             
-            try:
-                self.driver = webdriver.Chrome(options=options)
-                self.driver.set_window_size(1920, 1080)
-                print("✅ Selenium otomatik driver başarıyla başlatıldı", file=sys.stderr)
-            except Exception as fallback_error:
-                error_msg = f"Chrome WebDriver başlatılamadı: {fallback_error}"
-                print(f"❌ {error_msg}", file=sys.stderr)
-                raise Exception(error_msg)
+            next_li = all_lis[active_index + 1]
+            next_a = next_li.find_element(By.TAG_NAME, "a")
+            next_a.click()
+            self._note_navigation()
+            return True
+    
+    def _start_checkpoint(self, resume: bool, name: str, field_id: Optional[int],
+                          specialty_ids: Optional[List[int]], email: Optional[str],
+                          cache_max_age: Optional[float]) -> Dict:
+        """Yeni checkpoint başlat veya devam edilecek olanı döndür"""
+        if resume and self.session.resumable:
+            return self.session.checkpoint
+        self.session.start_checkpoint({
+            "name": name,
+            "field_id": field_id,
+            "specialty_ids": specialty_ids,
+            "email": email,
+            "cache_max_age": cache_max_age,
+            "engine": self.ENGINE,
+        })
+        return self.session.checkpoint
+    
+    def _resuming_collaborators(self, checkpoint: Dict) -> bool:
+        """Checkpoint işbirlikçi aşamasında mı (arama tekrar yapılmaz)"""
+        return checkpoint.get("stage") == "collaborators" and bool(checkpoint.get("target_profile"))
     
+    def _already_seen(self, profile_data: Dict) -> bool:
+        """Profil bu session'da daha önce kaydedildi mi"""
+        author_id = extract_author_id(profile_data.get('url'))
+        return bool(author_id) and author_id in self.session.checkpoint.get("seen_author_ids", ())
+    
+    def _checkpoint_profile(self, profile_data: Dict, profile_count: int):
+        """Kaydedilen profili checkpoint'e işle"""
+        author_id = extract_author_id(profile_data.get('url'))
+        if author_id and self.session.checkpoint:
+            self.session.checkpoint["seen_author_ids"].add(author_id)
+        self.session.update_checkpoint(profile_count=profile_count)
+    
+    def _finish_checkpoint(self):
+        """Hata yoksa checkpoint'i tamamlandı olarak işaretle"""
+        if self.session.status != "error":
+            self.session.update_checkpoint(urgent=True, stage="done")
+    
+    def _fail(self, message: str):
+        """Session'ı hata durumuna al (checkpoint devam için korunur)"""
+        self.session.error_message = message
+        self.session.status = "error"
+
+    async def _resolve_known_email(self, email: Optional[str], field_id: Optional[int],
+                                   specialty_ids: Optional[List[int]]) -> Optional[Dict]:
+        """Email daha önce görüldüyse profil kaydını döndür (arama sayfaları atlanır)
+
+        cache_max_age=0 canlı veri istendiği için indeks kullanılmaz.
+        """
+        if not email or self.cache_max_age == 0:
+            return None
+        try:
+            known = await asyncio.to_thread(get_resolution_index().lookup_email, email)
+        except Exception as e:
+            print(f"⚠️ Çözümleme indeksi okunamadı: {e}", file=sys.stderr)
+            return None
+        if known is None:
+            return None
+        profile_data = self._cache_get(known["author_id"], "profile")
+        if profile_data is None:
+            if known["kind"] == "profiles":
+                profile_data = {key: value for key, value in known.items()
+                                if key not in ("author_id", "kind", "session_id")}
+            elif known.get("deleted"):
+                return None
+            else:
+                profile_data = self._profile_from_collaborator(known)
+        if not self._filter_profile(profile_data, field_id, specialty_ids):
+            return None
+        return dict(profile_data)
+
+    @staticmethod
+    def _profile_from_collaborator(collab: Dict) -> Dict:
+        """İşbirlikçi kaydını arama sonucu profil şemasına çevir
+
+        İşbirlikçide 'info' yalnızca bölüm satırıdır; profilde bu 'header' olur.
+        """
+        title = collab.get("title") or collab["name"]
+        header = collab.get("info") or ''
+        return {
+            "name": collab["name"],
+            "title": title,
+            "url": collab["url"],
+            "info": f"{title}\n\n{header}" if header else title,
+            "header": header,
+            "green_label": collab.get("green_label") or '',
+            "blue_label": collab.get("blue_label") or '',
+            "email": collab.get("email") or '',
+            "photoUrl": collab.get("photoUrl") or "/default_photo.jpg"
+        }
+
+    async def _scrape_known_profile(self, profile_data: Dict) -> AsyncIterator[Dict]:
+        """İndeksten bulunan profil: doğrudan işbirlikçilere geç"""
+        profile_data["id"] = 1
+        self.session.add_profile(profile_data)
+        self._checkpoint_profile(profile_data, 1)
+
+        yield {"type": "email_match", "data": {
+            "profile": profile_data,
+            "message": f"Email eşleşmesi bulundu (yerel indeks): {profile_data['name']}",
+            "source": "index"
+        }}
+
+        async for collab_update in self.scrape_collaborators_with_driver(profile_data):
+            yield collab_update
+        self._finish_checkpoint()
+
     async def scrape_profiles_streaming(self, name: str, session_id: str, 
                                       field_id: Optional[int] = None,
                                       specialty_ids: Optional[List[int]] = None,
-                                      email: Optional[str] = None) -> Generator[Dict, None, None]:
+                                      email: Optional[str] = None,
+                                      cache_max_age: Optional[float] = None,
+                                      resume: bool = False,
+                                      session: Optional[AcademicScrapingSession] = None) -> Generator[Dict, None, None]:
         """
         Ana profil scraping işlemi - streaming progress updates ile
+        
+        resume=True ise session'ın checkpoint'inden devam edilir: görülen
+        profiller atlanır, işbirlikçi aşamasında arama hiç yapılmaz.
+        session verilirse kayıt defterindeki session yerine o kullanılır.
         """
         
-        self.session = AcademicScrapingSession(session_id)
+        self.session = session or get_or_create_session(session_id)
+        self.cache_max_age = cache_max_age
+        interrupted = False
         
         try:
+            checkpoint = self._start_checkpoint(resume, name, field_id, specialty_ids, email, cache_max_age)
+            if self._resuming_collaborators(checkpoint):
+                async for collab_update in self._scrape_collaborators_streaming(checkpoint["target_profile"]):
+                    yield collab_update
+                self._finish_checkpoint()
+                return
+            
+            # Bilinen email: sonuç sayfaları hiç dolaşılmaz
+            known_profile = await self._resolve_known_email(email, field_id, specialty_ids)
+            if known_profile:
+                async for update in self._scrape_known_profile(known_profile):
+                    yield update
+                return
+            
             # Progress: 5% - WebDriver kurulumu
             self.session.update_progress(5, "WebDriver başlatılıyor...")
             yield {"type": "progress", "data": {"progress": 5, "step": "WebDriver başlatılıyor..."}}
             
             try:
-                self.setup_driver()
+                await self._acquire_driver()
                 print(f"✅ WebDriver başarıyla başlatıldı", file=sys.stderr)
             except Exception as driver_error:
                 error_msg = f"WebDriver başlatma hatası: {str(driver_error)}"
                 print(f"❌ {error_msg}", file=sys.stderr)
+                self._fail(error_msg)
                 yield {"type": "error", "data": {"message": error_msg, "session_id": session_id}}
                 return
             
@@ -115,73 +391,51 @@ class StreamingAcademicScraper:
             self.session.update_progress(10, "YÖK Akademik sitesine bağlanılıyor...")
             yield {"type": "progress", "data": {"progress": 10, "step": "YÖK sitesine bağlanılıyor..."}}
             
-            self.driver.get("https://akademik.yok.gov.tr/AkademikArama/")
-            
-            # Çerez onayı
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'Tümünü Kabul Et')]"))
-                ).click()
-            except:
-                pass
+            # Arama sayfası ve çerez onayı
+            await self._run(self._open_search_page)
             
             # Progress: 15% - Arama yapılıyor
             self.session.update_progress(15, f"'{name}' için arama yapılıyor...")
             yield {"type": "progress", "data": {"progress": 15, "step": f"'{name}' için arama yapılıyor..."}}
             
             # Arama
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "aramaTerim"))
-            )
-            
-            search_box = self.driver.find_element(By.ID, "aramaTerim")
-            search_box.send_keys(name)
-            self.driver.find_element(By.ID, "searchButton").click()
-            
-            # Akademisyenler sekmesine geç
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.LINK_TEXT, "Akademisyenler"))
-            ).click()
+            await self._run(self._submit_search, name)
             
             # Progress: 20% - Profiller yükleniyor
             self.session.update_progress(20, "Profil listesi yükleniyor...")
             yield {"type": "progress", "data": {"progress": 20, "step": "Profil listesi yükleniyor..."}}
             
             # Profilleri çek - daha hızlı
-            profile_count = 0
+            profile_count = checkpoint.get("profile_count", 0)
             page_num = 1
-            progress_step = 70 / 50  # Sadece ilk 50 profil için (daha hızlı)
             
-            while profile_count < 50:  # 100 yerine 50 profil (daha hızlı)
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "tr[id^='authorInfo_']"))
-                    )
-                except:
+            # Devam: checkpoint'teki sonuç sayfasına kadar ilerle
+            while page_num < checkpoint.get("page", 1):
+                if not await self._run(self._go_to_next_page):
                     break
-                
-                profile_rows = self.driver.find_elements(By.CSS_SELECTOR, "tr[id^='authorInfo_']")
-                
-                if not profile_rows:
-                    break
-                
-                for i, row in enumerate(profile_rows):
+                page_num += 1
+                await asyncio.sleep(0.3)
+            progress_step = 70 / 50  # Sadece ilk 50 profil için (daha hızlı)
+            profile_filter = self.taxonomy.compile_filter(field_id, specialty_ids)
+            
+            # 100 yerine 50 profil (daha hızlı)
+            async for profile_rows in self._iter_result_pages(page_num):
+                for profile_data in profile_rows:
                     if profile_count >= 50:  # 50 profil limiti
                         break
                     
                     try:
-                        # Profil bilgilerini çek
-                        profile_data = self._extract_profile_data(row, profile_count + 1)
+                        profile_data["id"] = profile_count + 1
                         
-                        # Filtreleme (field_id, specialty_ids)
-                        if field_id or specialty_ids:
-                            if not self._filter_profile(profile_data, field_id, specialty_ids):
-                                continue
+                        # Filtreleme (field_id, specialty_ids) - tek küme araması
+                        if not profile_filter.matches(profile_data) or self._already_seen(profile_data):
+                            continue
                         
                         # Email kontrolü
                         if email and profile_data.get('email', '').lower() == email.lower():
                             # Email eşleşmesi bulundu!
                             self.session.add_profile(profile_data)
+                            self._cache_put(profile_data, "profile")
                             
                             yield {"type": "email_match", "data": {
                                 "profile": profile_data,
@@ -192,16 +446,20 @@ class StreamingAcademicScraper:
                             async for collab_update in self._scrape_collaborators_streaming(profile_data):
                                 yield collab_update
                             
+                            self._finish_checkpoint()
                             return
                         
                         self.session.add_profile(profile_data)
+                        self._cache_put(profile_data, "profile")
                         profile_count += 1
+                        self._checkpoint_profile(profile_data, profile_count)
                         
                         # Progress güncelle
                         current_progress = 20 + (profile_count * progress_step)
                         self.session.update_progress(
                             int(current_progress), 
-                            f"Profil {profile_count}/50 işlendi: {profile_data['name']}"
+                            f"Profil {profile_count}/50 işlendi: {profile_data['name']}",
+                            stage=False
                         )
                         
                         # Her profil için update gönder
@@ -218,52 +476,44 @@ class StreamingAcademicScraper:
                         print(f"Profil işlenirken hata: {e}", file=sys.stderr)
                         continue
                 
-                # Pagination
-                try:
-                    pagination = self.driver.find_element(By.CSS_SELECTOR, "ul.pagination")
-                    active_li = pagination.find_element(By.CSS_SELECTOR, "li.active")
-                    all_lis = pagination.find_elements(By.TAG_NAME, "li")
-                    active_index = all_lis.index(active_li)
-                    
-                    if active_index == len(all_lis) - 1:
-                        break
-                    
-                    next_li = all_lis[active_index + 1]
-                    next_a = next_li.find_element(By.TAG_NAME, "a")
-                    next_a.click()
-                    page_num += 1
-                    
-                    # Sayfa değişimi için bekle (hızlandırıldı)
-                    await asyncio.sleep(0.3)
-                    
-                except Exception as e:
-                    print(f"Pagination hatası: {e}", file=sys.stderr)
+                if profile_count >= 50:
                     break
             
             # Progress: 90% - Scraping tamamlandı
             self.session.update_progress(90, "Profil scraping tamamlandı")
             yield {"type": "progress", "data": {"progress": 90, "step": "Profil scraping tamamlandı"}}
+            self._finish_checkpoint()
             
         except Exception as e:
-            self.session.error_message = str(e)
-            self.session.status = "error"
+            self._fail(str(e))
             yield {"type": "error", "data": {"message": str(e)}}
+        
+        except (GeneratorExit, asyncio.CancelledError):
+            # Tüketici akışı kapattı: checkpoint devam için korunur
+            interrupted = True
+            self._fail("Scraping yarıda kesildi")
+            raise
             
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    print("✅ WebDriver kapatıldı", file=sys.stderr)
-                except Exception as quit_error:
-                    print(f"⚠️ WebDriver kapatma hatası: {quit_error}", file=sys.stderr)
+            await self._release_driver()
             
             # Final progress
-            self.session.update_progress(100, "İşlem tamamlandı")
-            yield {"type": "completed", "data": {
-                "session_id": session_id,
-                "profiles_count": len(self.session.profiles),
-                "collaborators_count": len(self.session.collaborators)
-            }}
+            self.session.finalize()
+            self.session.update_progress(100, "Scraping yarıda kesildi" if interrupted else "İşlem tamamlandı")
+            if not interrupted:
+                yield {"type": "completed", "data": {
+                    "session_id": session_id,
+                    "profiles_count": len(self.session.profiles),
+                    "collaborators_count": len(self.session.collaborators)
+                }}
+    
+    async def scrape_collaborators_with_driver(self, profile_data: Dict) -> Generator[Dict, None, None]:
+        """Sadece işbirlikçi scraping - gerekirse kendi driver'ını alıp bırakır (HTTP motoru için fallback)"""
+        try:
+            async for update in self._scrape_collaborators_streaming(profile_data):
+                yield update
+        finally:
+            await self._release_driver()
     
     async def _scrape_collaborators_streaming(self, profile_data: Dict) -> Generator[Dict, None, None]:
         """İşbirlikçi scraping - streaming"""
@@ -272,65 +522,307 @@ class StreamingAcademicScraper:
             self.session.update_progress(50, f"{profile_data['name']} için işbirlikçiler çekiliyor...")
             yield {"type": "progress", "data": {"progress": 50, "step": "İşbirlikçiler çekiliyor..."}}
             
-            # Profil sayfasına git
-            self.driver.get(profile_data['url'])
-            
-            # İşbirlikçiler sekmesine geç
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[@href='viewAuthorGraphs.jsp']"))
-            ).click()
-            
-            # SVG yüklenene kadar bekle
-            WebDriverWait(self.driver, 10).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, "svg g")) > 2
-            )
-            
-            # JavaScript ile işbirlikçileri çek
-            script = """
-            const gs = document.querySelectorAll('svg g');
-            const results = [];
-            for (let i = 2; i < gs.length; i++) {
-                const name = gs[i].querySelector('text')?.textContent.trim() || '';
-                gs[i].dispatchEvent(new MouseEvent('click', { bubbles: true }));
-                const href = document.getElementById('pageUrl')?.href || '';
-                results.push({ name, href });
-            }
-            return results;
-            """
-            
-            collaborators_data = self.driver.execute_script(script)
-            
-            # Her işbirlikçi için detay çek
-            for i, collab in enumerate(collaborators_data):
+            checkpoint = self.session.checkpoint
+            if self._resuming_collaborators(checkpoint) and checkpoint.get("collaborators") is not None:
+                # Devam: grafik checkpoint'te, tamamlanan detaylar atlanır
+                collaborators_data = checkpoint["collaborators"]
+            else:
+                collaborators_data = await self.fetch_collaborator_graph(profile_data)
+                
+                # scraping.max_collaborators sınırı
+                max_collaborators = get_setting("scraping.max_collaborators")
+                if max_collaborators:
+                    collaborators_data = collaborators_data[:max_collaborators]
+                
+                self.session.update_checkpoint(
+                    urgent=True,
+                    stage="collaborators",
+                    target_profile=profile_data,
+                    collaborators=collaborators_data,
+                    completed_indices=set()
+                )
+            
+            completed_indices = self.session.checkpoint.get("completed_indices", set())
+            
+            # Detay sayfaları sınırlı eşzamanlılıkla çekilir, tamamlanma sırasıyla gelir
+            total = len([c for c in collaborators_data if c['href']])
+            completed = len(completed_indices)
+            source_author_id = extract_author_id(profile_data['url'])
+            async for index, collab_detail in self._iter_collaborator_details(collaborators_data, skip=completed_indices):
+                # Grafik indeksi için kenarın kaynağı (ve grafik verisinde varsa ağırlığı)
+                collab_detail["source_author_id"] = source_author_id
+                if collaborators_data[index].get("weight") is not None:
+                    collab_detail["weight"] = collaborators_data[index]["weight"]
+                self.session.add_collaborator(collab_detail)
+                completed += 1
+                completed_indices.add(index)
+                self.session.update_checkpoint()
+                
+                # Progress update
+                collab_progress = 50 + (completed / total) * 40
+                self.session.update_progress(
+                    int(collab_progress),
+                    f"İşbirlikçi {completed}/{total}: {collab_detail['name']}",
+                    stage=False
+                )
+                
+                yield {"type": "collaborator_added", "data": {
+                    "collaborator": collab_detail,
+                    "count": completed,
+                    "index": index + 1,
+                    "total": total,
+                    "progress": int(collab_progress)
+                }}
+                    
+        except Exception as e:
+            self._fail(f"İşbirlikçi scraping hatası: {e}")
+            yield {"type": "error", "data": {"message": f"İşbirlikçi scraping hatası: {e}"}}
+    
+    async def fetch_collaborator_graph(self, profile_data: Dict) -> List[Dict]:
+        """İşbirlikçi (isim, link) listesi - grafik cache'te varsa profil sayfasına hiç gidilmez"""
+        cached_graph = self._cache_get(extract_author_id(profile_data['url']), "graph")
+        if cached_graph is not None:
+            return cached_graph["collaborators"]
+        return await self._load_collaborator_graph(profile_data)
+    
+    async def close(self):
+        """Scraper'ın tuttuğu driver'ı bırak (akış dışı kullanım için)"""
+        await self._release_driver()
+    
+    async def _load_collaborator_graph(self, profile_data: Dict) -> List[Dict]:
+        """Profilin işbirlikçi grafiğinden (isim, link) listesini çek"""
+        if self.driver is None:
+            await self._acquire_driver()
+        
+        with span("collaborator_graph", self.session):
+            collaborators_data = await self._run(self._read_collaborator_graph, profile_data['url'])
+        self._cache_put({"url": profile_data['url'], "collaborators": collaborators_data}, "graph")
+        return collaborators_data
+    
+    def _read_collaborator_graph(self, profile_url: str) -> List[Dict]:
+        """Profil sayfasındaki SVG grafiğinden işbirlikçileri oku"""
+        # Profil sayfasına git
+        self._get(profile_url)
+        
+        # İşbirlikçiler sekmesine geç
+        WebDriverWait(self.driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, "//a[@href='viewAuthorGraphs.jsp']"))
+        ).click()
+        self._note_navigation()
+        
+        # SVG yüklenene kadar bekle
+        WebDriverWait(self.driver, 10).until(
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, "svg g")) > 2
+        )
+        
+        # Önce grafiğin kendi verisi tek seferde: d3 düğüm verisi, yoksa gömülü script verisi
+        page_url = self.driver.current_url
+        data = self.driver.execute_script(GRAPH_DATA_SCRIPT)
+        collaborators = None
+        if data:
+            collaborators = collaborators_from_graph_data(data.get("nodes"), data.get("links"), page_url, profile_url)
+        if collaborators is None:
+            collaborators = parse_collaborator_graph(self.driver.page_source, page_url, profile_url)
+        if collaborators is not None:
+            return collaborators
+        
+        # Geri dönüş: her düğüme tıklayıp #pageUrl'i oku
+        return self.driver.execute_script(self.GRAPH_CLICK_SCRIPT)
+    
+    # Düğüm başına sentetik tıklama ile linkleri okuyan eski yöntem (yedek)
+    GRAPH_CLICK_SCRIPT = """
+    const gs = document.querySelectorAll('svg g');
+    const results = [];
+    for (let i = 2; i < gs.length; i++) {
+        const name = gs[i].querySelector('text')?.textContent.trim() || '';
+        gs[i].dispatchEvent(new MouseEvent('click', { bubbles: true }));
+        const href = document.getElementById('pageUrl')?.href || '';
+        results.push({ name, href });
+    }
+    return results;
+    """
+    
+    def _cache_get(self, author_id: Optional[str], kind: str) -> Optional[Dict]:
+        """Cache'e bak ve session sayaçlarını güncelle"""
+        if self.profile_cache is None or not author_id or self.cache_max_age == 0:
+            return None
+        cached = self.profile_cache.get(author_id, kind, max_age=self.cache_max_age)
+        if self.session:
+            if cached is None:
+                self.session.cache_misses += 1
+            else:
+                self.session.cache_hits += 1
+        return cached
+    
+    def _cache_put(self, record: Dict, kind: str):
+        """Kaydı authorId ile cache'e yaz"""
+        if self.profile_cache is None:
+            return
+        try:
+            self.profile_cache.put(extract_author_id(record.get('url')), record, kind)
+        except Exception as e:
+            print(f"⚠️ Profil cache'e yazılamadı: {e}", file=sys.stderr)
+    
+    def _visit_collaborator(self, collab: Dict, collab_id: int) -> Dict:
+        """İşbirlikçi sayfasını driver ile açıp ayrıştır"""
+        with span("collaborator_detail", self.session):
+            self._get(collab['href'])
+            return self._extract_collaborator_data(collab, collab_id)
+    
+    def _fetch_collaborator_detail(self, collab: Dict, collab_id: int) -> Dict:
+        """İşbirlikçi detay sayfasını HTTP ile çek ve ayrıştır"""
+        with span("collaborator_detail", self.session):
+            response = self.http.get(collab['href'])
+            return parse_collaborator_page(response.text, collab, collab_id, response.url)
+    
+    async def _iter_collaborator_details(self, collaborators_data: List[Dict],
+                                         skip: Optional[set] = None) -> AsyncIterator[Tuple[int, Dict]]:
+        """İşbirlikçi detaylarını (orijinal index, detay) olarak tamamlanma sırasıyla üret"""
+        # Önce cache'teki kayıtlar, kalanlar için sayfa ziyareti
+        pending = []
+        for i, collab in enumerate(collaborators_data):
+            if not collab['href'] or (skip and i in skip):
+                continue
+            cached = self._cache_get(extract_author_id(collab['href']), "collaborator")
+            if cached is not None:
+                cached["id"] = i + 1
+                yield i, cached
+            else:
+                pending.append((i, collab))
+        
+        fetcher = get_setting("scraping.collaborator_fetcher", "http")
+        
+        if fetcher != "http":
+            # Tek driver ile sıralı gezinme
+            if pending and self.driver is None:
+                await self._acquire_driver()
+            if self.extraction == "snapshot":
+                async for item in self._iter_collaborator_snapshots(pending):
+                    yield item
+                return
+            for i, collab in pending:
                 try:
-                    if collab['href']:
-                        self.driver.get(collab['href'])
-                        
-                        # Detay bilgileri çek
-                        collab_detail = self._extract_collaborator_data(collab, i + 1)
-                        self.session.add_collaborator(collab_detail)
-                        
-                        # Progress update
-                        collab_progress = 50 + ((i + 1) / len(collaborators_data)) * 40
-                        self.session.update_progress(
-                            int(collab_progress),
-                            f"İşbirlikçi {i + 1}/{len(collaborators_data)}: {collab['name']}"
-                        )
-                        
-                        yield {"type": "collaborator_added", "data": {
-                            "collaborator": collab_detail,
-                            "count": i + 1,
-                            "total": len(collaborators_data),
-                            "progress": int(collab_progress)
-                        }}
-                        
-                        await asyncio.sleep(0.1)
-                        
+                    collab_detail = await self._run(self._visit_collaborator, collab, i + 1)
+                    if not collab_detail.get("deleted"):
+                        self._cache_put(collab_detail, "collaborator")
+                    yield i, collab_detail
                 except Exception as e:
                     print(f"İşbirlikçi detayı çekilirken hata: {e}", file=sys.stderr)
-                    
+            return
+        
+        concurrency = max(1, get_setting("scraping.collaborator_concurrency", 6))
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(i: int, collab: Dict) -> Tuple[int, Dict]:
+            async with semaphore:
+                collab_detail = await asyncio.to_thread(self._fetch_collaborator_detail, collab, i + 1)
+                if not collab_detail.get("deleted"):
+                    self._cache_put(collab_detail, "collaborator")
+                return i, collab_detail
+        
+        tasks = [asyncio.create_task(fetch(i, collab)) for i, collab in pending]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except Exception as e:
+                    print(f"İşbirlikçi detayı çekilirken hata: {e}", file=sys.stderr)
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _iter_collaborator_snapshots(self, pending: List[Tuple[int, Dict]]) -> AsyncIterator[Tuple[int, Dict]]:
+        """Driver sonraki işbirlikçi sayfasını yüklerken önceki sayfa havuzda ayrıştırılır"""
+        parsing = None
+        for i, collab in pending + [(None, None)]:
+            current = None
+            if collab is not None:
+                try:
+                    page_html, page_url = await self._run(self._snapshot_page, collab['href'])
+                    current = (i, self._parse_in_pool(parse_collaborator_page, page_html, collab, i + 1, page_url))
+                except Exception as e:
+                    print(f"İşbirlikçi detayı çekilirken hata: {e}", file=sys.stderr)
+            if parsing is not None:
+                index, future = parsing
+                try:
+                    collab_detail = await self._parsed(future)
+                    if not collab_detail.get("deleted"):
+                        self._cache_put(collab_detail, "collaborator")
+                    yield index, collab_detail
+                except Exception as e:
+                    print(f"İşbirlikçi detayı çekilirken hata: {e}", file=sys.stderr)
+            parsing = current
+    
+    # Sonuç sayfasındaki tüm satırları tek execute_script ile okuyan script
+    RESULT_ROWS_SCRIPT = """
+    const rows = document.querySelectorAll("tr[id^='authorInfo_']");
+    return Array.from(rows).map(row => {
+        const infoTd = Array.from(row.children).find(
+            el => el.tagName === 'TD' && el.querySelector(':scope > h6'));
+        const link = row.querySelector('a');
+        const img = row.querySelector('img');
+        if (!infoTd || !link || !img) return null;
+        const labels = infoTd.querySelectorAll('a.anahtarKelime');
+        const mail = row.querySelector("a[href^='mailto']");
+        return {
+            name: link.innerText.trim(),
+            url: link.href,
+            info: infoTd.innerText.trim(),
+            photoUrl: img.src,
+            green_label: labels.length > 0 ? labels[0].innerText.trim() : '',
+            blue_label: labels.length > 1 ? labels[1].innerText.trim() : '',
+            email: mail ? mail.innerText.trim().replace('[at]', '@') : ''
+        };
+    });
+    """
+    
+    # İşbirlikçi detay sayfasını tek execute_script ile okuyan script
+    COLLABORATOR_PAGE_SCRIPT = """
+    const td = Array.from(document.querySelectorAll('td')).find(
+        el => el.querySelector(':scope > h6'));
+    if (!td) return null;
+    const green = td.querySelector('span.label-success');
+    const blue = td.querySelector('span.label-primary');
+    const mail = td.querySelector("a[href^='mailto']");
+    const img = document.querySelector('img.img-circle, img#imgPicture');
+    return {
+        info: td.innerText,
+        green_label: green ? green.innerText.trim() : '',
+        blue_label: blue ? blue.innerText.trim() : '',
+        email: mail ? mail.innerText.trim().replace('[at]', '@') : '',
+        photoUrl: img ? img.src : null
+    };
+    """
+    
+    def _extract_result_rows(self) -> List[Dict]:
+        """Mevcut sonuç sayfasındaki tüm profilleri tek round-trip ile çıkar"""
+        try:
+            raw_rows = self.driver.execute_script(self.RESULT_ROWS_SCRIPT)
         except Exception as e:
-            yield {"type": "error", "data": {"message": f"İşbirlikçi scraping hatası: {e}"}}
+            print(f"Toplu satır okuma hatası, satır satır okunuyor: {e}", file=sys.stderr)
+            rows = self.driver.find_elements(By.CSS_SELECTOR, "tr[id^='authorInfo_']")
+            profiles = [self._extract_profile_data(row, i + 1) for i, row in enumerate(rows)]
+            return [profile for profile in profiles if profile]
+        
+        profiles = []
+        for raw in raw_rows or []:
+            if not raw:
+                continue
+            info = raw["info"]
+            info_lines = info.splitlines()
+            profiles.append({
+                "id": len(profiles) + 1,
+                "name": raw["name"],
+                "title": info_lines[0].strip() if len(info_lines) > 0 else raw["name"],
+                "url": raw["url"],
+                "info": info,
+                "header": info_lines[2].strip() if len(info_lines) > 2 else '',
+                "green_label": raw["green_label"],
+                "blue_label": raw["blue_label"],
+                "email": raw["email"],
+                "photoUrl": raw["photoUrl"] or "/default_photo.jpg"
+            })
+        return profiles
     
     def _extract_profile_data(self, row, profile_id: int) -> Dict:
         """Profil verilerini çıkar"""
@@ -395,53 +887,26 @@ class StreamingAcademicScraper:
                 result["photoUrl"] = "/default_photo.jpg"
                 return result
             
-            # Detay sayfasından bilgi çek
-            tds = self.driver.find_elements(By.XPATH, "//td[h6]")
+            # Detay sayfasından tüm alanlar tek round-trip ile
+            page = self.driver.execute_script(self.COLLABORATOR_PAGE_SCRIPT)
             
-            if not tds:
+            if not page:
                 result["deleted"] = True
                 result["photoUrl"] = "/default_photo.jpg"
                 return result
             
-            info = tds[0].text
-            info_lines = info.splitlines()
+            info_lines = page["info"].splitlines()
             
             result.update({
                 "title": info_lines[0].strip() if len(info_lines) > 0 else collab_data['name'],
                 "info": info_lines[2].strip() if len(info_lines) > 2 else '',
-                "green_label": '',
-                "blue_label": '',
+                "green_label": page["green_label"],
+                "blue_label": page["blue_label"],
                 "keywords": '',
-                "email": ''
+                "email": page["email"],
+                "photoUrl": page["photoUrl"] or "/default_photo.jpg"
             })
             
-            # Labels ve keywords
-            try:
-                green_span = tds[0].find_element(By.CSS_SELECTOR, 'span.label-success')
-                result["green_label"] = green_span.text.strip()
-            except:
-                pass
-            
-            try:
-                blue_span = tds[0].find_element(By.CSS_SELECTOR, 'span.label-primary')
-                result["blue_label"] = blue_span.text.strip()
-            except:
-                pass
-            
-            # Email
-            try:
-                email_link = tds[0].find_element(By.CSS_SELECTOR, "a[href^='mailto']")
-                result["email"] = email_link.text.strip().replace('[at]', '@')
-            except:
-                pass
-            
-            # Foto
-            try:
-                img = self.driver.find_element(By.CSS_SELECTOR, "img.img-circle, img#imgPicture")
-                result["photoUrl"] = img.get_attribute("src")
-            except:
-                result["photoUrl"] = "/default_photo.jpg"
-            
             return result
             
         except Exception as e:
@@ -450,22 +915,4 @@ class StreamingAcademicScraper:
     
     def _filter_profile(self, profile: Dict, field_id: Optional[int], specialty_ids: Optional[List[int]]) -> bool:
         """Profil filtreleme"""
-        if not field_id and not specialty_ids:
-            return True
-        
-        # Field ID kontrolü
-        if field_id:
-            field_name = get_field_name_by_id(self.fields_data, field_id)
-            if field_name and profile.get('green_label') != field_name:
-                return False
-        
-        # Specialty ID kontrolü
-        if specialty_ids and field_id:
-            profile_specialty = profile.get('blue_label', '')
-            for specialty_id in specialty_ids:
-                specialty_name = get_specialty_name_by_id(self.fields_data, field_id, specialty_id)
-                if specialty_name and profile_specialty == specialty_name:
-                    return True
-            return False
-        
-        return True 
\ No newline at end of file
+        return self.taxonomy.compile_filter(field_id, specialty_ids).matches(profile)
@@ -0,0 +1,193 @@
+"""
+Toplu akademisyen araması - paylaşılan kaynaklar ve authorId tekilleştirme
+"""
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .query_cache import get_query_cache, make_query_key
+from .session_manager import AcademicScrapingSession
+from ..utils.helpers import extract_author_id
+
+
+def record_key(record: Dict) -> Optional[str]:
+    """Tekilleştirme anahtarı: authorId, yoksa URL"""
+    return extract_author_id(record.get('url')) or record.get('url') or None
+
+
+class BatchScrapeRunner:
+    """Birden çok sorguyu sınırlı paralellikle tek bir batch session'a topla
+
+    Her worker kendi scraper'ını (ve böylece havuzdan aldığı driver'ı veya
+    paylaşılan HTTP bağlantılarını) sırayla birden çok sorgu için kullanır.
+    Sorgu başına kayıtlar batch dizinindeki queries/qNNNN altında tutulur;
+    batch session'a yalnızca daha önce görülmemiş authorId'ler eklenir.
+    """
+
+    def __init__(self, session: AcademicScrapingSession, queries: List[Dict],
+                 scraper_factory: Callable[[], Any], concurrency: int = 2,
+                 cache_max_age: Optional[float] = None,
+                 on_query_done: Optional[Callable[[Dict], Awaitable[None]]] = None):
+        self.session = session
+        self.queries = queries
+        self.scraper_factory = scraper_factory
+        self.concurrency = max(1, min(concurrency, len(queries) or 1))
+        self.cache_max_age = cache_max_age
+        self.on_query_done = on_query_done
+        self.queries_dir = session.base_dir / "queries"
+        self._seen_profiles = set()
+        self._seen_collaborators = set()
+        self._started = time.time()
+        self.stats: Dict[str, Any] = {
+            "total_queries": len(queries),
+            "completed_queries": 0,
+            "failed_queries": 0,
+            "cache_hits": 0,
+            "unique_profiles": 0,
+            "duplicate_profiles": 0,
+            "unique_collaborators": 0,
+            "duplicate_collaborators": 0,
+            "concurrency": self.concurrency,
+            "elapsed": 0.0,
+            "queries_per_min": 0.0,
+            "profiles_per_sec": 0.0,
+        }
+        session.batch = self.stats
+
+    async def _scrape(self, scraper, index: int, query: Dict) -> Dict:
+        """Tek sorguyu çalıştır (önce sorgu cache'i)"""
+        query_cache = get_query_cache()
+        key = make_query_key(query["name"], query.get("field_id"),
+                             query.get("specialty_ids"), query.get("email"))
+        if self.cache_max_age != 0:
+            entry, _ = query_cache.lookup(key, max_age=self.cache_max_age)
+            if entry:
+                return {"source": "cache", "profiles": entry["profiles"],
+                        "collaborators": entry["collaborators"], "error": None}
+
+        child = AcademicScrapingSession(f"q{index:04d}", sessions_dir=self.queries_dir)
+        profiles: List[Dict] = []
+        collaborators: List[Dict] = []
+        error = None
+        async for update in scraper.scrape_profiles_streaming(
+            name=query["name"],
+            session_id=child.session_id,
+            field_id=query.get("field_id"),
+            specialty_ids=query.get("specialty_ids"),
+            email=query.get("email"),
+            cache_max_age=self.cache_max_age,
+            session=child
+        ):
+            update_type = update.get("type")
+            if update_type in ("profile_added", "email_match"):
+                profiles.append(update["data"]["profile"])
+            elif update_type == "collaborator_added":
+                collaborators.append(update["data"]["collaborator"])
+            elif update_type == "error":
+                error = update["data"]["message"]
+
+        if error is None:
+            query_cache.store(key, query, profiles, collaborators, self.session.session_id)
+        return {"source": "scrape", "profiles": profiles, "collaborators": collaborators, "error": error}
+
+    def _merge(self, index: int, records: List[Dict], kind: str) -> int:
+        """Yeni kayıtları batch session'a ekle, eklenen sayısını döndür"""
+        seen = self._seen_profiles if kind == "profiles" else self._seen_collaborators
+        added = 0
+        for record in records:
+            key = record_key(record)
+            if key is not None and key in seen:
+                self.stats[f"duplicate_{kind}"] += 1
+                continue
+            if key is not None:
+                seen.add(key)
+            record = dict(record, query_index=index)
+            if kind == "profiles":
+                self.session.add_profile(record)
+            else:
+                self.session.add_collaborator(record)
+            self.stats[f"unique_{kind}"] += 1
+            added += 1
+        return added
+
+    def _update_rates(self):
+        elapsed = max(time.time() - self._started, 1e-6)
+        done = self.stats["completed_queries"] + self.stats["failed_queries"]
+        self.stats["elapsed"] = round(elapsed, 2)
+        self.stats["queries_per_min"] = round(done / elapsed * 60, 2)
+        self.stats["profiles_per_sec"] = round(self.stats["unique_profiles"] / elapsed, 3)
+        return done
+
+    def _log_query(self, summary: Dict):
+        """Sorgu özetini batch dizinindeki queries.jsonl'a ekle"""
+        with open(self.session.base_dir / "queries.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary, ensure_ascii=False))
+            f.write("\n")
+
+    async def _worker(self, queue: "asyncio.Queue"):
+        scraper = self.scraper_factory()
+        while True:
+            try:
+                index, query = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.time()
+            try:
+                result = await self._scrape(scraper, index, query)
+            except Exception as e:
+                result = {"source": "scrape", "profiles": [], "collaborators": [], "error": str(e)}
+
+            new_profiles = self._merge(index, result["profiles"], "profiles")
+            new_collaborators = self._merge(index, result["collaborators"], "collaborators")
+            if result["error"]:
+                self.stats["failed_queries"] += 1
+            else:
+                self.stats["completed_queries"] += 1
+            if result["source"] == "cache":
+                self.stats["cache_hits"] += 1
+            done = self._update_rates()
+
+            summary = {
+                "query_index": index,
+                "query": query,
+                "status": "error" if result["error"] else "completed",
+                "source": result["source"],
+                "profiles": len(result["profiles"]),
+                "new_profiles": new_profiles,
+                "collaborators": len(result["collaborators"]),
+                "new_collaborators": new_collaborators,
+                "author_ids": [key for key in map(record_key, result["profiles"]) if key],
+                "elapsed": round(time.time() - started, 2),
+                "error": result["error"],
+            }
+            self._log_query(summary)
+            self.session.update_progress(
+                int(done / len(self.queries) * 99),
+                f"Sorgu {done}/{len(self.queries)}: {query['name']}",
+                stage=False
+            )
+            if self.on_query_done:
+                try:
+                    await self.on_query_done(summary)
+                except Exception as e:
+                    print(f"⚠️ Batch bildirimi gönderilemedi: {e}", file=sys.stderr)
+
+    async def run(self) -> Dict:
+        """Tüm sorguları çalıştır, batch istatistiklerini döndür"""
+        self._started = time.time()
+        self.session.update_progress(1, f"{len(self.queries)} sorgu başlatılıyor...")
+        queue: "asyncio.Queue" = asyncio.Queue()
+        for index, query in enumerate(self.queries):
+            queue.put_nowait((index, query))
+        try:
+            await asyncio.gather(*(self._worker(queue) for _ in range(self.concurrency)))
+        except Exception as e:
+            self.session.error_message = str(e)
+            self.session.status = "error"
+        finally:
+            self._update_rates()
+            self.session.finalize()
+            self.session.update_progress(100, "Toplu arama tamamlandı")
+        return self.stats
@@ -0,0 +1,365 @@
+"""
+WebDriver havuzu - önceden başlatılmış Chrome oturumları
+"""
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from ..utils.helpers import get_setting, process_tree_rss_mb, yok_base_url
+
+# Benchmark'larda yerel YÖK sunucusuna yönlendirilebilir (YOK_BASE_URL)
+BASE_URL = yok_base_url()
+SEARCH_URL = BASE_URL + "AkademikArama/"
+
+DEFAULT_CHROME_ARGS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-images",
+    "--disable-css",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+]
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# ChromeDriverManager().install() process başına bir kez çağrılır
+_driver_path = None
+_driver_path_resolved = False
+_driver_path_lock = threading.Lock()
+
+
+def _resolve_driver_path() -> Optional[str]:
+    """ChromeDriver yolunu bul (cache'li)"""
+    global _driver_path, _driver_path_resolved
+    with _driver_path_lock:
+        if not _driver_path_resolved:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                print("🔧 ChromeDriver kurulumu başlatılıyor...", file=sys.stderr)
+                _driver_path = ChromeDriverManager().install()
+                print(f"✅ ChromeDriver bulundu: {_driver_path}", file=sys.stderr)
+            except Exception as e:
+                print(f"❌ ChromeDriverManager hatası: {e}", file=sys.stderr)
+                _driver_path = None
+            _driver_path_resolved = True
+        return _driver_path
+
+
+def build_chrome_options() -> webdriver.ChromeOptions:
+    """settings.json'daki webdriver ayarlarıyla ChromeOptions oluştur"""
+    options = webdriver.ChromeOptions()
+    args = list(DEFAULT_CHROME_ARGS)
+    if not get_setting("webdriver.headless", True):
+        args.remove("--headless=new")
+    for arg in get_setting("webdriver.chrome_options", []):
+        if arg not in args:
+            args.append(arg)
+    for arg in args:
+        options.add_argument(arg)
+    options.add_argument(f"user-agent={get_setting('webdriver.user_agent', DEFAULT_USER_AGENT)}")
+
+    # Performans optimizasyonu
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.javascript": 1,  # JavaScript'i açık tut
+    }
+    options.add_experimental_option("prefs", prefs)
+    return options
+
+
+def create_driver() -> webdriver.Chrome:
+    """Yeni Chrome WebDriver başlat"""
+    options = build_chrome_options()
+    width = get_setting("webdriver.window_size.width", 1920)
+    height = get_setting("webdriver.window_size.height", 1080)
+
+    driver_path = _resolve_driver_path()
+    if driver_path:
+        try:
+            driver = webdriver.Chrome(service=Service(driver_path), options=options)
+            driver.set_window_size(width, height)
+            print("✅ Chrome WebDriver başarıyla başlatıldı", file=sys.stderr)
+            return driver
+        except Exception as e:
+            print(f"❌ ChromeDriver başlatılamadı: {e}", file=sys.stderr)
+
+    # Fallback: Selenium'in otomatik driver'ını kullan
+    print("🔄 Selenium otomatik driver kullanılıyor...", file=sys.stderr)
+    try:
+        driver = webdriver.Chrome(options=options)
+        driver.set_window_size(width, height)
+        print("✅ Selenium otomatik driver başarıyla başlatıldı", file=sys.stderr)
+        return driver
+    except Exception as fallback_error:
+        error_msg = f"Chrome WebDriver başlatılamadı: {fallback_error}"
+        print(f"❌ {error_msg}", file=sys.stderr)
+        raise Exception(error_msg)
+
+
+def accept_cookie_banner(driver, timeout: float = 5) -> bool:
+    """Çerez onayı (varsa)"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'Tümünü Kabul Et')]"))
+        ).click()
+        return True
+    except Exception:
+        return False
+
+
+class PooledDriver:
+    """Havuzdaki tek bir Chrome oturumu"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.created_at = time.time()
+        self.pages_loaded = 0
+        self.cookies_accepted = False
+        self.on_search_page = False
+        # Bu driver'a yapılan tüm Selenium çağrıları tek bir thread'de sıralanır
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webdriver")
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Driver'a ait thread'de çalıştır"""
+        return self.executor.submit(fn, *args)
+
+    def get(self, url: str):
+        """Sayfa yükle ve sayaçları güncelle"""
+        self.on_search_page = False
+        self.driver.get(url)
+        self.pages_loaded += 1
+
+    def note_navigation(self):
+        """Tıklama ile olan sayfa geçişlerini say"""
+        self.on_search_page = False
+        self.pages_loaded += 1
+
+    def open_search_page(self):
+        """AkademikArama sayfasını aç, çerez banner'ını bir kez onayla"""
+        self.get(SEARCH_URL)
+        if not self.cookies_accepted:
+            accept_cookie_banner(self.driver)
+            self.cookies_accepted = True
+        self.on_search_page = True
+
+    def rss_mb(self) -> Optional[float]:
+        """Chrome process ağacının RSS değeri (MB)"""
+        try:
+            return process_tree_rss_mb(self.driver.service.process.pid)
+        except Exception:
+            return None
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as quit_error:
+            print(f"⚠️ WebDriver kapatma hatası: {quit_error}", file=sys.stderr)
+        # Kendi thread'inden çağrılabileceği için beklemeden kapat
+        self.executor.shutdown(wait=False)
+
+
+def configured_pool_size() -> int:
+    """Ayarlardaki havuz boyutu (session.max_sessions ile sınırlı)"""
+    size = get_setting("webdriver.pool.size", 2)
+    max_sessions = get_setting("session.max_sessions")
+    if max_sessions:
+        size = min(size, max_sessions)
+    return size
+
+
+class WebDriverPool:
+    """Önceden ısıtılmış Chrome WebDriver havuzu"""
+
+    def __init__(self, size: int = 2, warm_up: bool = True, acquire_timeout: float = 120,
+                 max_pages_per_driver: int = 200, max_rss_mb: Optional[float] = 1024):
+        self.size = max(1, size)
+        self.warm_up_enabled = warm_up
+        self.acquire_timeout = acquire_timeout
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_rss_mb = max_rss_mb
+        self._idle: List[PooledDriver] = []
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.recycled_count = 0
+
+    @classmethod
+    def from_settings(cls) -> "WebDriverPool":
+        """config/settings.json'dan havuz oluştur"""
+        return cls(
+            size=configured_pool_size(),
+            warm_up=get_setting("webdriver.pool.warm_up", True),
+            acquire_timeout=get_setting("webdriver.pool.acquire_timeout", 120),
+            max_pages_per_driver=get_setting("webdriver.pool.max_pages_per_driver", 200),
+            max_rss_mb=get_setting("webdriver.pool.max_rss_mb", 1024),
+        )
+
+    def _launch(self) -> PooledDriver:
+        """Yeni driver başlat ve arama sayfasında hazır beklet"""
+        pooled = PooledDriver(create_driver())
+        try:
+            pooled.open_search_page()
+        except Exception as e:
+            print(f"⚠️ Driver ısıtma hatası: {e}", file=sys.stderr)
+        return pooled
+
+    def _spawn_one(self) -> bool:
+        """Kapasite varsa bir driver başlatıp boşta listesine ekle"""
+        with self._cond:
+            if self._closed or self._total >= self.size:
+                return False
+            self._total += 1
+        try:
+            pooled = self._launch()
+        except Exception as e:
+            print(f"❌ Havuz driver'ı başlatılamadı: {e}", file=sys.stderr)
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            return False
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+                pooled.quit()
+                return False
+            self._idle.append(pooled)
+            self._cond.notify()
+        return True
+
+    def warm_up(self):
+        """Havuzu önceden doldur"""
+        while self._spawn_one():
+            pass
+
+    def _refill_async(self):
+        if self.warm_up_enabled:
+            threading.Thread(target=self._spawn_one, name="driver-pool-refill", daemon=True).start()
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """Havuzdan driver al (gerekirse yenisini başlat veya bekle)"""
+        deadline = time.time() + (timeout if timeout is not None else self.acquire_timeout)
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WebDriver havuzu kapatıldı")
+                if self._idle:
+                    return self._idle.pop()
+                if self._total < self.size:
+                    self._total += 1
+                    break
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError("WebDriver havuzundan driver alınamadı (zaman aşımı)")
+                self._cond.wait(remaining)
+        try:
+            return self._launch()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    def _needs_recycle(self, pooled: PooledDriver) -> bool:
+        if self.max_pages_per_driver and pooled.pages_loaded >= self.max_pages_per_driver:
+            return True
+        if self.max_rss_mb:
+            rss = pooled.rss_mb()
+            if rss is not None and rss >= self.max_rss_mb:
+                return True
+        return False
+
+    def release(self, pooled: PooledDriver, discard: bool = False):
+        """Driver'ı sıfırlayıp havuza geri ver (veya yenile)"""
+        if not discard and not self._closed and not self._needs_recycle(pooled):
+            try:
+                # Fazladan açılan sekmeleri kapat, arama sayfasına dön
+                handles = pooled.driver.window_handles
+                for handle in handles[1:]:
+                    pooled.driver.switch_to.window(handle)
+                    pooled.driver.close()
+                pooled.driver.switch_to.window(handles[0])
+                pooled.open_search_page()
+            except Exception as e:
+                print(f"⚠️ Driver sıfırlanamadı, yenileniyor: {e}", file=sys.stderr)
+                discard = True
+        else:
+            discard = True
+
+        if discard:
+            pooled.quit()
+            with self._cond:
+                self._total -= 1
+                self.recycled_count += 1
+                self._cond.notify()
+            self._refill_async()
+            return
+
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+                pooled.quit()
+                return
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    def shutdown(self):
+        """Tüm driver'ları kapat"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            pooled.quit()
+
+    def stats(self) -> Dict:
+        """Havuz durumu"""
+        with self._cond:
+            return {
+                "size": self.size,
+                "total": self._total,
+                "idle": len(self._idle),
+                "in_use": self._total - len(self._idle),
+                "recycled": self.recycled_count,
+            }
+
+
+# Global havuz (MCP server tarafından sahiplenilir)
+_driver_pool: Optional[WebDriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> WebDriverPool:
+    """Process genelindeki WebDriver havuzunu getir"""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = WebDriverPool.from_settings()
+        return _driver_pool
+
+
+def shutdown_driver_pool():
+    """Global havuzu kapat"""
+    global _driver_pool
+    with _driver_pool_lock:
+        pool, _driver_pool = _driver_pool, None
+    if pool:
+        pool.shutdown()
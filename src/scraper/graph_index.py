@@ -0,0 +1,303 @@
+"""
+Toplanan işbirliği verisi üzerinde bellek içi grafik indeksi (CSR)
+"""
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .network_crawler import EDGES_FILE, NODES_FILE, iter_jsonl
+from .session_manager import (SESSIONS_DIR, AcademicScrapingSession, add_finish_listener,
+                              iter_session_records, read_checkpoint, session_dirs)
+from ..utils.helpers import extract_author_id
+
+
+def read_session_edges(session_dir: Path) -> Tuple[List[Tuple[str, str]], Dict[str, str]]:
+    """Bir session dizinindeki (authorId, authorId) kenarları ve isimler
+
+    Ağ taramalarında edges.jsonl / nodes.jsonl, normal aramalarda hedef
+    profil ile işbirlikçileri arasındaki kenarlar kullanılır. Kaynağı
+    kayıtta olmayan eski işbirlikçiler için checkpoint'teki hedef profile
+    bakılır.
+    """
+    edges: List[Tuple[str, str]] = []
+    names: Dict[str, str] = {}
+    session_id, parent_dir = session_dir.name, session_dir.parent
+
+    for node in iter_jsonl(session_dir / NODES_FILE):
+        if node.get("name"):
+            names[node["author_id"]] = node["name"]
+    for edge in iter_jsonl(session_dir / EDGES_FILE):
+        edges.append((edge["source"], edge["target"]))
+
+    for profile in iter_session_records(session_id, "profiles", parent_dir):
+        author_id = extract_author_id(profile.get("url"))
+        if author_id and profile.get("name"):
+            names.setdefault(author_id, profile["name"])
+
+    fallback_source = None
+    target_profile = read_checkpoint(session_id, parent_dir).get("target_profile")
+    if target_profile:
+        fallback_source = extract_author_id(target_profile.get("url"))
+        if fallback_source and target_profile.get("name"):
+            names.setdefault(fallback_source, target_profile["name"])
+
+    for collaborator in iter_session_records(session_id, "collaborators", parent_dir):
+        target = extract_author_id(collaborator.get("url"))
+        source = collaborator.get("source_author_id") or fallback_source
+        if not target or not source or target == source:
+            continue
+        edges.append((source, target))
+        if collaborator.get("name"):
+            names.setdefault(target, collaborator["name"])
+    return edges, names
+
+
+class CollaborationGraph:
+    """Değişmez, yönsüz grafik - komşuluklar CSR (offsets + targets) dizilerinde
+
+    Düğüm i'nin komşuları targets[offsets[i]:offsets[i + 1]] aralığında
+    sıralı olarak durur. authorId'ler 0..n-1 tamsayılarına çevrilir.
+    """
+
+    def __init__(self, ids: List[str], names: List[str], edges: Set[Tuple[int, int]]):
+        n = len(ids)
+        degree = array("i", [0]) * n
+        for u, v in edges:
+            degree[u] += 1
+            degree[v] += 1
+
+        offsets = array("l", [0]) * (n + 1)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + degree[i]
+        targets = array("i", [0]) * offsets[n]
+        cursor = offsets[:n]
+        for u, v in edges:
+            targets[cursor[u]] = v
+            cursor[u] += 1
+            targets[cursor[v]] = u
+            cursor[v] += 1
+        for i in range(n):
+            start, end = offsets[i], offsets[i + 1]
+            if end - start > 1:
+                targets[start:end] = array("i", sorted(targets[start:end]))
+
+        self.ids = ids
+        self.names = names
+        self.index = {author_id: i for i, author_id in enumerate(ids)}
+        self.offsets = offsets
+        self.targets = targets
+        # Derece sıralaması bir kez hesaplanır: top-k sorguları O(k)
+        self.by_degree = array("i", sorted(range(n), key=lambda i: (-degree[i], ids[i])))
+        self.built_at = time.time()
+
+    @property
+    def node_count(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets) // 2
+
+    def resolve(self, node: Optional[str]) -> Optional[int]:
+        """authorId veya profil URL'inden düğüm index'i"""
+        if not node:
+            return None
+        return self.index.get(extract_author_id(node) or node.strip())
+
+    def neighbors(self, i: int) -> array:
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def describe(self, i: int) -> Dict:
+        return {"author_id": self.ids[i], "name": self.names[i], "degree": self.degree(i)}
+
+    def shortest_path(self, source: int, target: int, max_depth: int = 6) -> Optional[List[int]]:
+        """İki yönlü BFS ile en kısa yol (düğüm index'leri); yoksa None"""
+        if source == target:
+            return [source]
+        offsets, targets = self.offsets, self.targets
+        parents = [{source: -1}, {target: -1}]
+        distances = [{source: 0}, {target: 0}]
+        frontiers = [[source], [target]]
+        depth = 0
+        while frontiers[0] and frontiers[1] and depth < max_depth:
+            # Küçük taraftan bir seviye genişlet
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            mine, other = parents[side], parents[1 - side]
+            mine_distance, other_distance = distances[side], distances[1 - side]
+            meet, meet_distance = None, None
+            next_frontier = []
+            for u in frontiers[side]:
+                distance = mine_distance[u] + 1
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    if v in mine:
+                        continue
+                    mine[v] = u
+                    mine_distance[v] = distance
+                    if v in other:
+                        # Seviye içinde karşı tarafa en yakın buluşma noktası seçilir
+                        if meet is None or other_distance[v] < meet_distance:
+                            meet, meet_distance = v, other_distance[v]
+                    next_frontier.append(v)
+            if meet is not None:
+                return self._join(parents, meet)
+            frontiers[side] = next_frontier
+            depth += 1
+        return None
+
+    @staticmethod
+    def _join(parents: List[Dict[int, int]], meet: int) -> List[int]:
+        path = []
+        node = meet
+        while node != -1:
+            path.append(node)
+            node = parents[0][node]
+        path.reverse()
+        node = parents[1][meet]
+        while node != -1:
+            path.append(node)
+            node = parents[1][node]
+        return path
+
+    def common_neighbors(self, a: int, b: int) -> List[int]:
+        """Sıralı komşu listelerinin kesişimi"""
+        left, right = self.neighbors(a), self.neighbors(b)
+        if len(left) > len(right):
+            left, right = right, left
+        members = set(right)
+        return [v for v in left if v in members]
+
+    def neighborhood(self, source: int, hops: int = 1, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """k adım içindeki düğümler: (index, uzaklık), BFS sırasıyla"""
+        offsets, targets = self.offsets, self.targets
+        seen = {source}
+        result = []
+        queue = deque([(source, 0)])
+        while queue:
+            u, distance = queue.popleft()
+            if distance == hops:
+                continue
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if v in seen:
+                    continue
+                seen.add(v)
+                result.append((v, distance + 1))
+                if limit is not None and len(result) >= limit:
+                    return result
+                queue.append((v, distance + 1))
+        return result
+
+    def top_degree(self, top: int = 20) -> List[int]:
+        return list(self.by_degree[:top])
+
+
+class GraphIndex:
+    """Tüm session verisinden grafiği kuran ve güncel tutan indeks
+
+    Session başına kenar kümesi tutulur; biten session'lar dinleyici ile
+    işaretlenir ve bir sonraki sorguda yalnızca onlar yeniden okunur.
+    CSR dizileri değişiklik varsa tüm kenarlardan tekrar kurulur.
+    """
+
+    def __init__(self, sessions_dir: Path = SESSIONS_DIR):
+        self.sessions_dir = sessions_dir
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._session_edges: Dict[str, Set[Tuple[int, int]]] = {}
+        self._pending: Set[Path] = set()
+        self._scanned = False
+        self._graph: Optional[CollaborationGraph] = None
+        self._lock = threading.Lock()
+        self.rebuilds = 0
+        self.last_build_seconds = 0.0
+
+    def _intern(self, author_id: str, name: Optional[str] = None) -> int:
+        i = self._index.get(author_id)
+        if i is None:
+            i = len(self._ids)
+            self._index[author_id] = i
+            self._ids.append(author_id)
+            self._names.append(name or "")
+        elif name and not self._names[i]:
+            self._names[i] = name
+        return i
+
+    def _ingest(self, session_dir: Path):
+        """Session dizinini (yeniden) oku ve kenar kümesini değiştir"""
+        try:
+            edges, names = read_session_edges(session_dir)
+        except Exception as e:
+            print(f"⚠️ {session_dir.name} grafiğe eklenemedi: {e}", file=sys.stderr)
+            return
+        interned = set()
+        for source, target in edges:
+            u = self._intern(source, names.get(source))
+            v = self._intern(target, names.get(target))
+            if u != v:
+                interned.add((u, v) if u < v else (v, u))
+        for author_id, name in names.items():
+            self._intern(author_id, name)
+        key = str(session_dir)
+        if interned or key in self._session_edges:
+            self._session_edges[key] = interned
+            self._graph = None
+
+    def mark_dirty(self, session: AcademicScrapingSession):
+        """Biten session'ı sonraki sorguda yeniden okunmak üzere işaretle"""
+        with self._lock:
+            self._pending.add(session.base_dir)
+
+    def graph(self) -> CollaborationGraph:
+        """Güncel grafik (gerekirse bekleyen session'ları okuyup yeniden kur)"""
+        with self._lock:
+            if not self._scanned:
+                for session_dir in session_dirs(self.sessions_dir):
+                    self._ingest(session_dir)
+                self._scanned = True
+                self._pending.clear()
+            elif self._pending:
+                pending, self._pending = self._pending, set()
+                for session_dir in pending:
+                    self._ingest(session_dir)
+
+            if self._graph is None:
+                started = time.perf_counter()
+                edges: Set[Tuple[int, int]] = set()
+                for session_edges in self._session_edges.values():
+                    edges |= session_edges
+                self._graph = CollaborationGraph(list(self._ids), list(self._names), edges)
+                self.last_build_seconds = round(time.perf_counter() - started, 4)
+                self.rebuilds += 1
+            return self._graph
+
+    def stats(self) -> Dict:
+        graph = self.graph()
+        return {
+            "nodes": graph.node_count,
+            "edges": graph.edge_count,
+            "sessions": len(self._session_edges),
+            "rebuilds": self.rebuilds,
+            "last_build_seconds": self.last_build_seconds,
+            "built_at": graph.built_at,
+        }
+
+
+_graph_index: Optional[GraphIndex] = None
+_graph_index_lock = threading.Lock()
+
+
+def get_graph_index() -> GraphIndex:
+    """Process genelindeki grafik indeksini getir (session bitişlerini dinler)"""
+    global _graph_index
+    with _graph_index_lock:
+        if _graph_index is None:
+            _graph_index = GraphIndex()
+            add_finish_listener(_graph_index.mark_dirty)
+        return _graph_index
@@ -0,0 +1,238 @@
+"""
+Tarayıcısız (HTTP) akademik scraping motoru
+"""
+import asyncio
+import sys
+from typing import Dict, Generator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from .academic_scraper import StreamingAcademicScraper
+from .driver_pool import SEARCH_URL, WebDriverPool
+from .profile_cache import ProfileCache
+from .parsers import (find_link_by_text, find_next_page_url, parse_collaborator_graph, parse_result_rows,
+                      parse_search_form)
+from .session_manager import AcademicScrapingSession, get_or_create_session
+from ..utils.http_client import KeepAliveHttpClient, get_http_client
+from ..utils.metrics import span
+
+
+class HttpAcademicScraper(StreamingAcademicScraper):
+    """HTTP + lxml ile çalışan scraper - işbirlikçi grafiği için Selenium fallback"""
+    
+    ENGINE = "http"
+
+    def __init__(self, driver_pool: Optional[WebDriverPool] = None,
+                 http_client: Optional[KeepAliveHttpClient] = None,
+                 profile_cache: Optional[ProfileCache] = None):
+        super().__init__(driver_pool=driver_pool, profile_cache=profile_cache)
+        # Scraping başına ayrı sunucu oturumu (cookie jar), bağlantılar ortak
+        self.http = (http_client or get_http_client()).session()
+
+    def _fetch_result_page(self, url: str, start_id: int) -> Tuple[List[Dict], Optional[str]]:
+        """Sonuç sayfasını indir, satırları ve sonraki sayfa URL'ini döndür"""
+        with span("result_page", self.session):
+            response = self.http.get(url)
+        with span("row_extraction", self.session):
+            page_html = response.text
+            return (parse_result_rows(page_html, response.url, start_id),
+                    find_next_page_url(page_html, response.url))
+
+    def _fetch_collaborator_graph(self, profile_url: str) -> Optional[List[Dict]]:
+        """Grafik sayfasını HTTP ile çek; veri sayfaya gömülü değilse None
+
+        Site grafiği oturumda son açılan profile göre verdiği için merkez
+        düğümü profille eşleşmeyen grafikler kabul edilmez.
+        """
+        profile_page = self.http.get(profile_url)
+        graph_page = self.http.get(urljoin(profile_page.url, "viewAuthorGraphs.jsp"))
+        return parse_collaborator_graph(graph_page.text, graph_page.url, profile_url, require_center=True)
+
+    async def _load_collaborator_graph(self, profile_data: Dict) -> List[Dict]:
+        """İşbirlikçi grafiği önce tarayıcısız, olmazsa Selenium ile"""
+        try:
+            with span("collaborator_graph", self.session):
+                collaborators_data = await asyncio.to_thread(self._fetch_collaborator_graph, profile_data['url'])
+        except Exception as e:
+            print(f"⚠️ Grafik HTTP ile alınamadı: {e}", file=sys.stderr)
+            collaborators_data = None
+        if collaborators_data is None:
+            return await super()._load_collaborator_graph(profile_data)
+        self._cache_put({"url": profile_data['url'], "collaborators": collaborators_data}, "graph")
+        return collaborators_data
+
+    def _open_results(self, name: str) -> str:
+        """Arama formunu gönder ve Akademisyenler sekmesinin URL'ini döndür"""
+        with span("search_page", self.session):
+            search_page = self.http.get(SEARCH_URL)
+            form = parse_search_form(search_page.text, search_page.url)
+        if not form:
+            raise Exception("Arama formu (aramaTerim) bulunamadı")
+
+        fields = dict(form["fields"])
+        fields[form["term_field"]] = name
+        with span("search", self.session):
+            if form["method"] == "POST":
+                results = self.http.post(form["action"], data=fields)
+            else:
+                results = self.http.get(form["action"], params=fields)
+            authors_url = find_link_by_text(results.text, "Akademisyenler", results.url)
+        if not authors_url:
+            raise Exception("'Akademisyenler' sekmesi bulunamadı")
+        return authors_url
+
+    def _seek_result_page(self, name: str, page: int) -> Tuple[str, int]:
+        """Aramayı yeniden aç ve sonraki sayfa linkleriyle checkpoint sayfasına ilerle
+
+        Sayfalama durumu sunucu oturumunda tutulduğu için kayıtlı bir sayfa
+        URL'i yeni cookie jar'da aynı sayfayı vermeyebilir.
+        """
+        page_url = self._open_results(name)
+        page_num = 1
+        while page_num < page:
+            with span("result_page", self.session):
+                response = self.http.get(page_url)
+            next_url = find_next_page_url(response.text, response.url)
+            if not next_url:
+                break
+            page_url = next_url
+            page_num += 1
+        return page_url, page_num
+
+    async def scrape_profiles_streaming(self, name: str, session_id: str,
+                                      field_id: Optional[int] = None,
+                                      specialty_ids: Optional[List[int]] = None,
+                                      email: Optional[str] = None,
+                                      cache_max_age: Optional[float] = None,
+                                      resume: bool = False,
+                                      session: Optional[AcademicScrapingSession] = None) -> Generator[Dict, None, None]:
+        """
+        HTTP ile profil scraping - StreamingAcademicScraper ile aynı update akışı
+        """
+
+        self.session = session or get_or_create_session(session_id)
+        self.cache_max_age = cache_max_age
+        interrupted = False
+
+        try:
+            checkpoint = self._start_checkpoint(resume, name, field_id, specialty_ids, email, cache_max_age)
+            if self._resuming_collaborators(checkpoint):
+                async for collab_update in self.scrape_collaborators_with_driver(checkpoint["target_profile"]):
+                    yield collab_update
+                self._finish_checkpoint()
+                return
+
+            # Bilinen email: sonuç sayfaları hiç dolaşılmaz
+            known_profile = await self._resolve_known_email(email, field_id, specialty_ids)
+            if known_profile:
+                async for update in self._scrape_known_profile(known_profile):
+                    yield update
+                return
+
+            # Progress: 10% - YÖK sitesine giriş
+            self.session.update_progress(10, "YÖK Akademik sitesine bağlanılıyor...")
+            yield {"type": "progress", "data": {"progress": 10, "step": "YÖK sitesine bağlanılıyor..."}}
+
+            # Progress: 15% - Arama yapılıyor
+            self.session.update_progress(15, f"'{name}' için arama yapılıyor...")
+            yield {"type": "progress", "data": {"progress": 15, "step": f"'{name}' için arama yapılıyor..."}}
+
+            # Devam: aramadan checkpoint'teki sonuç sayfasına kadar ilerle
+            page_url, page_num = await asyncio.to_thread(self._seek_result_page, name, checkpoint.get("page", 1))
+
+            # Progress: 20% - Profiller yükleniyor
+            self.session.update_progress(20, "Profil listesi yükleniyor...")
+            yield {"type": "progress", "data": {"progress": 20, "step": "Profil listesi yükleniyor..."}}
+
+            profile_count = checkpoint.get("profile_count", 0)
+            progress_step = 70 / 50
+            profile_filter = self.taxonomy.compile_filter(field_id, specialty_ids)
+
+            while page_url and profile_count < 50:
+                try:
+                    profile_rows, page_url = await asyncio.to_thread(
+                        self._fetch_result_page, page_url, profile_count + 1
+                    )
+                except Exception as e:
+                    print(f"Sonuç sayfası alınamadı: {e}", file=sys.stderr)
+                    break
+
+                if not profile_rows:
+                    break
+
+                for profile_data in profile_rows:
+                    if profile_count >= 50:
+                        break
+
+                    profile_data["id"] = profile_count + 1
+
+                    # Filtreleme (field_id, specialty_ids) - tek küme araması
+                    if not profile_filter.matches(profile_data) or self._already_seen(profile_data):
+                        continue
+
+                    # Email kontrolü
+                    if email and profile_data.get('email', '').lower() == email.lower():
+                        self.session.add_profile(profile_data)
+                        self._cache_put(profile_data, "profile")
+
+                        yield {"type": "email_match", "data": {
+                            "profile": profile_data,
+                            "message": f"Email eşleşmesi bulundu: {profile_data['name']}"
+                        }}
+
+                        # Grafik verisi sayfada yoksa Selenium fallback
+                        async for collab_update in self.scrape_collaborators_with_driver(profile_data):
+                            yield collab_update
+
+                        self._finish_checkpoint()
+                        return
+
+                    self.session.add_profile(profile_data)
+                    self._cache_put(profile_data, "profile")
+                    profile_count += 1
+                    self._checkpoint_profile(profile_data, profile_count)
+
+                    current_progress = 20 + (profile_count * progress_step)
+                    self.session.update_progress(
+                        int(current_progress),
+                        f"Profil {profile_count}/50 işlendi: {profile_data['name']}",
+                        stage=False
+                    )
+
+                    yield {"type": "profile_added", "data": {
+                        "profile": profile_data,
+                        "count": profile_count,
+                        "progress": int(current_progress)
+                    }}
+
+                    # Event loop'a nefes aldır
+                    await asyncio.sleep(0)
+
+                # Sayfa işlenince checkpoint sonraki sayfayı gösterir
+                if page_url:
+                    page_num += 1
+                    self.session.update_checkpoint(page=page_num)
+
+            # Progress: 90% - Scraping tamamlandı
+            self.session.update_progress(90, "Profil scraping tamamlandı")
+            yield {"type": "progress", "data": {"progress": 90, "step": "Profil scraping tamamlandı"}}
+            self._finish_checkpoint()
+
+        except Exception as e:
+            self._fail(str(e))
+            yield {"type": "error", "data": {"message": str(e)}}
+
+        except (GeneratorExit, asyncio.CancelledError):
+            # Tüketici akışı kapattı: checkpoint devam için korunur
+            interrupted = True
+            self._fail("Scraping yarıda kesildi")
+            raise
+
+        finally:
+            self.session.finalize()
+            self.session.update_progress(100, "Scraping yarıda kesildi" if interrupted else "İşlem tamamlandı")
+            if not interrupted:
+                yield {"type": "completed", "data": {
+                    "session_id": session_id,
+                    "profiles_count": len(self.session.profiles),
+                    "collaborators_count": len(self.session.collaborators)
+                }}
@@ -0,0 +1,308 @@
+"""
+Çok adımlı işbirliği ağı taraması (viewAuthorGraphs.jsp üzerinde BFS)
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .session_manager import AcademicScrapingSession, session_records
+from ..utils.helpers import extract_author_id
+
+NODES_FILE = "nodes.jsonl"
+EDGES_FILE = "edges.jsonl"
+
+
+def iter_jsonl(path: Path) -> Iterator[Dict]:
+    """JSONL dosyasını satır satır oku (yarım son satır atlanır)"""
+    if not path.exists():
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def edge_key(a: str, b: str) -> Tuple[str, str]:
+    """Yönsüz kenar anahtarı"""
+    return (a, b) if a <= b else (b, a)
+
+
+def resolve_seeds(seeds: List[str], seed_session_id: Optional[str] = None,
+                  profile_cache=None) -> Tuple[List[Dict], List[str]]:
+    """Seed'leri (profil URL'i veya authorId) düğüme çevir: (çözülenler, çözülemeyenler)
+
+    Sadece authorId verilmişse profil URL'i cache'teki kayıttan alınır;
+    seed_session_id verilirse o session'ın profilleri de seed olur.
+    """
+    resolved: Dict[str, Dict] = {}
+    unresolved = []
+    for seed in seeds or []:
+        seed = (seed or "").strip()
+        author_id = extract_author_id(seed)
+        if author_id:
+            resolved.setdefault(author_id, {"author_id": author_id, "name": "", "url": seed})
+            continue
+        record = None
+        if profile_cache is not None and seed:
+            record = profile_cache.get(seed, "profile") or profile_cache.get(seed, "collaborator")
+        if record and record.get("url"):
+            resolved.setdefault(seed, {"author_id": seed, "name": record.get("name", ""),
+                                       "url": record["url"]})
+        else:
+            unresolved.append(seed)
+
+    if seed_session_id:
+        for profile in session_records(seed_session_id, "profiles"):
+            author_id = extract_author_id(profile.get("url"))
+            if author_id:
+                resolved.setdefault(author_id, {"author_id": author_id,
+                                                "name": profile.get("name", ""),
+                                                "url": profile["url"]})
+    return list(resolved.values()), unresolved
+
+
+class NetworkCrawler:
+    """Seed profillerden başlayarak işbirlikçi grafiğini seviye seviye gezer
+
+    Düğümler authorId ile tekilleştirilir; her seviye bitmeden bir sonrakine
+    geçilmez, böylece her düğümün derinliği en kısa yoldur. Keşfedilen
+    düğümler ve kenarlar session dizinindeki nodes.jsonl / edges.jsonl
+    dosyalarına eklenir, genişletilen düğümler checkpoint'e yazılır.
+    """
+
+    def __init__(self, session: AcademicScrapingSession, scraper_factory: Callable[[], Any],
+                 max_depth: int = 2, max_nodes: int = 500, concurrency: int = 2,
+                 cache_max_age: Optional[float] = None,
+                 on_progress: Optional[Callable[[Dict], Awaitable[None]]] = None,
+                 report_interval: float = 1.0):
+        self.session = session
+        self.scraper_factory = scraper_factory
+        self.max_depth = max(1, max_depth)
+        self.max_nodes = max(1, max_nodes)
+        self.concurrency = max(1, concurrency)
+        self.cache_max_age = cache_max_age
+        self.on_progress = on_progress
+        self.report_interval = report_interval
+        self.nodes: Dict[str, Dict] = {}
+        self.edges: Set[Tuple[str, str]] = set()
+        self.expanded: Set[str] = set()
+        # Bu çalıştırmada başarısız olanlar; devamda yeniden denenir
+        self.failed: Set[str] = set()
+        self._started = time.time()
+        self._last_report = 0.0
+        self._level_total = 0
+        self._level_done = 0
+        self.stats: Dict[str, Any] = {
+            "nodes": 0,
+            "edges": 0,
+            "expanded": 0,
+            "failed": 0,
+            "depth": 0,
+            "max_depth": self.max_depth,
+            "max_nodes": self.max_nodes,
+            "concurrency": self.concurrency,
+            "budget_exhausted": False,
+            "elapsed": 0.0,
+            "nodes_per_sec": 0.0,
+            "edges_per_sec": 0.0,
+        }
+        session.crawl = self.stats
+
+    @property
+    def nodes_path(self) -> Path:
+        return self.session.base_dir / NODES_FILE
+
+    @property
+    def edges_path(self) -> Path:
+        return self.session.base_dir / EDGES_FILE
+
+    def start(self, seeds: List[Dict], query: Dict):
+        """Yeni tarama: checkpoint'i ve seed düğümleri yaz"""
+        self.session.checkpoint = {
+            "query": query,
+            "stage": "crawl",
+            "expanded_ids": self.expanded,
+        }
+        self.session.update_checkpoint(urgent=True)
+        self._write_nodes([
+            {"author_id": seed["author_id"], "name": seed.get("name", ""),
+             "url": seed["url"], "depth": 0, "parent": None}
+            for seed in seeds
+        ])
+
+    def load(self):
+        """Devam: düğümleri, kenarları ve genişletilenleri diskten oku"""
+        for node in iter_jsonl(self.nodes_path):
+            self.nodes.setdefault(node["author_id"], node)
+        for edge in iter_jsonl(self.edges_path):
+            self.edges.add(edge_key(edge["source"], edge["target"]))
+        self.expanded = set(self.session.checkpoint.get("expanded_ids") or ())
+        self.session.checkpoint["expanded_ids"] = self.expanded
+        self._update_stats()
+
+    def _write_nodes(self, nodes: List[Dict]):
+        """Yeni düğümleri belleğe ve nodes.jsonl'a ekle"""
+        if not nodes:
+            return
+        with open(self.nodes_path, "a", encoding="utf-8") as f:
+            for node in nodes:
+                self.nodes[node["author_id"]] = node
+                f.write(json.dumps(node, ensure_ascii=False))
+                f.write("\n")
+
+    def _write_edges(self, edges: List[Tuple[str, str]]):
+        """Yeni kenarları edges.jsonl'a ekle"""
+        if not edges:
+            return
+        with open(self.edges_path, "a", encoding="utf-8") as f:
+            for source, target in edges:
+                self.edges.add(edge_key(source, target))
+                f.write(json.dumps({"source": source, "target": target}, ensure_ascii=False))
+                f.write("\n")
+
+    def _update_stats(self):
+        elapsed = max(time.time() - self._started, 1e-6)
+        self.stats.update({
+            "nodes": len(self.nodes),
+            "edges": len(self.edges),
+            "expanded": len(self.expanded),
+            "elapsed": round(elapsed, 2),
+            "nodes_per_sec": round(len(self.nodes) / elapsed, 3),
+            "edges_per_sec": round(len(self.edges) / elapsed, 3),
+        })
+
+    def _budget_left(self) -> bool:
+        return len(self.nodes) < self.max_nodes
+
+    def _record_neighbors(self, node: Dict, collaborators: List[Dict]):
+        """Genişletilen düğümün komşularını düğüm / kenar olarak kaydet"""
+        source = node["author_id"]
+        new_nodes: Dict[str, Dict] = {}
+        new_edges = []
+        for collab in collaborators:
+            target = extract_author_id(collab.get("href"))
+            # Silinmiş / linksiz işbirlikçiler ağa eklenmez
+            if not target or target == source:
+                continue
+            if target not in self.nodes and target not in new_nodes:
+                if len(self.nodes) + len(new_nodes) >= self.max_nodes:
+                    # Bütçe dolu: bilinmeyen düğüme giden kenar da atlanır
+                    self.stats["budget_exhausted"] = True
+                    continue
+                new_nodes[target] = {
+                    "author_id": target,
+                    "name": collab.get("name", ""),
+                    "url": collab["href"],
+                    "depth": node["depth"] + 1,
+                    "parent": source,
+                }
+            if edge_key(source, target) not in self.edges and (source, target) not in new_edges:
+                new_edges.append((source, target))
+        self._write_nodes(list(new_nodes.values()))
+        self._write_edges(new_edges)
+
+    def _frontier(self) -> List[Dict]:
+        """Genişletilmemiş, derinliği sınırın altındaki düğümler (en sığ seviye)"""
+        pending = [node for author_id, node in self.nodes.items()
+                   if author_id not in self.expanded and author_id not in self.failed
+                   and node["depth"] < self.max_depth]
+        if not pending:
+            return []
+        depth = min(node["depth"] for node in pending)
+        return [node for node in pending if node["depth"] == depth]
+
+    async def _report(self, force: bool = False):
+        """Progress'i session'a yaz, aralıklarla bildirim gönder"""
+        self._update_stats()
+        level = self._level_done / self._level_total if self._level_total else 1
+        progress = min(99, int((self.stats["depth"] + level) / self.max_depth * 99))
+        self.session.update_progress(
+            progress,
+            f"Derinlik {self.stats['depth'] + 1}/{self.max_depth}: "
+            f"{self.stats['nodes']} düğüm, {self.stats['edges']} kenar",
+            stage=force
+        )
+        now = time.monotonic()
+        if self.on_progress and (force or now - self._last_report >= self.report_interval):
+            self._last_report = now
+            try:
+                await self.on_progress(dict(self.stats, progress=progress))
+            except Exception as e:
+                print(f"⚠️ Tarama bildirimi gönderilemedi: {e}", file=sys.stderr)
+
+    async def _worker(self, queue: "asyncio.Queue"):
+        scraper = self.scraper_factory()
+        scraper.session = self.session
+        scraper.cache_max_age = self.cache_max_age
+        try:
+            while self._budget_left():
+                try:
+                    node = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    collaborators = await scraper.fetch_collaborator_graph(node)
+                except Exception as e:
+                    # Başarısız düğüm checkpoint'e girmez; devamda yeniden denenir
+                    self.failed.add(node["author_id"])
+                    self.stats["failed"] = len(self.failed)
+                    print(f"⚠️ {node['author_id']} grafiği alınamadı: {e}", file=sys.stderr)
+                else:
+                    self._record_neighbors(node, collaborators)
+                    self.expanded.add(node["author_id"])
+                    self.session.update_checkpoint()
+                self._level_done += 1
+                await self._report()
+        finally:
+            await scraper.close()
+
+    async def run(self) -> Dict:
+        """Bütçe veya derinlik dolana kadar seviye seviye genişlet"""
+        self._started = time.time()
+        self.session.update_progress(1, f"{len(self.nodes)} seed ile ağ taraması başlatılıyor...")
+        try:
+            while self._budget_left():
+                level = self._frontier()
+                if not level:
+                    break
+                self.stats["depth"] = level[0]["depth"]
+                self._level_total = len(level)
+                self._level_done = 0
+                queue: "asyncio.Queue" = asyncio.Queue()
+                for node in level:
+                    queue.put_nowait(node)
+                workers = min(self.concurrency, len(level))
+                await asyncio.gather(*(self._worker(queue) for _ in range(workers)))
+                await self._report(force=True)
+            if self.failed and not self.expanded:
+                raise Exception("Hiçbir düğümün işbirlikçi grafiği alınamadı")
+            self.stats["budget_exhausted"] = self.stats["budget_exhausted"] or not self._budget_left()
+            # Başarısız düğüm kaldıysa checkpoint devam edilebilir kalır
+            self.session.update_checkpoint(urgent=True, stage="crawl" if self.failed else "done")
+        except Exception as e:
+            self.session.error_message = str(e)
+            self.session.status = "error"
+            self.session.update_checkpoint(urgent=True)
+        except asyncio.CancelledError:
+            self.session.error_message = "Tarama yarıda kesildi"
+            self.session.status = "error"
+            self.session.update_checkpoint(urgent=True)
+            raise
+        finally:
+            self._update_stats()
+            self.session.update_progress(100, f"Ağ taraması tamamlandı: {self.stats['nodes']} düğüm, "
+                                              f"{self.stats['edges']} kenar")
+            if self.on_progress:
+                try:
+                    await self.on_progress(dict(self.stats, progress=100))
+                except Exception:
+                    pass
+        return self.stats
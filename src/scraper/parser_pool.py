@@ -0,0 +1,51 @@
+"""
+Sayfa görüntüsü (page_source) ayrıştırma havuzu
+
+Selenium snapshot modunda tarayıcı bir sonraki sayfaya geçerken önceki
+sayfanın HTML'i burada, parsers.py'deki saf fonksiyonlarla ayrıştırılır.
+"""
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from ..utils.helpers import get_setting
+
+
+def create_parser_pool(kind: str = "thread", workers: int = 2) -> Executor:
+    """kind: 'thread' (lxml ayrıştırırken GIL'i bırakır) veya 'process' (HTML process'e kopyalanır)"""
+    workers = max(1, workers)
+    if kind != "process":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="page-parser")
+    # spawn: çok thread'li server process'inden fork edilmez
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+_parser_pool: Optional[Executor] = None
+_parser_pool_lock = threading.Lock()
+
+
+def get_parser_pool() -> Executor:
+    """Process genelindeki ayrıştırma havuzunu getir (scraping.parser_pool / parser_workers)"""
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is None:
+            kind = get_setting("scraping.parser_pool", "thread")
+            workers = get_setting("scraping.parser_workers", 2)
+            try:
+                _parser_pool = create_parser_pool(kind, workers)
+            except Exception as e:
+                # Process oluşturulamayan ortamlar (ör. kısıtlı sandbox)
+                print(f"⚠️ Process havuzu kurulamadı, thread havuzu kullanılıyor: {e}", file=sys.stderr)
+                _parser_pool = create_parser_pool("thread", workers)
+        return _parser_pool
+
+
+def shutdown_parser_pool():
+    """Global havuzu kapat"""
+    global _parser_pool
+    with _parser_pool_lock:
+        pool, _parser_pool = _parser_pool, None
+    if pool:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,367 @@
+"""
+YÖK Akademik sayfaları için HTML ayrıştırıcılar (tarayıcısız)
+
+Buradaki fonksiyonlar saf fonksiyonlardır: HTML string alır, StreamingAcademicScraper'ın
+canlı DOM'dan ürettiği sözlüklerin aynısını döndürür.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
+
+from lxml import html as lxml_html
+
+from ..utils.helpers import extract_author_id
+
+DEFAULT_PHOTO_URL = "/default_photo.jpg"
+PROFILE_PATH = "/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId="
+
+# innerText benzeri metin üretirken satır sonu eklenecek etiketler
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+_SKIP_TAGS = {"script", "style", "noscript", "template"}
+_WHITESPACE = re.compile(r"[ \t\r\n\f]+")
+
+
+def _collect_text(el, parts: List[str]):
+    # Yorum ve işlem talimatı düğümlerinin metni görünmez
+    if not isinstance(el.tag, str) or el.tag in _SKIP_TAGS:
+        return
+    tag = el.tag
+    if tag == "br" or tag in _BLOCK_TAGS:
+        parts.append("\n")
+    if el.text:
+        parts.append(_WHITESPACE.sub(" ", el.text))
+    for child in el:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(_WHITESPACE.sub(" ", child.tail))
+    if tag in _BLOCK_TAGS:
+        parts.append("\n")
+
+
+def inner_text(el) -> str:
+    """Selenium'daki element.text'e yakın, satır yapısını koruyan metin"""
+    if el is None:
+        return ""
+    parts: List[str] = []
+    _collect_text(el, parts)
+    text = "".join(parts).replace("\xa0", " ")
+    lines = [line.strip() for line in text.split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+def parse_html(page_html: str):
+    """HTML string'ini lxml ağacına çevir"""
+    return lxml_html.fromstring(page_html)
+
+
+def _has_class(name: str) -> str:
+    """CSS '.name' seçicisinin XPath karşılığı"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _first(elements):
+    return elements[0] if elements else None
+
+
+def _abs_url(base_url: str, value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return urljoin(base_url, value.strip())
+
+
+def _email_from(el) -> str:
+    email_link = _first(el.xpath(".//a[starts-with(@href, 'mailto')]"))
+    if email_link is None:
+        return ""
+    return inner_text(email_link).strip().replace('[at]', '@')
+
+
+def parse_profile_row(row, profile_id: int, base_url: str) -> Dict:
+    """Tek bir tr[id^='authorInfo_'] satırını profil sözlüğüne çevir"""
+    info_td = _first(row.xpath("./td[h6]"))
+    link = _first(row.xpath(".//a"))
+    img = _first(row.xpath(".//img"))
+    if info_td is None or link is None or img is None:
+        return {}
+
+    name = inner_text(link).strip()
+    url = _abs_url(base_url, link.get("href"))
+    info = inner_text(info_td).strip()
+    img_src = _abs_url(base_url, img.get("src")) or DEFAULT_PHOTO_URL
+
+    info_lines = info.splitlines()
+    title = info_lines[0].strip() if len(info_lines) > 0 else name
+    header = info_lines[2].strip() if len(info_lines) > 2 else ''
+
+    # Labels
+    all_links = info_td.xpath(f".//a[{_has_class('anahtarKelime')}]")
+    green_label = inner_text(all_links[0]).strip() if len(all_links) > 0 else ''
+    blue_label = inner_text(all_links[1]).strip() if len(all_links) > 1 else ''
+
+    return {
+        "id": profile_id,
+        "name": name,
+        "title": title,
+        "url": url,
+        "info": info,
+        "header": header,
+        "green_label": green_label,
+        "blue_label": blue_label,
+        "email": _email_from(row),
+        "photoUrl": img_src
+    }
+
+
+def parse_result_rows(page_html: str, base_url: str, start_id: int = 1) -> List[Dict]:
+    """Arama sonuç sayfasındaki tüm profil satırlarını ayrıştır"""
+    doc = parse_html(page_html)
+    profiles = []
+    for row in doc.xpath("//tr[starts-with(@id, 'authorInfo_')]"):
+        profile = parse_profile_row(row, start_id + len(profiles), base_url)
+        if profile:
+            profiles.append(profile)
+    return profiles
+
+
+def parse_collaborator_page(page_html: str, collab_data: Dict, collab_id: int, base_url: str) -> Dict:
+    """İşbirlikçi profil sayfasını ayrıştır (_extract_collaborator_data ile aynı çıktı)"""
+    result = {
+        "id": collab_id,
+        "name": collab_data['name'],
+        "url": collab_data['href'],
+        "status": "completed",
+        "deleted": False
+    }
+
+    if not collab_data['href'] or not page_html:
+        result["deleted"] = True
+        result["photoUrl"] = DEFAULT_PHOTO_URL
+        return result
+
+    doc = parse_html(page_html)
+    tds = doc.xpath("//td[h6]")
+    if not tds:
+        result["deleted"] = True
+        result["photoUrl"] = DEFAULT_PHOTO_URL
+        return result
+
+    info = inner_text(tds[0])
+    info_lines = info.splitlines()
+
+    green_span = _first(tds[0].xpath(f".//span[{_has_class('label-success')}]"))
+    blue_span = _first(tds[0].xpath(f".//span[{_has_class('label-primary')}]"))
+    result.update({
+        "title": info_lines[0].strip() if len(info_lines) > 0 else collab_data['name'],
+        "info": info_lines[2].strip() if len(info_lines) > 2 else '',
+        "green_label": inner_text(green_span).strip() if green_span is not None else '',
+        "blue_label": inner_text(blue_span).strip() if blue_span is not None else '',
+        "keywords": '',
+        "email": _email_from(tds[0])
+    })
+
+    img = _first(doc.xpath(f"//img[{_has_class('img-circle')} or @id='imgPicture']"))
+    result["photoUrl"] = _abs_url(base_url, img.get("src")) if img is not None and img.get("src") else DEFAULT_PHOTO_URL
+    return result
+
+
+def find_link_by_text(page_html: str, text: str, base_url: str) -> Optional[str]:
+    """Metni tam eşleşen ilk linkin mutlak URL'i"""
+    doc = parse_html(page_html)
+    for link in doc.iter("a"):
+        if inner_text(link).strip() == text and link.get("href"):
+            return _abs_url(base_url, link.get("href"))
+    return None
+
+
+def find_next_page_url(page_html: str, base_url: str) -> Optional[str]:
+    """ul.pagination içinde aktif sayfadan sonraki sayfanın URL'i"""
+    doc = parse_html(page_html)
+    pagination = _first(doc.xpath(f"//ul[{_has_class('pagination')}]"))
+    if pagination is None:
+        return None
+    all_lis = pagination.xpath(".//li")
+    active_li = _first(pagination.xpath(f".//li[{_has_class('active')}]"))
+    if active_li is None or active_li not in all_lis:
+        return None
+    active_index = all_lis.index(active_li)
+    if active_index == len(all_lis) - 1:
+        return None
+    next_a = _first(all_lis[active_index + 1].xpath(".//a"))
+    if next_a is None:
+        return None
+    href = (next_a.get("href") or "").strip()
+    if not href or href == "#" or href.lower().startswith("javascript:"):
+        return None
+    return _abs_url(base_url, href)
+
+
+def parse_search_form(page_html: str, base_url: str) -> Optional[Dict]:
+    """#aramaTerim kutusunu içeren arama formunu çöz"""
+    doc = parse_html(page_html)
+    search_box = _first(doc.xpath("//*[@id='aramaTerim']"))
+    if search_box is None:
+        return None
+    form = next(search_box.iterancestors("form"), None)
+    if form is None:
+        return None
+    fields = {}
+    for inp in form.xpath(".//input[@name] | .//select[@name] | .//textarea[@name]"):
+        if inp.tag == "input" and inp.get("type", "").lower() in ("submit", "button", "image", "checkbox", "radio"):
+            continue
+        fields[inp.get("name")] = inp.get("value", "")
+    search_button = _first(form.xpath(".//*[@id='searchButton']"))
+    if search_button is not None and search_button.get("name"):
+        fields[search_button.get("name")] = search_button.get("value", "")
+    return {
+        "action": _abs_url(base_url, form.get("action") or base_url),
+        "method": (form.get("method") or "get").upper(),
+        "fields": fields,
+        "term_field": search_box.get("name") or "aramaTerim",
+    }
+
+
+# İşbirlikçi grafiği düğüm/kenar verisinde aranan alanlar
+_NODE_NAME_KEYS = ("text", "name", "label", "title")
+_NODE_URL_KEYS = ("url", "href", "link", "pageUrl")
+_WEIGHT_KEYS = ("weight", "value", "count")
+_GRAPH_ASSIGNMENT = re.compile(r"[\w$.\]\[\"']+\s*=\s*(?=[\[{])")
+
+# Grafik sayfasındaki d3 verisini (g.__data__) tek seferde okuyan script;
+# çıktısı collaborators_from_graph_data ile işbirlikçi listesine çevrilir
+GRAPH_DATA_SCRIPT = """
+const KEYS = ['id', 'name', 'label', 'title', 'url', 'href', 'link', 'pageUrl', 'authorId',
+              'weight', 'value', 'count'];
+const pick = (d, keys) => {
+    const out = {};
+    for (const k of keys) if (d[k] !== undefined && d[k] !== null && typeof d[k] !== 'object') out[k] = d[k];
+    return out;
+};
+const nodes = [];
+const index = new Map();
+for (const g of document.querySelectorAll('svg g')) {
+    const d = g.__data__;
+    if (!d || typeof d !== 'object' || 'source' in d || index.has(d)) continue;
+    index.set(d, nodes.length);
+    const node = pick(d, KEYS);
+    const text = g.querySelector('text');
+    if (text) node.text = text.textContent.trim();
+    nodes.push(node);
+}
+if (!nodes.length) return null;
+const links = [];
+const end = v => (v && typeof v === 'object') ? (index.has(v) ? index.get(v) : v.id) : v;
+for (const el of document.querySelectorAll('svg line, svg path, svg g')) {
+    const d = el.__data__;
+    if (!d || typeof d !== 'object' || !('source' in d) || !('target' in d)) continue;
+    links.push(Object.assign({source: end(d.source), target: end(d.target)}, pick(d, ['weight', 'value', 'count'])));
+}
+return {nodes: nodes, links: links};
+"""
+
+
+def _first_value(data: Dict, keys) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value is not None and value != "":
+            return value
+    return None
+
+
+def _node_href(node: Dict, base_url: str) -> str:
+    url = _first_value(node, _NODE_URL_KEYS)
+    if isinstance(url, str) and url.strip():
+        return _abs_url(base_url, url.strip())
+    author_id = node.get("authorId")
+    return urljoin(base_url, PROFILE_PATH + str(author_id)) if author_id else ""
+
+
+def _link_end(value, node_count: int, node_keys: Dict[Any, int]) -> Optional[int]:
+    """Kenar ucunu düğüm index'ine çevir (index, id veya isim olabilir)"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value if 0 <= value < node_count else None
+    return node_keys.get(value) if isinstance(value, str) else None
+
+
+def collaborators_from_graph_data(nodes: List[Dict], links: Optional[List[Dict]], base_url: str,
+                                  profile_url: Optional[str] = None,
+                                  require_center: bool = False) -> Optional[List[Dict]]:
+    """Grafik düğümlerinden tıklama yöntemiyle aynı {name, href} listesi (+ varsa weight)
+
+    Merkez düğüm profilin authorId'si ile, bulunamazsa ilk düğüm olarak
+    seçilip listeden çıkarılır. require_center ile merkez bulunamazsa (başka
+    profilin grafiği olabilir) None döner. Düğümlerde hiç link yoksa da None:
+    çağıran tıklama yöntemine geri döner.
+    """
+    nodes = [node for node in nodes or [] if isinstance(node, dict)]
+    if not nodes:
+        return None
+    hrefs = [_node_href(node, base_url) for node in nodes]
+
+    profile_author_id = extract_author_id(profile_url)
+    author_ids = [extract_author_id(href) for href in hrefs]
+    if profile_author_id and profile_author_id in author_ids:
+        center = author_ids.index(profile_author_id)
+    elif require_center:
+        return None
+    else:
+        center = 0
+
+    # id/isim -> index (ilk eşleşen düğüm)
+    node_keys: Dict[Any, int] = {}
+    for i in reversed(range(len(nodes))):
+        for key in ("name", "id"):
+            value = nodes[i].get(key)
+            if isinstance(value, str):
+                node_keys[value] = i
+    weights: Dict[int, Any] = {}
+    for link in links or []:
+        if not isinstance(link, dict):
+            continue
+        ends = (_link_end(link.get("source"), len(nodes), node_keys),
+                _link_end(link.get("target"), len(nodes), node_keys))
+        weight = _first_value(link, _WEIGHT_KEYS)
+        if weight is not None and center in ends:
+            weights[ends[1] if ends[0] == center else ends[0]] = weight
+
+    collaborators = []
+    for i, node in enumerate(nodes):
+        if i == center:
+            continue
+        name = _first_value(node, _NODE_NAME_KEYS)
+        collaborator = {"name": str(name).strip() if name is not None else "", "href": hrefs[i]}
+        weight = weights.get(i, _first_value(node, _WEIGHT_KEYS))
+        if weight is not None:
+            collaborator["weight"] = weight
+        collaborators.append(collaborator)
+    if collaborators and not any(collaborator["href"] for collaborator in collaborators):
+        return None
+    return collaborators
+
+
+def parse_collaborator_graph(page_html: str, base_url: str, profile_url: Optional[str] = None,
+                             require_center: bool = False) -> Optional[List[Dict]]:
+    """Grafik sayfasına gömülü script verisinden ({nodes: [...], links: [...]}) işbirlikçiler
+
+    Veri bulunamazsa (ör. grafik ayrı bir istekle yükleniyorsa) None.
+    """
+    doc = parse_html(page_html)
+    decoder = json.JSONDecoder()
+    for script in doc.iter("script"):
+        text = script.text or ""
+        if "nodes" not in text:
+            continue
+        for match in _GRAPH_ASSIGNMENT.finditer(text):
+            try:
+                data, _ = decoder.raw_decode(text, match.end())
+            except ValueError:
+                continue
+            if isinstance(data, dict) and isinstance(data.get("nodes"), list):
+                return collaborators_from_graph_data(data["nodes"], data.get("links") or data.get("edges"),
+                                                     base_url, profile_url, require_center)
+    return None
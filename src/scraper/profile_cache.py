@@ -0,0 +1,260 @@
+"""
+authorId anahtarlı kalıcı profil cache'i (SQLite, TTL + LRU)
+"""
+import atexit
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..utils.helpers import get_setting
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+class ProfileCache:
+    """Profil / işbirlikçi kayıtları için gömülü cache
+
+    Kayıtlar (authorId, kind) çifti ile tutulur. Sık okunan kayıtlar ayrıca
+    bellekteki küçük bir LRU katmanında saklanır. put() diske yazmaz: kayıt
+    hemen okunabilir olur, yazımlar ve erişim zamanları arka plan thread'inde
+    kendi bağlantısıyla toplu olarak (tek commit) yazılır.
+    """
+
+    def __init__(self, path: Path, ttl: float = 7 * 24 * 3600, max_entries: int = 100_000,
+                 memory_entries: int = 2048, flush_interval: float = 0.5):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.flush_interval = flush_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._touched: Dict[tuple, float] = {}
+        # Diske yazılmayı bekleyen kayıtlar: key -> (data, fetched_at)
+        self._pending: Dict[tuple, tuple] = {}
+        self._writing = False
+        self._urgent = False
+        self._cond = threading.Condition(self._lock)
+        self._writer: Optional[threading.Thread] = None
+        self.writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                author_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (author_id, kind)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+        self._conn.commit()
+        # Kayıt sayısı bellekte tutulur (her yazımda COUNT(*) yapılmaz)
+        self._count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @classmethod
+    def from_settings(cls) -> "ProfileCache":
+        return cls(
+            path=PROJECT_ROOT / get_setting("cache.profile_db", "cache/profiles.sqlite3"),
+            ttl=get_setting("cache.profile_ttl", 7 * 24 * 3600),
+            max_entries=get_setting("cache.profile_max_entries", 100_000),
+            flush_interval=get_setting("cache.profile_flush_interval_ms", 500) / 1000,
+        )
+
+    def _remember(self, key: tuple, data: Dict, fetched_at: float):
+        self._memory[key] = (data, fetched_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, author_id: Optional[str], kind: str = "profile",
+            max_age: Optional[float] = None) -> Optional[Dict]:
+        """Kaydı getir; max_age (saniye) verilirse TTL yerine o kullanılır"""
+        if not author_id:
+            return None
+        ttl = self.ttl if max_age is None else max_age
+        key = (author_id, kind)
+        now = time.time()
+        with self._lock:
+            entry = self._pending.get(key) or self._memory.get(key)
+            if entry is None:
+                row = self._conn.execute(
+                    "SELECT data, fetched_at FROM entries WHERE author_id = ? AND kind = ?", key
+                ).fetchone()
+                if row is not None:
+                    entry = (json.loads(row[0]), row[1])
+                    self._remember(key, *entry)
+            else:
+                self._memory.move_to_end(key)
+
+            if entry is None or now - entry[1] > ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = now
+            return dict(entry[0])
+
+    def put(self, author_id: Optional[str], data: Dict, kind: str = "profile"):
+        """Kaydı ekle veya güncelle (diske arka planda yazılır, çağıranı bloklamaz)"""
+        if not author_id:
+            return
+        now = time.time()
+        key = (author_id, kind)
+        entry = (dict(data), now)
+        with self._cond:
+            self._pending[key] = entry
+            self._touched.pop(key, None)
+            self._remember(key, *entry)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="profile-cache-writer", daemon=True)
+                self._writer.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Bekleyen tüm yazımlar diske geçene kadar bekle"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._urgent = True
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self):
+        # Yazıcı thread'inin kendi bağlantısı: WAL'da okumalar yazımı beklemez
+        conn = sqlite3.connect(str(self.path))
+        conn.execute("PRAGMA synchronous=NORMAL")
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # Aynı sayfadaki kayıtlar tek işlemde yazılsın
+                deadline = time.monotonic() + self.flush_interval
+                while not self._urgent and time.monotonic() < deadline:
+                    self._cond.wait(deadline - time.monotonic())
+                self._urgent = False
+                batch, self._pending = self._pending, {}
+                touched, self._touched = self._touched, {}
+                self._writing = True
+            try:
+                self._write_batch(conn, batch, touched)
+            except Exception as e:
+                print(f"⚠️ Profil cache'e yazılamadı: {e}", file=sys.stderr)
+                conn.rollback()
+            with self._cond:
+                self.writes += len(batch)
+                self._writing = False
+                self._cond.notify_all()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: Dict[tuple, tuple], touched: Dict[tuple, float]):
+        added = 0
+        rows = []
+        for (author_id, kind), (data, fetched_at) in batch.items():
+            exists = conn.execute(
+                "SELECT 1 FROM entries WHERE author_id = ? AND kind = ?", (author_id, kind)
+            ).fetchone()
+            added += exists is None
+            rows.append((author_id, kind, json.dumps(data, ensure_ascii=False), fetched_at, fetched_at))
+        conn.executemany(
+            "INSERT OR REPLACE INTO entries (author_id, kind, data, fetched_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+        if touched:
+            conn.executemany(
+                "UPDATE entries SET last_access = ? WHERE author_id = ? AND kind = ?",
+                [(ts, key[0], key[1]) for key, ts in touched.items()]
+            )
+        with self._lock:
+            self._count += added
+            overflow = self._count - self.max_entries
+        if overflow > 0:
+            self._evict(conn, overflow)
+        conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, overflow: int):
+        """Boyut sınırı aşıldıysa en uzun süredir erişilmeyen kayıtları sil"""
+        victims = conn.execute(
+            "SELECT author_id, kind FROM entries ORDER BY last_access ASC LIMIT ?", (overflow,)
+        ).fetchall()
+        conn.executemany("DELETE FROM entries WHERE author_id = ? AND kind = ?", victims)
+        with self._lock:
+            for key in victims:
+                if tuple(key) not in self._pending:
+                    self._memory.pop(tuple(key), None)
+            self._count -= len(victims)
+            self.evictions += len(victims)
+
+    def purge(self, kind: Optional[str] = None) -> int:
+        """Cache'i (veya bir türü) temizle"""
+        self.flush()
+        with self._lock:
+            if kind:
+                cursor = self._conn.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+                for key in [k for k in self._memory if k[1] == kind]:
+                    del self._memory[key]
+            else:
+                cursor = self._conn.execute("DELETE FROM entries")
+                self._memory.clear()
+            self._touched.clear()
+            self._conn.commit()
+            self._count -= cursor.rowcount
+            return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """Hit/miss sayaçları ve boyut"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._count,
+                "pending_writes": len(self._pending),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+    def close(self):
+        """Bekleyen yazımları ve erişim zamanlarını diske geçirip kapat"""
+        self.flush()
+        with self._lock:
+            if self._touched:
+                self._conn.executemany(
+                    "UPDATE entries SET last_access = ? WHERE author_id = ? AND kind = ?",
+                    [(ts, key[0], key[1]) for key, ts in self._touched.items()]
+                )
+                self._touched.clear()
+            self._conn.commit()
+            self._conn.close()
+
+
+_profile_cache: Optional[ProfileCache] = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> ProfileCache:
+    """Process genelindeki profil cache'ini getir"""
+    global _profile_cache
+    with _profile_cache_lock:
+        if _profile_cache is None:
+            _profile_cache = ProfileCache.from_settings()
+            atexit.register(_profile_cache.flush, 5)
+        return _profile_cache
@@ -0,0 +1,173 @@
+"""
+Arama sorgusu sonuç cache'i (stale-while-revalidate)
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .records import make_records
+from ..utils.helpers import get_setting, turkish_casefold
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+def make_query_key(name: str, field_id: Optional[int] = None,
+                   specialty_ids: Optional[List[int]] = None, email: Optional[str] = None) -> str:
+    """Normalize edilmiş sorgu anahtarı (Türkçe casefold'lu isim)"""
+    return json.dumps([
+        turkish_casefold(name),
+        field_id or None,
+        sorted(set(specialty_ids)) if specialty_ids else None,
+        (email or "").strip().lower() or None,
+    ], ensure_ascii=False)
+
+
+class QueryResultCache:
+    """Sorgu anahtarı -> profil/işbirlikçi listesi
+
+    ttl süresince kayıt taze (fresh) sayılır; ttl + stale_ttl süresince
+    bayat (stale) kayıt hemen döndürülür ve arka planda yenilenir.
+    """
+
+    def __init__(self, ttl: float = 3600, stale_ttl: float = 86400, max_entries: int = 500):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.hits = {FRESH: 0, STALE: 0}
+        self.misses = 0
+
+    @classmethod
+    def from_settings(cls) -> "QueryResultCache":
+        return cls(
+            ttl=get_setting("query_cache.ttl", 3600),
+            stale_ttl=get_setting("query_cache.stale_ttl", 86400),
+            max_entries=get_setting("query_cache.max_entries", 500),
+        )
+
+    def lookup(self, key: str, max_age: Optional[float] = None) -> Tuple[Optional[Dict], Optional[str]]:
+        """(kayıt, durum) döndür; durum 'fresh', 'stale' veya None
+
+        max_age (saniye) verilirse ondan eski kayıt hiç döndürülmez (miss);
+        stale_ttl penceresi yalnızca çağıran bir sınır vermediğinde kullanılır.
+        """
+        ttl = self.ttl if max_age is None else min(max_age, self.ttl)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            state = None
+            if entry is not None:
+                age = now - entry["stored_at"]
+                if age <= ttl:
+                    state = FRESH
+                elif age > self.ttl + self.stale_ttl:
+                    del self._entries[key]
+                    entry = None
+                elif max_age is not None and age > max_age:
+                    # Kayıt başka çağıranlar için hâlâ bayat olarak kullanılabilir
+                    entry = None
+                else:
+                    state = STALE
+
+            if entry is None:
+                self.misses += 1
+                return None, None
+            self._entries.move_to_end(key)
+            self.hits[state] += 1
+            return entry, state
+
+    def store(self, key: str, query: Dict, profiles: List[Dict], collaborators: List[Dict],
+              session_id: str):
+        """Tamamlanan scraping sonucunu sakla (kayıtlar kompakt tutulur, bkz. records.to_dicts)"""
+        profiles = make_records("profiles", profiles)
+        collaborators = make_records("collaborators", collaborators)
+        with self._lock:
+            self._entries[key] = {
+                "key": key,
+                "query": query,
+                "profiles": profiles,
+                "collaborators": collaborators,
+                "session_id": session_id,
+                "stored_at": time.time(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._refreshing.discard(key)
+
+    def begin_refresh(self, key: str) -> bool:
+        """Arka plan yenilemesi başlat; zaten yenileniyorsa False"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def purge(self, key: Optional[str] = None, name: Optional[str] = None) -> int:
+        """Kayıt(lar)ı sil: anahtar, isim veya hepsi"""
+        with self._lock:
+            if key is not None:
+                return 1 if self._entries.pop(key, None) is not None else 0
+            if name is not None:
+                folded = turkish_casefold(name)
+                victims = [k for k, e in self._entries.items()
+                           if turkish_casefold(e["query"].get("name")) == folded]
+            else:
+                victims = list(self._entries)
+            for victim in victims:
+                del self._entries[victim]
+            return len(victims)
+
+    def list_entries(self) -> List[Dict[str, Any]]:
+        """Kayıtların özetini döndür (profil listeleri olmadan)"""
+        now = time.time()
+        with self._lock:
+            result = []
+            for key, entry in self._entries.items():
+                age = now - entry["stored_at"]
+                result.append({
+                    "key": key,
+                    "query": entry["query"],
+                    "session_id": entry["session_id"],
+                    "profiles_count": len(entry["profiles"]),
+                    "collaborators_count": len(entry["collaborators"]),
+                    "age": round(age, 1),
+                    "state": FRESH if age <= self.ttl else STALE,
+                    "refreshing": key in self._refreshing,
+                })
+            return result
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "stale_ttl": self.stale_ttl,
+                "fresh_hits": self.hits[FRESH],
+                "stale_hits": self.hits[STALE],
+                "misses": self.misses,
+                "refreshing": len(self._refreshing),
+            }
+
+
+_query_cache: Optional[QueryResultCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryResultCache:
+    """Process genelindeki sorgu cache'ini getir"""
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = QueryResultCache.from_settings()
+        return _query_cache
@@ -0,0 +1,73 @@
+"""
+Session kayıtları üzerinde tembel kurulan, dinleyici ile güncellenen indeksler için temel sınıf
+"""
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .session_manager import SESSIONS_DIR, AcademicScrapingSession, iter_session_records, session_dirs
+
+
+def record_name(record: Dict, info_lines: Optional[List[str]] = None) -> str:
+    """Kaydın ismi; eski kayıtlarda isim yalnızca info'nun ikinci satırındadır"""
+    if record.get("name"):
+        return record["name"]
+    if info_lines is None:
+        info_lines = (record.get("info") or "").splitlines()
+    return info_lines[1].strip() if len(info_lines) > 1 else ""
+
+
+def session_label(session_dir: Path) -> str:
+    """Toplu aramaların alt session'ları batch session ID'si ile gösterilir"""
+    if session_dir.parent.name == "queries":
+        return session_dir.parent.parent.name
+    return session_dir.name
+
+
+class SessionRecordIndex:
+    """Tüm session'ların profil / işbirlikçi kayıtlarından beslenen indeks
+
+    İlk sorguda diskteki session'lar taranır; sonra add_profile /
+    add_collaborator dinleyicisinden gelen kayıtlar sıraya alınıp bir
+    sonraki sorguda eklenir. Alt sınıflar _add'i uygular ve sorgularını
+    _lock altında _ensure_current çağırdıktan sonra çalıştırır.
+    """
+
+    def __init__(self, sessions_dir: Path = SESSIONS_DIR):
+        self.sessions_dir = sessions_dir
+        self._lock = threading.Lock()
+        self._scan_started = False
+        self._scanned = False
+        # Tarama sürerken veya sonrasında gelen kayıtlar; sorguda işlenir
+        self._pending: "deque[Tuple[str, str, Dict]]" = deque()
+        self.last_scan_seconds = 0.0
+
+    def _add(self, session_id: str, kind: str, record: Dict):
+        """Kaydı indekse ekle (kilit altında çağrılır)"""
+        raise NotImplementedError
+
+    def on_record(self, session: AcademicScrapingSession, kind: str, record: Dict):
+        """Session kayıt dinleyicisi: ilk taramadan sonra gelen kayıtları sıraya al"""
+        if self._scan_started:
+            self._pending.append((session_label(session.base_dir), kind, record))
+
+    def _ensure_current(self):
+        """İlk sorguda tüm session'ları tara, sonra bekleyen kayıtları ekle"""
+        if not self._scanned:
+            self._scan_started = True
+            started = time.perf_counter()
+            for session_dir in session_dirs(self.sessions_dir):
+                label = session_label(session_dir)
+                for kind in ("profiles", "collaborators"):
+                    try:
+                        for record in iter_session_records(session_dir.name, kind, session_dir.parent):
+                            self._add(label, kind, record)
+                    except Exception as e:
+                        print(f"⚠️ {session_dir.name} indekslenemedi: {e}", file=sys.stderr)
+            self._scanned = True
+            self.last_scan_seconds = round(time.perf_counter() - started, 4)
+        while self._pending:
+            self._add(*self._pending.popleft())
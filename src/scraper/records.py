@@ -0,0 +1,182 @@
+"""
+Profil ve işbirlikçi kayıtlarının bellekte kompakt gösterimi
+
+Kayıtlar sözlük gibi okunur/yazılır (Mapping), ama alanlar __slots__'ta
+tutulur: tekrar eden etiket/unvan metinleri intern edilir, profillerin
+title/header alanları info metninden türetilebiliyorsa ayrıca saklanmaz.
+JSON'a (dosyalar, tool yanıtları) yalnızca sınırda to_dict ile çevrilir.
+"""
+import sys
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterable, List, Optional
+
+_MISSING = object()
+# Alan info metninden türetilecek (bkz. ProfileRecord)
+_DERIVED = object()
+
+
+class Record(MutableMapping):
+    """__slots__ tabanlı kayıt; FIELDS dışındaki anahtarlar _extra sözlüğünde"""
+
+    __slots__ = ("_extra",)
+
+    # JSON'daki alan sırası; alt sınıflar her alan için bir slot tanımlar
+    FIELDS: tuple = ()
+    # Çok sayıda kayıtta tekrar eden metin alanları
+    INTERNED: frozenset = frozenset()
+    _field_set: frozenset = frozenset()
+
+    def __init__(self, data: Optional[Mapping] = None):
+        extra = None
+        if data:
+            # __setitem__ ile aynı iş, alan başına çağrı maliyeti olmadan
+            fields, interned = self._field_set, self.INTERNED
+            for key, value in data.items():
+                if key in fields:
+                    if key in interned and type(value) is str:
+                        value = sys.intern(value)
+                    setattr(self, key, value)
+                elif extra is None:
+                    extra = {key: value}
+                else:
+                    extra[key] = value
+        self._extra: Optional[Dict[str, Any]] = extra
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            value = getattr(self, key, _MISSING)
+            if value is _DERIVED:
+                return self._derive(key)
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._field_set:
+            if key in self.INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._field_set and getattr(self, key, _MISSING) is not _MISSING:
+            delattr(self, key)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if getattr(self, key, _MISSING) is not _MISSING:
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        if key in self._field_set:
+            return getattr(self, key, _MISSING) is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def _derive(self, key: str) -> Any:
+        raise KeyError(key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mevcut JSON şekli (alan sırası kaynaktaki gibi)"""
+        return {key: self[key] for key in self}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+
+class ProfileRecord(Record):
+    """Arama sonucu profil kaydı
+
+    title ve header, scraper'ların yaptığı gibi info'nun 1. ve 3.
+    satırından türetilir; farklı bir değer verilmişse olduğu gibi saklanır.
+    """
+
+    FIELDS = ("id", "name", "title", "url", "info", "header", "green_label", "blue_label",
+              "email", "photoUrl", "query_index")
+    INTERNED = frozenset(("title", "header", "green_label", "blue_label"))
+    __slots__ = FIELDS
+
+    def __init__(self, data: Optional[Mapping] = None):
+        super().__init__(data)
+        info = getattr(self, "info", None)
+        if type(info) is str:
+            info_lines = info.splitlines()
+            if getattr(self, "title", _MISSING) == self._title_from(info_lines):
+                self.title = _DERIVED
+            if getattr(self, "header", _MISSING) == self._header_from(info_lines):
+                self.header = _DERIVED
+
+    def __setitem__(self, key: str, value: Any):
+        if key == "info":
+            # info değişirse türetilmiş alanlar eski değerleriyle sabitlenir
+            for derived in ("title", "header"):
+                if getattr(self, derived, _MISSING) is _DERIVED:
+                    setattr(self, derived, sys.intern(self._derive(derived)))
+        super().__setitem__(key, value)
+
+    def _title_from(self, info_lines: List[str]) -> str:
+        return info_lines[0].strip() if info_lines else getattr(self, "name", "")
+
+    @staticmethod
+    def _header_from(info_lines: List[str]) -> str:
+        return info_lines[2].strip() if len(info_lines) > 2 else ""
+
+    def _derive(self, key: str) -> str:
+        info_lines = self.info.splitlines()
+        return self._title_from(info_lines) if key == "title" else self._header_from(info_lines)
+
+
+class CollaboratorRecord(Record):
+    """İşbirlikçi kaydı (info burada bölüm/üniversite satırıdır)"""
+
+    FIELDS = ("id", "name", "url", "status", "deleted", "title", "info", "green_label", "blue_label",
+              "keywords", "email", "photoUrl", "source_author_id", "weight", "query_index")
+    INTERNED = frozenset(("status", "title", "info", "green_label", "blue_label", "keywords"))
+    __slots__ = FIELDS
+
+
+RECORD_TYPES = {
+    "profiles": ProfileRecord,
+    "collaborators": CollaboratorRecord,
+}
+
+
+def make_record(kind: str, data: Mapping) -> Record:
+    """Sözlüğü kompakt kayda çevir (zaten uygun türdeyse aynen döner)"""
+    record_type = RECORD_TYPES[kind]
+    if type(data) is record_type:
+        return data
+    return record_type(data)
+
+
+def make_records(kind: str, records: Iterable[Mapping]) -> List[Record]:
+    return [make_record(kind, record) for record in records]
+
+
+def to_dicts(records: Iterable[Mapping]) -> List[Dict[str, Any]]:
+    """Tool yanıtları için düz sözlük listesi"""
+    return [record.to_dict() if isinstance(record, Record) else record for record in records]
+
+
+def json_default(value: Any) -> Any:
+    """json.dump(default=...) için: kayıtları sözlüğe çevir"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
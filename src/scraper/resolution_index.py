@@ -0,0 +1,176 @@
+"""
+Görülen tüm kişiler için yerel çözümleme indeksi: email -> authorId ve trigram ile bulanık isim araması
+"""
+import re
+import threading
+import time
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .record_index import SessionRecordIndex, record_name
+from .session_manager import SESSIONS_DIR, add_record_listener
+from ..utils.helpers import extract_author_id, turkish_ascii_fold
+
+# Sonuçlarda döndürülen kısa alanlar (tam kayıt lookup_email ile alınır)
+SUMMARY_FIELDS = ("name", "title", "header", "email", "url")
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_email(email: Optional[str]) -> str:
+    """Karşılaştırma için email: küçük harf, '[at]' yerine '@'"""
+    if not email:
+        return ""
+    return email.strip().replace("[at]", "@").lower()
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Türkçe katlanmış, yalnızca harf/rakam kelimelerinden oluşan isim"""
+    return " ".join(_NON_ALNUM.sub(" ", turkish_ascii_fold(name or "")).split())
+
+
+def name_trigrams(name: str) -> Set[str]:
+    """Kelime başına doldurulmuş trigram'lar (pg_trgm gibi: '  ad ')"""
+    grams = set()
+    for word in name.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class ResolutionIndex(SessionRecordIndex):
+    """Email ve isimden authorId çözümleyen indeks
+
+    emails: normalize email -> authorId (tam eşleşme, O(1)). İsimler
+    katlanıp tekilleştirilir; her trigram isim id'lerinin listesine işaret
+    eder. Benzerlik ortak trigram sayısı üzerinden Jaccard'dır, bu yüzden
+    noktalı/noktasız i, harf hataları ve kelime sırası farkları tolere edilir.
+    """
+
+    def __init__(self, sessions_dir: Path = SESSIONS_DIR):
+        super().__init__(sessions_dir)
+        self._emails: Dict[str, str] = {}
+        self._people: Dict[str, Dict[str, Any]] = {}
+        self._name_ids: Dict[str, int] = {}
+        self._name_gram_counts: List[int] = []
+        self._name_authors: List[List[str]] = []
+        self._grams: Dict[str, List[int]] = {}
+
+    def _add(self, session_id: str, kind: str, record: Dict):
+        """Kaydı indekse ekle (kilit altında çağrılır)"""
+        author_id = extract_author_id(record.get("url"))
+        if not author_id:
+            return
+        person = {key: value for key, value in record.items()
+                  if not (key == "photoUrl" and str(value).startswith("data:"))}
+        person.update(author_id=author_id, kind=kind, session_id=session_id, name=record_name(record))
+
+        known = self._people.get(author_id)
+        if known is None or (kind == "profiles" and known["kind"] != "profiles"):
+            if known is not None and not person.get("email"):
+                person["email"] = known.get("email", "")
+            self._people[author_id] = person
+        elif not known.get("email") and person.get("email"):
+            known["email"] = person["email"]
+
+        email = normalize_email(person.get("email"))
+        if email and "@" in email:
+            self._emails[email] = author_id
+        self._add_name(normalize_name(person["name"]), author_id)
+
+    def _add_name(self, name: str, author_id: str):
+        if not name:
+            return
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._name_authors)
+            self._name_ids[name] = name_id
+            grams = name_trigrams(name)
+            self._name_gram_counts.append(len(grams))
+            self._name_authors.append([author_id])
+            for gram in grams:
+                postings = self._grams.get(gram)
+                if postings is None:
+                    self._grams[gram] = [name_id]
+                else:
+                    postings.append(name_id)
+        elif author_id not in self._name_authors[name_id]:
+            self._name_authors[name_id].append(author_id)
+
+    def _summary(self, author_id: str) -> Dict[str, Any]:
+        person = self._people[author_id]
+        summary = {field: person.get(field) or "" for field in SUMMARY_FIELDS}
+        summary.update(author_id=author_id, kind=person["kind"], session_id=person["session_id"])
+        return summary
+
+    def lookup_email(self, email: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Email ile bilinen kişinin kaydı (yoksa None)"""
+        normalized = normalize_email(email)
+        if not normalized:
+            return None
+        with self._lock:
+            self._ensure_current()
+            author_id = self._emails.get(normalized)
+            if author_id is None:
+                return None
+            return dict(self._people[author_id])
+
+    def fuzzy_names(self, name: str, limit: int = 10, min_similarity: float = 0.3) -> Dict[str, Any]:
+        """Trigram benzerliğine göre sıralı aday kişiler"""
+        with self._lock:
+            self._ensure_current()
+            started = time.perf_counter()
+            grams = name_trigrams(normalize_name(name))
+            if not grams:
+                return {"total": 0, "results": [], "took_ms": 0.0}
+            # Ortak trigram sayıları: posting listeleri C seviyesinde sayılır
+            shared = Counter(chain.from_iterable(self._grams.get(gram, ()) for gram in grams))
+
+            query_size = len(grams)
+            counts = self._name_gram_counts
+            scored = []
+            for name_id, common in shared.items():
+                similarity = common / (query_size + counts[name_id] - common)
+                if similarity >= min_similarity:
+                    scored.append((similarity, name_id))
+            scored.sort(key=lambda item: (-item[0], item[1]))
+
+            # Özetler yalnızca döndürülen adaylar için kurulur
+            results = []
+            for similarity, name_id in scored:
+                if len(results) >= limit:
+                    break
+                for author_id in self._name_authors[name_id][:limit - len(results)]:
+                    results.append(dict(self._summary(author_id), similarity=round(similarity, 4)))
+            return {
+                "total": sum(len(self._name_authors[name_id]) for _, name_id in scored),
+                "results": results,
+                "took_ms": round((time.perf_counter() - started) * 1000, 3),
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._ensure_current()
+            return {
+                "people": len(self._people),
+                "emails": len(self._emails),
+                "names": len(self._name_authors),
+                "trigrams": len(self._grams),
+                "last_scan_seconds": self.last_scan_seconds,
+            }
+
+
+_resolution_index: Optional[ResolutionIndex] = None
+_resolution_index_lock = threading.Lock()
+
+
+def get_resolution_index() -> ResolutionIndex:
+    """Process genelindeki çözümleme indeksini getir (yeni kayıtları dinler)"""
+    global _resolution_index
+    with _resolution_index_lock:
+        if _resolution_index is None:
+            _resolution_index = ResolutionIndex()
+            add_record_listener(_resolution_index.on_record)
+        return _resolution_index
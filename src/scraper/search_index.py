@@ -0,0 +1,351 @@
+"""
+Kayıtlı profiller üzerinde Türkçe normalize edilmiş tam metin indeksi (BM25)
+"""
+import heapq
+import math
+import re
+import threading
+import time
+from bisect import bisect_left
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .record_index import SessionRecordIndex, record_name
+from .session_manager import SESSIONS_DIR, add_record_listener
+from ..utils.helpers import extract_author_id, parse_labels_and_keywords, turkish_ascii_fold
+from ..utils.taxonomy import ProfileFilter
+
+# Alan -> BM25 ağırlığı (terim frekansı bu ağırlıkla sayılır)
+FIELD_WEIGHTS = (
+    ("name", 3.0),
+    ("green_label", 2.0),
+    ("blue_label", 2.0),
+    ("keywords", 2.0),
+    ("title", 1.0),
+    ("header", 1.0),
+)
+
+# Sonuçta döndürülen alanlar (info / photoUrl gibi büyük alanlar tutulmaz)
+STORED_FIELDS = ("name", "title", "header", "green_label", "blue_label", "email", "url")
+
+OPERATORS = {"AND": "AND", "VE": "AND", "OR": "OR", "VEYA": "OR", "NOT": "NOT", "DEĞİL": "NOT"}
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"[^"]*"|\(|\)|[^\s()]+')
+_MAX_PREFIX_TERMS = 100
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Türkçe casefold + aksan katlama sonrası kelimeler"""
+    return _TOKEN_RE.findall(turkish_ascii_fold(text))
+
+
+def document_fields(record: Dict) -> Dict[str, str]:
+    """Profil / işbirlikçi kaydından indekslenecek metin alanları"""
+    info_lines = (record.get("info") or "").splitlines()
+    fields = {
+        "name": record_name(record, info_lines),
+        "title": record.get("title") or "",
+        # İşbirlikçi kayıtlarında kurum yolu info alanında durur
+        "header": record.get("header") or (info_lines[0] if len(info_lines) == 1 else ""),
+        "green_label": record.get("green_label") or "",
+        "blue_label": record.get("blue_label") or "",
+        "keywords": record.get("keywords") or "",
+    }
+    if not fields["keywords"] and len(info_lines) > 3:
+        # Profil kutucuğunun son satırı: "alan   uzmanlık anahtar ; kelimeler"
+        _, blue_label, keywords = parse_labels_and_keywords(info_lines[-1])
+        keywords = [keyword for keyword in keywords if keyword != "-"]
+        if fields["blue_label"] and blue_label.startswith(fields["blue_label"]):
+            keywords.insert(0, blue_label[len(fields["blue_label"]):])
+        fields["keywords"] = " ; ".join(keywords)
+    return fields
+
+
+class Query:
+    """Sorgu ifadesi ayrıştırıcısı
+
+    Dilbilgisi: ifade := ve ("OR" ve)* ; ve := tekli (["AND"] tekli)* ;
+    tekli := ("NOT" | "-") tekli | "(" ifade ")" | "ifade" | kelime[*]
+    Düğümler ("term", t), ("prefix", p), ("phrase", [t...]), ("and", [...]),
+    ("or", [...]), ("not", düğüm) demetleridir.
+    """
+
+    def __init__(self, text: str):
+        self.tokens = _QUERY_RE.findall(text or "")
+        self.position = 0
+        self.tree = self._expression() if self.tokens else None
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _expression(self):
+        children = [self._conjunction()]
+        while OPERATORS.get(self._peek()) == "OR":
+            self.position += 1
+            children.append(self._conjunction())
+        children = [child for child in children if child is not None]
+        return children[0] if len(children) == 1 else ("or", children) if children else None
+
+    def _conjunction(self):
+        children = []
+        while True:
+            token = self._peek()
+            if token is None or token == ")" or OPERATORS.get(token) == "OR":
+                break
+            if OPERATORS.get(token) == "AND":
+                self.position += 1
+                continue
+            child = self._unary()
+            if child is not None:
+                children.append(child)
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def _unary(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        if OPERATORS.get(token) == "NOT":
+            child = self._unary() if self._peek() not in (None, ")") else None
+            return ("not", child) if child is not None else None
+        if token.startswith("-") and len(token) > 1:
+            child = self._word(token[1:])
+            return ("not", child) if child is not None else None
+        if token == "(":
+            child = self._expression()
+            if self._peek() == ")":
+                self.position += 1
+            return child
+        if token == ")":
+            return None
+        if token.startswith('"'):
+            words = tokenize(token.strip('"'))
+            if not words:
+                return None
+            return ("phrase", words) if len(words) > 1 else ("term", words[0])
+        return self._word(token)
+
+    @staticmethod
+    def _word(token: str):
+        prefix = token.endswith("*")
+        words = tokenize(token.rstrip("*"))
+        if not words:
+            return None
+        if len(words) > 1:
+            # "Sosyal-Beşeri" gibi birleşik kelimeler öbek olarak aranır
+            return ("phrase", words)
+        return ("prefix", words[0]) if prefix else ("term", words[0])
+
+
+class ProfileSearchIndex(SessionRecordIndex):
+    """authorId ile tekilleştirilmiş profil / işbirlikçi belgeleri üzerinde ters indeks
+
+    postings: terim -> {belge: ağırlıklı frekans}. Öbek sorguları için her
+    belgenin alan bazında kelime dizileri tutulur. Aynı kişi birden çok
+    session'da geçerse daha fazla metin içeren kayıt kullanılır.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, sessions_dir: Path = SESSIONS_DIR):
+        super().__init__(sessions_dir)
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._docs: List[Optional[Dict[str, Any]]] = []
+        self._doc_tokens: List[Tuple[Tuple[str, ...], ...]] = []
+        self._doc_length: List[float] = []
+        self._by_author: Dict[str, int] = {}
+        self._total_length = 0.0
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = True
+
+    @property
+    def document_count(self) -> int:
+        return len(self._by_author)
+
+    def _add(self, session_id: str, kind: str, record: Dict):
+        """Kaydı indekse ekle (kilit altında çağrılır)"""
+        author_id = extract_author_id(record.get("url"))
+        if not author_id:
+            # Silinmiş / linksiz işbirlikçilerin kimliği yok
+            return
+        fields = document_fields(record)
+        tokens = tuple(tuple(tokenize(fields[field])) for field, _ in FIELD_WEIGHTS)
+        frequencies: Dict[str, float] = {}
+        for (field, weight), field_tokens in zip(FIELD_WEIGHTS, tokens):
+            for token in field_tokens:
+                frequencies[token] = frequencies.get(token, 0.0) + weight
+        length = sum(frequencies.values())
+
+        doc = self._by_author.get(author_id)
+        if doc is not None:
+            if length <= self._doc_length[doc]:
+                return
+            self._remove(doc)
+        else:
+            doc = len(self._docs)
+            self._by_author[author_id] = doc
+            self._docs.append(None)
+            self._doc_tokens.append(())
+            self._doc_length.append(0.0)
+
+        stored = {field: fields.get(field) or record.get(field) or "" for field in STORED_FIELDS}
+        stored.update(author_id=author_id, kind=kind, session_id=session_id)
+        self._docs[doc] = stored
+        self._doc_tokens[doc] = tokens
+        self._doc_length[doc] = length
+        self._total_length += length
+        for token, frequency in frequencies.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = postings = {}
+                self._vocabulary_dirty = True
+            postings[doc] = frequency
+
+    def _remove(self, doc: int):
+        for token in {token for field_tokens in self._doc_tokens[doc] for token in field_tokens}:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc, None)
+        self._total_length -= self._doc_length[doc]
+
+    def _matching_terms(self, node) -> List[str]:
+        """Düğümün indeksteki terimleri (önek için sözlük araması)"""
+        if node[0] == "term":
+            return [node[1]] if node[1] in self._postings else []
+        if node[0] == "phrase":
+            return [term for term in node[1] if term in self._postings]
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(term for term, postings in self._postings.items() if postings)
+            self._vocabulary_dirty = False
+        terms = []
+        index = bisect_left(self._vocabulary, node[1])
+        while (index < len(self._vocabulary) and self._vocabulary[index].startswith(node[1])
+               and len(terms) < _MAX_PREFIX_TERMS):
+            terms.append(self._vocabulary[index])
+            index += 1
+        return terms
+
+    def _has_phrase(self, doc: int, phrase: List[str]) -> bool:
+        size = len(phrase)
+        for field_tokens in self._doc_tokens[doc]:
+            for start in range(len(field_tokens) - size + 1):
+                if list(field_tokens[start:start + size]) == phrase:
+                    return True
+        return False
+
+    def _evaluate(self, node, scoring: List[str]) -> Set[int]:
+        """Düğümü belge kümesine çevir; puanlanacak terimleri scoring'e ekle"""
+        kind = node[0]
+        if kind in ("term", "prefix"):
+            terms = self._matching_terms(node)
+            scoring.extend(terms)
+            docs: Set[int] = set()
+            for term in terms:
+                docs.update(self._postings[term])
+            return docs
+        if kind == "phrase":
+            terms = node[1]
+            if any(term not in self._postings for term in terms):
+                return set()
+            scoring.extend(terms)
+            ordered = sorted(terms, key=lambda term: len(self._postings[term]))
+            docs = set(self._postings[ordered[0]])
+            for term in ordered[1:]:
+                docs.intersection_update(self._postings[term])
+            return {doc for doc in docs if self._has_phrase(doc, terms)}
+        if kind == "or":
+            docs = set()
+            for child in node[1]:
+                docs |= self._evaluate(child, scoring)
+            return docs
+        if kind == "not":
+            return self._all_docs() - self._evaluate(node[1], [])
+        # and: önce pozitif çocuklar, sonra NOT'lar çıkarılır
+        positives = [child for child in node[1] if child[0] != "not"]
+        negatives = [child[1] for child in node[1] if child[0] == "not"]
+        if positives:
+            docs = None
+            for child in positives:
+                child_docs = self._evaluate(child, scoring)
+                docs = child_docs if docs is None else docs & child_docs
+                if not docs:
+                    return set()
+        else:
+            docs = self._all_docs()
+        for child in negatives:
+            docs -= self._evaluate(child, [])
+        return docs
+
+    def _all_docs(self) -> Set[int]:
+        return set(self._by_author.values())
+
+    def _score(self, docs: Set[int], terms: List[str]) -> Dict[int, float]:
+        """BM25 puanları"""
+        scores = dict.fromkeys(docs, 0.0)
+        total_docs = len(self._by_author)
+        average_length = self._total_length / total_docs if total_docs else 1.0
+        base = self.K1 * (1 - self.B)
+        scale = self.K1 * self.B / (average_length or 1.0)
+        lengths = self._doc_length
+        for term in set(terms):
+            postings = self._postings.get(term) or {}
+            frequency_docs = len(postings)
+            if not frequency_docs:
+                continue
+            idf = math.log(1 + (total_docs - frequency_docs + 0.5) / (frequency_docs + 0.5))
+            weight = idf * (self.K1 + 1)
+            if len(docs) < frequency_docs:
+                matches = ((doc, postings[doc]) for doc in docs if doc in postings)
+            else:
+                matches = ((doc, frequency) for doc, frequency in postings.items() if doc in docs)
+            for doc, frequency in matches:
+                scores[doc] += weight * frequency / (frequency + base + scale * lengths[doc])
+        return scores
+
+    def search(self, text: str, limit: int = 20, offset: int = 0,
+               profile_filter: Optional[ProfileFilter] = None) -> Dict[str, Any]:
+        """Sorguyu çalıştır, BM25'e göre sıralı sonuçları döndür"""
+        with self._lock:
+            self._ensure_current()
+            started = time.perf_counter()
+            tree = Query(text).tree
+            if tree is None:
+                return {"total": 0, "results": [], "took_ms": 0.0}
+            scoring: List[str] = []
+            docs = self._evaluate(tree, scoring)
+            if profile_filter is not None and not profile_filter.accepts_all:
+                docs = {doc for doc in docs if profile_filter.matches(self._docs[doc])}
+            scores = self._score(docs, scoring)
+            ranked = heapq.nlargest(offset + limit, scores.items(), key=itemgetter(1))
+            results = [dict(self._docs[doc], score=round(score, 4)) for doc, score in ranked[offset:]]
+            return {
+                "total": len(docs),
+                "results": results,
+                "took_ms": round((time.perf_counter() - started) * 1000, 3),
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._ensure_current()
+            return {
+                "documents": len(self._by_author),
+                "terms": sum(1 for postings in self._postings.values() if postings),
+                "last_scan_seconds": self.last_scan_seconds,
+            }
+
+
+_search_index: Optional[ProfileSearchIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index() -> ProfileSearchIndex:
+    """Process genelindeki arama indeksini getir (yeni kayıtları dinler)"""
+    global _search_index
+    with _search_index_lock:
+        if _search_index is None:
+            _search_index = ProfileSearchIndex()
+            add_record_listener(_search_index.on_record)
+        return _search_index
@@ -1,18 +1,239 @@
 """
 Session yönetimi
 """
+import atexit
+import base64
 import json
+import os
+import sys
 import time
 import threading
+from collections import OrderedDict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .records import Record, json_default, make_record
+from ..utils.helpers import get_setting
+from ..utils.metrics import StageStats, count, get_metrics, span
+
+SESSIONS_DIR = Path(__file__).parent.parent.parent / "sessions"
+
+# Kayıt türü -> (append-only log, sıkıştırılmış JSON)
+RECORD_FILES = {
+    "profiles": ("profiles.jsonl", "profiles.json"),
+    "collaborators": ("collaborators.jsonl", "collaborators.json"),
+}
+
+
+def _write_json_atomic(path: Path, data: Any):
+    """JSON dosyasını geçici dosya + rename ile atomik yaz"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, default=json_default)
+    os.replace(tmp_path, path)
+
+
+def is_valid_session_id(session_id: Optional[str]) -> bool:
+    """Session ID'si tek bir dizin adı olmalı (path traversal'a karşı)"""
+    return bool(session_id) and session_id not in (".", "..") and Path(session_id).name == session_id
+
+
+def read_session_state(session_id: str, sessions_dir: Optional[Path] = None) -> Optional[Dict]:
+    """Diskteki session.json içeriği (yoksa None)"""
+    if not is_valid_session_id(session_id):
+        return None
+    state_path = (sessions_dir or SESSIONS_DIR) / session_id / "session.json"
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+# Kaldığı yerden devam için checkpoint dosyası ve set olarak tutulan alanları
+CHECKPOINT_FILE = "checkpoint.json"
+# Bu durumdaki session'lar bitmiştir; reaper yalnızca bunları bellekten atar
+TERMINAL_STATUSES = ("completed", "error")
+CHECKPOINT_SET_FIELDS = ("seen_author_ids", "completed_indices", "expanded_ids")
+
+
+def read_checkpoint(session_id: str, sessions_dir: Optional[Path] = None) -> Dict:
+    """Diskteki checkpoint.json (yoksa boş sözlük)"""
+    if not is_valid_session_id(session_id):
+        return {}
+    checkpoint_path = (sessions_dir or SESSIONS_DIR) / session_id / CHECKPOINT_FILE
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    for field in CHECKPOINT_SET_FIELDS:
+        checkpoint[field] = set(checkpoint.get(field) or [])
+    return checkpoint
+
+
+def iter_session_records(session_id: str, kind: str, sessions_dir: Optional[Path] = None) -> Iterator[Dict]:
+    """Session kayıtlarını dosyanın tamamını belleğe almadan sırayla oku"""
+    log_name, json_name = RECORD_FILES[kind]
+    session_dir = (sessions_dir or SESSIONS_DIR) / session_id
+    log_path = session_dir / log_name
+    if log_path.exists():
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Yarım yazılmış son satır (çökme sonrası)
+                    continue
+        return
+    
+    # Eski session'lar: sadece sıkıştırılmış JSON var
+    json_path = session_dir / json_name
+    if json_path.exists():
+        with open(json_path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+
+
+# Session bitince (progress 100) çağrılan dinleyiciler: fn(session)
+_finish_listeners: List[Callable[["AcademicScrapingSession"], None]] = []
+# Kayıt eklenince çağrılan dinleyiciler: fn(session, kind, record)
+_record_listeners: List[Callable[["AcademicScrapingSession", str, Dict], None]] = []
+
+
+def add_finish_listener(listener: Callable[["AcademicScrapingSession"], None]):
+    """Session tamamlandığında çağrılacak fonksiyonu kaydet (hızlı olmalı)"""
+    _finish_listeners.append(listener)
+
+
+def add_record_listener(listener: Callable[["AcademicScrapingSession", str, Dict], None]):
+    """add_profile / add_collaborator sonrası çağrılacak fonksiyonu kaydet (hızlı olmalı)"""
+    _record_listeners.append(listener)
+
+
+def _notify_finished(session: "AcademicScrapingSession"):
+    for listener in list(_finish_listeners):
+        try:
+            listener(session)
+        except Exception as e:
+            print(f"⚠️ Session dinleyicisi hatası: {e}", file=sys.stderr)
+
+
+def _notify_record(session: "AcademicScrapingSession", kind: str, record: Dict):
+    for listener in list(_record_listeners):
+        try:
+            listener(session, kind, record)
+        except Exception as e:
+            print(f"⚠️ Kayıt dinleyicisi hatası: {e}", file=sys.stderr)
+
+
+def session_dirs(sessions_dir: Optional[Path] = None) -> Iterator[Path]:
+    """Tüm session dizinleri (toplu aramaların sorgu alt session'ları dahil)"""
+    sessions_dir = sessions_dir or SESSIONS_DIR
+    if not sessions_dir.exists():
+        return
+    for session_dir in sorted(sessions_dir.iterdir()):
+        if not session_dir.is_dir():
+            continue
+        yield session_dir
+        queries_dir = session_dir / "queries"
+        if queries_dir.is_dir():
+            yield from sorted(child for child in queries_dir.iterdir() if child.is_dir())
+
+
+class SessionStateWriter:
+    """session.json için birleştirici arka plan yazıcısı
+    
+    Her dosya için sadece en son snapshot tutulur; yazımlar en fazla
+    flush_interval'de bir yapılır, acil (urgent) istekler beklemeden yazılır.
+    """
+    
+    def __init__(self, flush_interval: float = 0.5):
+        self.flush_interval = flush_interval
+        self._pending: Dict[Path, Dict] = {}
+        self._urgent = False
+        self._writing = False
+        self._last_flush = 0.0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+        self.submitted = 0
+    
+    def submit(self, path: Path, snapshot: Dict, urgent: bool = False):
+        """Snapshot'ı yazım kuyruğuna koy (aynı dosyanın eski snapshot'ını ezer)"""
+        with self._cond:
+            self._pending[path] = snapshot
+            self.submitted += 1
+            if urgent:
+                self._urgent = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="session-state-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Bekleyen tüm snapshot'lar diske yazılana kadar bekle"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._urgent = True
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # Acil değilse snapshot'ların birikmesi için bekle
+                deadline = self._last_flush + self.flush_interval
+                while not self._urgent and time.monotonic() < deadline:
+                    self._cond.wait(deadline - time.monotonic())
+                batch, self._pending = self._pending, {}
+                self._urgent = False
+                self._writing = True
+            
+            for path, snapshot in batch.items():
+                try:
+                    with span("state_write"):
+                        _write_json_atomic(path, snapshot)
+                except Exception as e:
+                    print(f"⚠️ Session durumu yazılamadı ({path}): {e}", file=sys.stderr)
+            
+            with self._cond:
+                self.writes += len(batch)
+                self._last_flush = time.monotonic()
+                self._writing = False
+                self._cond.notify_all()
+
+
+_state_writer: Optional[SessionStateWriter] = None
+_state_writer_lock = threading.Lock()
+
+
+def get_state_writer() -> SessionStateWriter:
+    """Process genelindeki session durum yazıcısını getir"""
+    global _state_writer
+    with _state_writer_lock:
+        if _state_writer is None:
+            interval_ms = get_setting("session.state_flush_interval_ms", 500)
+            _state_writer = SessionStateWriter(flush_interval=interval_ms / 1000)
+            atexit.register(_state_writer.flush, 5)
+        return _state_writer
 
 
 class AcademicScrapingSession:
     """Akademik scraping session yöneticisi"""
     
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, sessions_dir: Optional[Path] = None):
         self.session_id = session_id
         self.status = "initialized"
         self.progress = 0
@@ -23,45 +244,189 @@ class AcademicScrapingSession:
         self.start_time = time.time()
         self.last_update = None
         self.last_update_time = time.time()
-        self.base_dir = Path(__file__).parent.parent.parent / "sessions" / session_id
+        self.finished_at: Optional[float] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Aşama adı -> süre istatistikleri (utils.metrics.span ile doldurulur)
+        self.spans: Dict[str, StageStats] = {}
+        self.base_dir = (sessions_dir or SESSIONS_DIR) / session_id
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.compact_every = get_setting("session.compact_every", 50)
+        self._pending_compaction = {kind: 0 for kind in RECORD_FILES}
+        self.checkpoint: Dict[str, Any] = {}
+        # Toplu aramalarda (scrape_many_profiles) canlı istatistikler
+        self.batch: Optional[Dict[str, Any]] = None
+        # Ağ taramalarında (crawl_collaboration_network) canlı istatistikler
+        self.crawl: Optional[Dict[str, Any]] = None
+    
+    def start_checkpoint(self, query: Dict):
+        """Yeni scraping için checkpoint'i sıfırla"""
+        self.checkpoint = {
+            "query": query,
+            "stage": "profiles",
+            "page": 1,
+            "profile_count": 0,
+            "seen_author_ids": set(),
+            "target_profile": None,
+            "collaborators": None,
+            "completed_indices": set(),
+        }
+        self.update_checkpoint(urgent=True)
+    
+    def update_checkpoint(self, urgent: bool = False, **changes):
+        """Checkpoint'i güncelle; dosya arka plan yazıcısı ile birleştirilerek yazılır"""
+        if not self.checkpoint:
+            return
+        self.checkpoint.update(changes)
+        self.checkpoint["updated_at"] = time.time()
+        snapshot = {
+            key: sorted(value) if key in CHECKPOINT_SET_FIELDS else value
+            for key, value in self.checkpoint.items()
+        }
+        get_state_writer().submit(self.base_dir / CHECKPOINT_FILE, snapshot, urgent=urgent)
+    
+    @property
+    def resumable(self) -> bool:
+        """Yarım kalmış ve devam ettirilebilir mi"""
+        return bool(self.checkpoint.get("query")) and self.checkpoint.get("stage") != "done"
         
-    def update_progress(self, progress: int, step: str, data: Any = None):
-        """Progress güncelleme"""
+    def update_progress(self, progress: int, step: str, data: Any = None, stage: bool = True):
+        """Progress güncelleme - bellekte hemen, diske arka planda"""
         self.progress = progress
         self.current_step = step
-        self.status = "running" if progress < 100 else "completed"
+        if self.status != "error":
+            self.status = "running" if progress < 100 else "completed"
+        finished = progress >= 100 and self.finished_at is None
+        if progress >= 100:
+            self.finished_at = time.time()
         
-        # Session dosyasına yaz
-        session_data = {
+        # Session dosyası arka plan yazıcısına bırakılır; aşama geçişleri
+        # hemen, profil başına güncellemeler birleştirilerek yazılır
+        get_state_writer().submit(self.base_dir / "session.json", self.snapshot(), urgent=stage)
+        if finished:
+            _notify_finished(self)
+    
+    def snapshot(self) -> Dict:
+        """session.json içeriği"""
+        return {
             "session_id": self.session_id,
             "status": self.status,
             "progress": self.progress,
             "current_step": self.current_step,
             "profiles_count": len(self.profiles),
             "collaborators_count": len(self.collaborators),
+            "error_message": self.error_message,
             "start_time": self.start_time,
+            "finished_at": self.finished_at,
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses
+            },
+            "spans": get_metrics().session_spans(self),
             "last_update": time.time()
         }
+    
+    @classmethod
+    def load(cls, session_id: str, sessions_dir: Optional[Path] = None) -> Optional["AcademicScrapingSession"]:
+        """Diskteki session dizininden session'ı geri yükle"""
+        state = read_session_state(session_id, sessions_dir)
+        if state is None:
+            return None
+        session = cls(session_id, sessions_dir)
+        session.status = state.get("status", "completed")
+        session.progress = state.get("progress", 100)
+        session.current_step = state.get("current_step", "")
+        session.error_message = state.get("error_message", "")
+        session.start_time = state.get("start_time", session.start_time)
+        session.last_update_time = state.get("last_update", session.last_update_time)
+        interrupted = session.status not in TERMINAL_STATUSES
+        if interrupted:
+            # Çalışıyor / sırada iken kaydedilmiş ama bu process'te çalışmıyor (ör. server çöktü)
+            session.status = "error"
+            session.error_message = session.error_message or "Scraping yarıda kesildi (server yeniden başlatıldı)"
+        # Geri yüklenen (artık bitmiş) session reaper için yeniden zaman aşımı süresi kazanır
+        session.finished_at = time.time()
+        cache = state.get("cache") or {}
+        session.cache_hits = cache.get("hits", 0)
+        session.cache_misses = cache.get("misses", 0)
+        session.spans = {stage: StageStats.from_dict(stats) for stage, stats in (state.get("spans") or {}).items()}
+        session.profiles = [make_record("profiles", record)
+                            for record in iter_session_records(session_id, "profiles", sessions_dir)]
+        session.collaborators = [make_record("collaborators", record)
+                                 for record in iter_session_records(session_id, "collaborators", sessions_dir)]
+        session.checkpoint = read_checkpoint(session_id, sessions_dir)
+        if interrupted:
+            get_state_writer().submit(session.base_dir / "session.json", session.snapshot(), urgent=True)
+        return session
+
+    def mark_failed(self, message: str):
+        """Session'ı hata ile bitir (ör. sırada beklerken iptal edildi)"""
+        self.status = "error"
+        self.error_message = message
+        if self.finished_at is None:
+            self.finished_at = time.time()
+        get_state_writer().submit(self.base_dir / "session.json", self.snapshot(), urgent=True)
+    
+    def summary(self) -> Dict:
+        """Bellekten atılan session için tutulan küçük özet"""
+        return {
+            "session_id": self.session_id,
+            "status": self.status,
+            "progress": self.progress,
+            "current_step": self.current_step,
+            "profiles_count": len(self.profiles),
+            "collaborators_count": len(self.collaborators),
+            "error_message": self.error_message,
+            "start_time": self.start_time,
+            "finished_at": self.finished_at,
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses
+            },
+            "spans": get_metrics().session_spans(self)
+        }
+    
+    def _append_record(self, kind: str, record: Dict):
+        """Kaydı append-only log'a tek satır olarak ekle"""
+        log_name, _ = RECORD_FILES[kind]
+        with span("record_write", self), open(self.base_dir / log_name, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
         
-        with open(self.base_dir / "session.json", "w", encoding="utf-8") as f:
-            json.dump(session_data, f, ensure_ascii=False, indent=2)
+        # Periyodik sıkıştırma (mevcut JSON okuyucuları için)
+        self._pending_compaction[kind] += 1
+        if self.compact_every and self._pending_compaction[kind] >= self.compact_every:
+            self.compact(kind)
+    
+    def compact(self, kind: Optional[str] = None, urgent: bool = False):
+        """Log'daki kayıtları profiles.json / collaborators.json'a yaz"""
+        for record_kind in ([kind] if kind else list(RECORD_FILES)):
+            if not self._pending_compaction[record_kind]:
+                continue
+            records = self.profiles if record_kind == "profiles" else self.collaborators
+            _, json_name = RECORD_FILES[record_kind]
+            # Serileştirme de arka plan yazıcısında yapılır (listenin kopyası ile)
+            with span("compaction", self):
+                get_state_writer().submit(self.base_dir / json_name, list(records), urgent=urgent)
+            self._pending_compaction[record_kind] = 0
+    
+    def finalize(self):
+        """Session bitti: bekleyen kayıtları sıkıştır"""
+        self.compact(urgent=True)
     
     def add_profile(self, profile: Dict):
-        """Profil ekle ve kaydet"""
-        self.profiles.append(profile)
-        
-        # Profiles dosyasını güncelle
-        with open(self.base_dir / "profiles.json", "w", encoding="utf-8") as f:
-            json.dump(self.profiles, f, ensure_ascii=False, indent=2)
+        """Profil ekle ve kaydet (bellekte kompakt kayıt olarak)"""
+        self.profiles.append(make_record("profiles", profile))
+        self._append_record("profiles", profile)
+        count("profiles_added")
+        _notify_record(self, "profiles", profile)
     
     def add_collaborator(self, collaborator: Dict):
-        """İşbirlikçi ekle ve kaydet"""
-        self.collaborators.append(collaborator)
-        
-        # Collaborators dosyasını güncelle
-        with open(self.base_dir / "collaborators.json", "w", encoding="utf-8") as f:
-            json.dump(self.collaborators, f, ensure_ascii=False, indent=2)
+        """İşbirlikçi ekle ve kaydet (bellekte kompakt kayıt olarak)"""
+        self.collaborators.append(make_record("collaborators", collaborator))
+        self._append_record("collaborators", collaborator)
+        count("collaborators_added")
+        _notify_record(self, "collaborators", collaborator)
     
     def get_status(self) -> Dict:
         """Session durumunu döndür"""
@@ -76,7 +441,20 @@ class AcademicScrapingSession:
             "start_time": self.start_time,
             "elapsed_time": time.time() - self.start_time,
             "last_update": self.last_update,
-            "last_update_time": self.last_update_time
+            "last_update_time": self.last_update_time,
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses
+            },
+            "spans": get_metrics().session_spans(self),
+            "checkpoint": {
+                "stage": self.checkpoint.get("stage"),
+                "page": self.checkpoint.get("page"),
+                "collaborators_done": len(self.checkpoint.get("completed_indices") or ()),
+                "resumable": self.resumable
+            } if self.checkpoint else None,
+            "batch": self.batch,
+            "crawl": self.crawl
         }
 
 
@@ -84,19 +462,62 @@ class AcademicScrapingSession:
 active_sessions = {}
 session_lock = threading.Lock()
 
+# Bellekten atılmış (diskte duran) session'ların özetleri
+archived_sessions: "OrderedDict[str, Dict]" = OrderedDict()
+
 
 def create_session(session_id: str) -> AcademicScrapingSession:
     """Yeni session oluştur"""
     with session_lock:
         session = AcademicScrapingSession(session_id)
         active_sessions[session_id] = session
+        archived_sessions.pop(session_id, None)
+        return session
+
+
+def get_or_create_session(session_id: str) -> AcademicScrapingSession:
+    """Kayıtlı session'ı getir, yoksa oluştur"""
+    with session_lock:
+        session = active_sessions.get(session_id)
+        if session is None:
+            session = AcademicScrapingSession(session_id)
+            active_sessions[session_id] = session
+            archived_sessions.pop(session_id, None)
         return session
 
 
 def get_session(session_id: str) -> Optional[AcademicScrapingSession]:
-    """Session getir"""
+    """Session getir - bellekte yoksa diskten geri yüklenir"""
+    with session_lock:
+        session = active_sessions.get(session_id)
+    if session is not None:
+        return session
+    
+    loaded = AcademicScrapingSession.load(session_id)
+    if loaded is None:
+        return None
+    with session_lock:
+        # Bu arada başka bir çağrı yüklemiş olabilir
+        session = active_sessions.setdefault(session_id, loaded)
+        archived_sessions.pop(session_id, None)
+        return session
+
+
+def get_session_summary(session_id: str) -> Optional[Dict]:
+    """Session durumunu kayıtları belleğe yüklemeden döndür"""
     with session_lock:
-        return active_sessions.get(session_id)
+        session = active_sessions.get(session_id)
+        if session is not None:
+            return session.get_status()
+        summary = archived_sessions.get(session_id)
+        if summary is not None:
+            return dict(summary, archived=True)
+    
+    state = read_session_state(session_id)
+    if state is None:
+        return None
+    state.pop("last_update", None)
+    return dict(state, archived=True)
 
 
 def remove_session(session_id: str):
@@ -104,12 +525,95 @@ def remove_session(session_id: str):
     with session_lock:
         if session_id in active_sessions:
             del active_sessions[session_id]
+        archived_sessions.pop(session_id, None)
+
+
+def evict_session(session_id: str) -> bool:
+    """Session'ı bellekten at, sadece özetini tut (veriler diskte kalır)"""
+    max_summaries = get_setting("session.max_archived_summaries", 10000)
+    with session_lock:
+        session = active_sessions.pop(session_id, None)
+        if session is None:
+            return False
+        archived_sessions[session_id] = session.summary()
+        archived_sessions.move_to_end(session_id)
+        # Özet sayısı da sınırlı; en eskiler yine diskten okunabilir
+        while len(archived_sessions) > max_summaries:
+            archived_sessions.popitem(last=False)
+    session.finalize()
+    return True
+
+
+def reap_sessions(timeout: Optional[float] = None, now: Optional[float] = None) -> int:
+    """Zaman aşımına uğramış bitmiş session'ları bellekten at"""
+    timeout = get_setting("session.session_timeout", 7200) if timeout is None else timeout
+    now = time.time() if now is None else now
+    with session_lock:
+        expired = [
+            session_id for session_id, session in active_sessions.items()
+            if session.status in TERMINAL_STATUSES
+            and session.finished_at is not None
+            and now - session.finished_at >= timeout
+        ]
+    return sum(1 for session_id in expired if evict_session(session_id))
+
+
+class SessionReaper:
+    """Bitmiş session'ları periyodik olarak bellekten atan arka plan thread'i"""
+    
+    def __init__(self, interval: float, timeout: float):
+        self.interval = interval
+        self.timeout = timeout
+        self.evicted = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="session-reaper", daemon=True)
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                evicted = reap_sessions(self.timeout)
+                if evicted:
+                    self.evicted += evicted
+                    print(f"🧹 {evicted} session bellekten atıldı", file=sys.stderr)
+            except Exception as e:
+                print(f"⚠️ Session temizleme hatası: {e}", file=sys.stderr)
+
+
+_reaper: Optional[SessionReaper] = None
+
+
+def start_session_reaper() -> SessionReaper:
+    """session.cleanup_interval / session_timeout ile reaper'ı başlat (bir kez)"""
+    global _reaper
+    with session_lock:
+        if _reaper is None:
+            _reaper = SessionReaper(
+                interval=get_setting("session.cleanup_interval", 3600),
+                timeout=get_setting("session.session_timeout", 7200),
+            )
+            _reaper.start()
+        return _reaper
+
+
+def stop_session_reaper():
+    """Reaper thread'ini durdur"""
+    global _reaper
+    with session_lock:
+        reaper, _reaper = _reaper, None
+    if reaper:
+        reaper.stop()
 
 
 def list_sessions() -> List[Dict]:
-    """Aktif session'ları listele"""
+    """Aktif ve bellekten atılmış session'ları listele"""
     with session_lock:
-        return [
+        sessions = [
             {
                 "session_id": session_id,
                 "status": session.status,
@@ -118,4 +622,132 @@ def list_sessions() -> List[Dict]:
                 "collaborators_count": len(session.collaborators)
             }
             for session_id, session in active_sessions.items()
-        ] 
\ No newline at end of file
+        ]
+        sessions.extend(
+            {
+                "session_id": session_id,
+                "status": summary["status"],
+                "progress": summary["progress"],
+                "profiles_count": summary["profiles_count"],
+                "collaborators_count": summary["collaborators_count"],
+                "archived": True
+            }
+            for session_id, summary in archived_sessions.items()
+        )
+        return sessions
+
+
+# Sonuç sayfalarında varsayılan olarak atlanabilecek büyük alanlar
+HEAVY_FIELDS = ("info", "photoUrl")
+
+
+def session_records(session_id: str, kind: str) -> Iterator[Dict]:
+    """Kayıtları bellekteki session'dan, yoksa diskten (yüklemeden) sırayla oku"""
+    with session_lock:
+        session = active_sessions.get(session_id)
+        if session is not None:
+            records = session.profiles if kind == "profiles" else session.collaborators
+            # Scraping sürerken liste büyüyebilir: o anki uzunluk kadar oku
+            return iter(records[:len(records)])
+    if not is_valid_session_id(session_id):
+        return iter(())
+    return iter_session_records(session_id, kind)
+
+
+def encode_cursor(offsets: Dict[str, int]) -> str:
+    """Sayfa konumunu (tür başına offset) opak cursor'a çevir"""
+    raw = json.dumps([offsets.get("profiles", 0), offsets.get("collaborators", 0)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, int]:
+    """encode_cursor'ın tersi; geçersiz cursor için ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        profiles, collaborators = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offsets = {"profiles": int(profiles), "collaborators": int(collaborators)}
+    except Exception:
+        raise ValueError("Geçersiz cursor")
+    if min(offsets.values()) < 0:
+        raise ValueError("Geçersiz cursor")
+    return offsets
+
+
+def project_record(record: Dict, fields: Optional[List[str]] = None, omit_heavy: bool = False) -> Dict:
+    """Kaydın istenen alanlarını düz sözlük olarak döndür"""
+    if fields:
+        record = {key: record[key] for key in fields if key in record}
+    if omit_heavy:
+        record = {key: value for key, value in record.items() if key not in HEAVY_FIELDS}
+    return record.to_dict() if isinstance(record, Record) else record
+
+
+def read_results_page(session_id: str, kinds: Optional[List[str]] = None,
+                      offset: int = 0, limit: Optional[int] = None,
+                      cursor: Optional[str] = None, fields: Optional[List[str]] = None,
+                      omit_heavy: bool = False, max_bytes: Optional[int] = None) -> Optional[Dict]:
+    """Session sonuçlarının bir sayfası
+
+    Kayıtlar önce profiller, sonra işbirlikçiler sırasıyla okunur. Sayfa
+    limit kayda veya max_bytes (JSON byte) bütçesine ulaşınca kesilir ve
+    kalan kayıtlar için next_cursor döner. Her sayfa en az bir kayıt
+    içerdiğinden cursor her zaman ilerler (ya da None olur). Bellekten
+    atılmış session'lar diskten satır satır okunur, tamamı belleğe alınmaz.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit en az 1 olmalı")
+    summary = get_session_summary(session_id)
+    if summary is None:
+        return None
+    
+    kinds = [kind for kind in (kinds or list(RECORD_FILES)) if kind in RECORD_FILES]
+    # offset tüm kayıt dizisine (profiller + işbirlikçiler) uygulanır
+    offsets = decode_cursor(cursor) if cursor else {kind: 0 for kind in RECORD_FILES}
+    skip = 0 if cursor else max(0, offset)
+    totals = {kind: summary.get(f"{kind}_count", 0) for kind in RECORD_FILES}
+    
+    page: Dict[str, List[Dict]] = {kind: [] for kind in kinds}
+    returned = 0
+    used_bytes = 0
+    next_offsets = None
+    for kind in kinds:
+        start = offsets.get(kind, 0)
+        position = start
+        for record in islice(session_records(session_id, kind), start, None):
+            if skip:
+                skip -= 1
+                position += 1
+                continue
+            if limit is not None and returned >= limit:
+                next_offsets = dict(offsets, **{kind: position})
+                break
+            record = project_record(record, fields, omit_heavy)
+            size = len(json.dumps(record, ensure_ascii=False).encode("utf-8")) + 1
+            # Bütçe aşılsa da sayfa en az bir kayıt içerir
+            if max_bytes and returned and used_bytes + size > max_bytes:
+                next_offsets = dict(offsets, **{kind: position})
+                break
+            page[kind].append(record)
+            used_bytes += size
+            returned += 1
+            position += 1
+        if next_offsets is not None:
+            break
+        offsets = dict(offsets, **{kind: position})
+    if not returned:
+        # Kayıt dönmeyen sayfa ilerlemez: döngüye sokan cursor verilmez
+        next_offsets = None
+    
+    result = {
+        "session_id": session_id,
+        "status": summary.get("status"),
+        "progress": summary.get("progress"),
+        "total_profiles": totals["profiles"],
+        "total_collaborators": totals["collaborators"],
+        **page,
+        "returned": returned,
+        "next_cursor": encode_cursor(next_offsets) if next_offsets is not None else None,
+    }
+    if summary.get("archived"):
+        result["archived"] = True
+    return result
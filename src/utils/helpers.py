@@ -4,8 +4,44 @@ Yardımcı fonksiyonlar
 import json
 import os
 import re
+import sys
+import unicodedata
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+_settings_cache: Optional[Dict] = None
+
+DEFAULT_BASE_URL = "https://akademik.yok.gov.tr/"
+
+
+def load_settings() -> Dict:
+    """config/settings.json dosyasını yükle (process başına bir kez)"""
+    global _settings_cache
+    if _settings_cache is None:
+        settings_path = Path(__file__).parent.parent.parent / "config" / "settings.json"
+        try:
+            with open(settings_path, 'r', encoding='utf-8') as f:
+                _settings_cache = json.load(f)
+        except Exception as e:
+            print(f"[ERROR] settings.json yüklenemedi: {e}", file=sys.stderr)
+            _settings_cache = {}
+    return _settings_cache
+
+
+def get_setting(path: str, default: Any = None) -> Any:
+    """Noktalı yol ile ayar değeri döndür (örn. 'session.max_sessions')"""
+    value: Any = load_settings()
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return value
+
+
+def yok_base_url() -> str:
+    """YÖK Akademik kök adresi: YOK_BASE_URL ortam değişkeni, yoksa scraping.base_url ayarı"""
+    base_url = os.environ.get("YOK_BASE_URL") or get_setting("scraping.base_url") or DEFAULT_BASE_URL
+    return base_url.rstrip("/") + "/"
 
 
 def load_fields() -> List[Dict]:
@@ -37,6 +73,36 @@ def get_specialty_name_by_id(fields_data: List[Dict], field_id: int, specialty_i
     return None
 
 
+_AUTHOR_ID_RE = re.compile(r'authorId=([0-9A-Za-z]+)')
+
+
+def extract_author_id(url: Optional[str]) -> Optional[str]:
+    """YÖK profil URL'inden authorId değerini çıkar"""
+    if not url:
+        return None
+    match = _AUTHOR_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def turkish_casefold(text: Optional[str]) -> str:
+    """Türkçe kurallarına uygun küçük harfe çevirme (İ→i, I→ı) ve boşluk normalizasyonu"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("İ", "i").replace("I", "ı").lower()
+    # 'i̇' (i + birleşik nokta) kalıntılarını temizle
+    text = text.replace("i\u0307", "i")
+    return " ".join(text.split())
+
+
+_ASCII_FOLD = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+
+def turkish_ascii_fold(text: Optional[str]) -> str:
+    """Türkçe casefold + aksan katlama (Öztürk, ÖZTÜRK, ozturk aynı sonucu verir)"""
+    return turkish_casefold(text).translate(_ASCII_FOLD)
+
+
 def sanitize_filename(name: str) -> str:
     """Dosya adı için güvenli string oluştur"""
     return re.sub(r'[^A-Za-z0-9ĞÜŞİÖÇğüşiöç ]+', '_', name).strip().replace(" ", "_")
@@ -63,4 +129,50 @@ def create_session_dir(session_id: str) -> Path:
     """Session klasörünü oluştur"""
     session_dir = Path(__file__).parent.parent.parent / "sessions" / session_id
     session_dir.mkdir(parents=True, exist_ok=True)
-    return session_dir 
\ No newline at end of file
+    return session_dir 
+
+def process_tree_rss_mb(root_pid: int) -> Optional[float]:
+    """Bir process ve tüm alt process'lerinin toplam RSS değeri (MB)"""
+    try:
+        import psutil
+        root = psutil.Process(root_pid)
+        procs = [root] + root.children(recursive=True)
+        total = 0
+        for proc in procs:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    # psutil yoksa Linux /proc üzerinden hesapla
+    proc_dir = Path("/proc")
+    if not proc_dir.exists():
+        return None
+    children: Dict[int, List[int]] = {}
+    for entry in proc_dir.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            ppid = int(stat.rsplit(")", 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry.name))
+        except (OSError, ValueError, IndexError):
+            continue
+    total_kb = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        try:
+            for line in (proc_dir / str(pid) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+                    break
+        except (OSError, ValueError, IndexError):
+            pass
+        stack.extend(children.get(pid, []))
+    return total_kb / 1024
@@ -0,0 +1,229 @@
+"""
+Keep-alive HTTP istemcisi (bağlantı havuzu + cookie jar)
+"""
+import gzip
+import http.client
+import http.cookiejar
+import threading
+import urllib.request
+import zlib
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from .helpers import get_setting
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class HttpStatusError(http.client.HTTPException):
+    """2xx dışı yanıt (hata sayfası normal sayfa gibi ayrıştırılmasın)"""
+
+    def __init__(self, response: "HttpResponse"):
+        super().__init__(f"HTTP {response.status}: {response.url}")
+        self.response = response
+
+
+class HttpResponse:
+    """Basit HTTP yanıtı"""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        content_type = self.headers.get("content-type", "")
+        charset = "utf-8"
+        if "charset=" in content_type:
+            charset = content_type.split("charset=", 1)[1].split(";")[0].strip() or "utf-8"
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def raise_for_status(self) -> "HttpResponse":
+        if not self.ok:
+            raise HttpStatusError(self)
+        return self
+
+
+class KeepAliveHttpClient:
+    """Host başına bağlantı havuzu tutan, thread-safe HTTP istemcisi
+
+    Kendi cookie jar'ı tek bir sunucu oturumudur; eşzamanlı scraping'ler
+    session() ile bağlantı havuzunu paylaşan ayrı cookie jar'lar kullanır.
+    """
+
+    def __init__(self, max_connections_per_host: int = 8, timeout: float = 30,
+                 user_agent: str = DEFAULT_USER_AGENT, max_redirects: int = 5):
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.max_redirects = max_redirects
+        self.cookie_jar = http.cookiejar.CookieJar()
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+
+    @classmethod
+    def from_settings(cls) -> "KeepAliveHttpClient":
+        return cls(
+            max_connections_per_host=get_setting("http.max_connections_per_host", 8),
+            timeout=get_setting("http.timeout", get_setting("scraping.timeout", 30)),
+            user_agent=get_setting("webdriver.user_agent", DEFAULT_USER_AGENT),
+        )
+
+    def _checkout(self, key: Tuple[str, str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+            self.connections_opened += 1
+        scheme, host, port = key
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_cls(host, port, timeout=self.timeout), False
+
+    def _checkin(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_connections_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def session(self) -> "HttpSession":
+        """Bağlantı havuzunu paylaşan, kendi cookie jar'ı olan istemci"""
+        return HttpSession(self)
+
+    def _send(self, method: str, url: str, body: Optional[bytes],
+              headers: Optional[Dict[str, str]], cookie_jar: http.cookiejar.CookieJar) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        cookie_request = urllib.request.Request(url, method=method)
+        cookie_jar.add_cookie_header(cookie_request)
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept-Language": "tr-TR,tr;q=0.9,en;q=0.8",
+            "Connection": "keep-alive",
+        }
+        request_headers.update(dict(cookie_request.header_items()))
+        if body is not None:
+            request_headers["Content-Type"] = "application/x-www-form-urlencoded"
+        if headers:
+            request_headers.update(headers)
+
+        for attempt in range(2):
+            conn, reused = self._checkout(key)
+            try:
+                conn.request(method, path, body=body, headers=request_headers)
+                raw = conn.getresponse()
+                data = raw.read()
+                break
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                # Sunucu tarafından kapatılmış keep-alive bağlantısı: bir kez yeniden dene
+                if reused and attempt == 0:
+                    continue
+                raise
+        self.requests_sent += 1
+
+        cookie_jar.extract_cookies(raw, cookie_request)
+        encoding = (raw.getheader("Content-Encoding") or "").lower()
+        if encoding == "gzip":
+            data = gzip.decompress(data)
+        elif encoding == "deflate":
+            try:
+                data = zlib.decompress(data)
+            except zlib.error:
+                data = zlib.decompress(data, -zlib.MAX_WBITS)
+
+        response_headers = {k.lower(): v for k, v in raw.getheaders()}
+        if raw.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return HttpResponse(url, raw.status, response_headers, data)
+
+    def request(self, method: str, url: str, data: Optional[Dict] = None,
+                headers: Optional[Dict[str, str]] = None,
+                cookie_jar: Optional[http.cookiejar.CookieJar] = None,
+                check: bool = True) -> HttpResponse:
+        """İstek gönder, yönlendirmeleri takip et; check ile 2xx dışı yanıtta HttpStatusError"""
+        body = urlencode(data).encode("utf-8") if data is not None else None
+        cookie_jar = cookie_jar if cookie_jar is not None else self.cookie_jar
+        for _ in range(self.max_redirects + 1):
+            response = self._send(method, url, body, headers, cookie_jar)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response.raise_for_status() if check else response
+            url = urljoin(url, location)
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method, body = "GET", None
+        raise http.client.HTTPException(f"Çok fazla yönlendirme: {url}")
+
+    def get(self, url: str, params: Optional[Dict] = None, **kwargs) -> HttpResponse:
+        if params:
+            url += ("&" if "?" in url else "?") + urlencode(params)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, data: Dict, **kwargs) -> HttpResponse:
+        return self.request("POST", url, data=data, **kwargs)
+
+    def close(self):
+        """Boştaki tüm bağlantıları kapat"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class HttpSession:
+    """Tek bir scraping'in sunucu oturumu: ayrı cookie jar, ortak bağlantı havuzu
+
+    YÖK'ün JSP oturumu arama, sekme ve sayfalama durumunu sunucuda tuttuğu
+    için eşzamanlı scraping'ler aynı cookie'yi paylaşmamalı.
+    """
+
+    def __init__(self, client: KeepAliveHttpClient):
+        self.client = client
+        self.cookie_jar = http.cookiejar.CookieJar()
+
+    def request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        return self.client.request(method, url, cookie_jar=self.cookie_jar, **kwargs)
+
+    def get(self, url: str, params: Optional[Dict] = None, **kwargs) -> HttpResponse:
+        return self.client.get(url, params=params, cookie_jar=self.cookie_jar, **kwargs)
+
+    def post(self, url: str, data: Dict, **kwargs) -> HttpResponse:
+        return self.client.post(url, data, cookie_jar=self.cookie_jar, **kwargs)
+
+
+# Global istemci (bağlantı havuzu tüm scraping çağrıları tarafından paylaşılır)
+_http_client: Optional[KeepAliveHttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> KeepAliveHttpClient:
+    """Process genelindeki HTTP istemcisini getir"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = KeepAliveHttpClient.from_settings()
+        return _http_client
@@ -0,0 +1,273 @@
+"""
+Hafif span ölçümü: aşama süreleri session başına ve process geneli histogramlarda
+
+Kullanım:
+    with span("search", session):
+        ...
+
+metrics.enabled kapalıysa span() paylaşılan bir no-op context manager döndürür.
+"""
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .helpers import get_setting
+
+# Saniye cinsinden histogram sınırları (Prometheus 'le' etiketleri)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROMETHEUS_PREFIX = "yok_scraper"
+
+_NOOP_SPAN = nullcontext()
+
+
+class StageStats:
+    """Bir aşamanın sayısı, toplam ve en uzun süresi (session başına)"""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StageStats":
+        stats = cls()
+        stats.count = data.get("count", 0)
+        stats.total = data.get("total_seconds", 0.0)
+        stats.max = data.get("max_seconds", 0.0)
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "mean_seconds": round(self.total / self.count, 6) if self.count else 0.0,
+            "max_seconds": round(self.max, 6),
+        }
+
+
+class Histogram(StageStats):
+    """Sabit kovalı süre histogramı (process geneli)"""
+
+    __slots__ = ("buckets",)
+
+    def __init__(self):
+        super().__init__()
+        self.buckets = [0] * len(BUCKETS)
+
+    def add(self, seconds: float):
+        super().add(seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Kova sınırlarından yaklaşık yüzdelik (üst sınır)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return round(self.max, 6)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(super().to_dict(), p50_seconds=self.quantile(0.5), p95_seconds=self.quantile(0.95))
+
+
+class _Span:
+    __slots__ = ("registry", "stage", "session", "started")
+
+    def __init__(self, registry: "MetricsRegistry", stage: str, session):
+        self.registry = registry
+        self.stage = stage
+        self.session = session
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.stage, time.perf_counter() - self.started, self.session)
+        return False
+
+
+class MetricsRegistry:
+    """Process genelindeki aşama histogramları ve olay sayaçları"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started_at = time.time()
+        self._stages: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def span(self, stage: str, session=None):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, stage, session)
+
+    def observe(self, stage: str, seconds: float, session=None):
+        """Süreyi process histogramına ve (varsa) session'ın aşama istatistiklerine ekle"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram()
+            histogram.add(seconds)
+            if session is not None:
+                stats = session.spans.get(stage)
+                if stats is None:
+                    stats = session.spans[stage] = StageStats()
+                stats.add(seconds)
+
+    def session_spans(self, session) -> Dict[str, Dict[str, Any]]:
+        """Session'ın aşama istatistikleri (span'lar başka thread'lerden eklenebilir)"""
+        with self._lock:
+            return {stage: stats.to_dict() for stage, stats in session.spans.items()}
+
+    def count(self, event: str, n: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[event] = self._counters.get(event, 0) + n
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "stages": {stage: histogram.to_dict() for stage, histogram in sorted(self._stages.items())},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+            self.started_at = time.time()
+
+    def prometheus_text(self) -> str:
+        """Prometheus text exposition formatı"""
+        name = f"{PROMETHEUS_PREFIX}_stage_seconds"
+        lines: List[str] = [
+            f"# HELP {name} Scraping aşama süreleri (saniye)",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self._stages.items()):
+                label = stage.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                for bound, count in zip(BUCKETS, histogram.buckets):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{label}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{stage="{label}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{stage="{label}"}} {histogram.total:.6f}')
+                lines.append(f'{name}_count{{stage="{label}"}} {histogram.count}')
+            counters = sorted(self._counters.items())
+        events = f"{PROMETHEUS_PREFIX}_events_total"
+        lines += [f"# HELP {events} Scraping olay sayaçları", f"# TYPE {events} counter"]
+        lines += [f'{events}{{event="{event}"}} {value}' for event, value in counters]
+        return "\n".join(lines) + "\n"
+
+
+class PrometheusFileExporter:
+    """Metrikleri periyodik olarak Prometheus text dosyasına yazan arka plan thread'i
+
+    node_exporter textfile collector gibi araçlar için dosya atomik olarak değiştirilir.
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: Path, interval: float = 15):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.writes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.write()
+
+    def write(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(self.registry.prometheus_text(), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self.writes += 1
+        except Exception as e:
+            print(f"⚠️ Metrik dosyası yazılamadı ({self.path}): {e}", file=sys.stderr)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+_exporter: Optional[PrometheusFileExporter] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Process genelindeki metrik kaydını getir (metrics.enabled ayarıyla)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry(enabled=get_setting("metrics.enabled", True))
+    return _registry
+
+
+def span(stage: str, session=None):
+    """Aşama süresini ölçen context manager"""
+    return get_metrics().span(stage, session)
+
+
+def count(event: str, n: int = 1):
+    """Olay sayacını artır"""
+    get_metrics().count(event, n)
+
+
+def start_metrics_exporter() -> Optional[PrometheusFileExporter]:
+    """metrics.prometheus_file ayarlıysa periyodik dosya yazıcısını başlat (bir kez)"""
+    global _exporter
+    registry = get_metrics()
+    path = get_setting("metrics.prometheus_file")
+    if not registry.enabled or not path:
+        return None
+    with _registry_lock:
+        if _exporter is None:
+            path = Path(path)
+            if not path.is_absolute():
+                path = Path(__file__).parent.parent.parent / path
+            _exporter = PrometheusFileExporter(registry, path, get_setting("metrics.prometheus_interval", 15))
+            _exporter.start()
+        return _exporter
+
+
+def stop_metrics_exporter():
+    """Yazıcıyı durdur (son durumu bir kez daha yazar)"""
+    global _exporter
+    with _registry_lock:
+        exporter, _exporter = _exporter, None
+    if exporter:
+        exporter.stop()
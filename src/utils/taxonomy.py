@@ -0,0 +1,158 @@
+"""
+Alan / uzmanlık taksonomisi için process genelinde tek seferlik indeks
+"""
+import threading
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from .helpers import load_fields, turkish_casefold
+
+
+_NORMALIZED_LIMIT = 8192
+_normalized: Dict[str, str] = {}
+
+
+def normalize_label(label: Optional[str]) -> str:
+    """Etiket karşılaştırması için Türkçe normalize edilmiş ad
+
+    Etiket kümesi küçük olduğundan sonuçlar sınırlı bir sözlükte tutulur.
+    """
+    if not label:
+        return ""
+    normalized = _normalized.get(label)
+    if normalized is None:
+        normalized = turkish_casefold(label)
+        if len(_normalized) < _NORMALIZED_LIMIT:
+            _normalized[label] = normalized
+    return normalized
+
+
+class ProfileFilter:
+    """Bir istek için önceden derlenmiş profil filtresi
+
+    pairs verilmişse (green_label, blue_label) çifti o kümede aranır;
+    yalnızca greens verilmişse green_label kontrol edilir; ikisi de yoksa
+    her profil kabul edilir.
+    """
+
+    __slots__ = ("greens", "pairs")
+
+    def __init__(self, greens: Optional[FrozenSet[str]] = None,
+                 pairs: Optional[FrozenSet[Tuple[str, str]]] = None):
+        self.greens = greens
+        self.pairs = pairs
+
+    @property
+    def accepts_all(self) -> bool:
+        return self.greens is None and self.pairs is None
+
+    def matches(self, profile: Dict) -> bool:
+        if self.pairs is not None:
+            return (normalize_label(profile.get('green_label')),
+                    normalize_label(profile.get('blue_label'))) in self.pairs
+        if self.greens is not None:
+            return normalize_label(profile.get('green_label')) in self.greens
+        return True
+
+
+ACCEPT_ALL = ProfileFilter()
+
+
+class TaxonomyIndex:
+    """fields.json için değişmez, iki yönlü O(1) eşlemeler"""
+
+    def __init__(self, fields_data: List[Dict]):
+        field_names: Dict[int, str] = {}
+        field_ids: Dict[str, int] = {}
+        specialty_names: Dict[Tuple[int, int], str] = {}
+        specialty_ids: Dict[Tuple[int, str], int] = {}
+        specialty_fields: Dict[str, List[Tuple[int, int]]] = {}
+
+        for field in fields_data:
+            field_names[field['id']] = field['name']
+            field_ids.setdefault(normalize_label(field['name']), field['id'])
+            for specialty in field.get('specialties', []):
+                key = (field['id'], specialty['id'])
+                normalized = normalize_label(specialty['name'])
+                specialty_names[key] = specialty['name']
+                specialty_ids.setdefault((field['id'], normalized), specialty['id'])
+                specialty_fields.setdefault(normalized, []).append(key)
+
+        self.fields = tuple(fields_data)
+        self._field_names: Mapping[int, str] = MappingProxyType(field_names)
+        self._field_ids: Mapping[str, int] = MappingProxyType(field_ids)
+        self._specialty_names: Mapping[Tuple[int, int], str] = MappingProxyType(specialty_names)
+        self._specialty_ids: Mapping[Tuple[int, str], int] = MappingProxyType(specialty_ids)
+        self._specialty_fields: Mapping[str, Tuple[Tuple[int, int], ...]] = MappingProxyType(
+            {name: tuple(keys) for name, keys in specialty_fields.items()}
+        )
+        self._filters: Dict[Tuple, ProfileFilter] = {}
+        self._filters_lock = threading.Lock()
+
+    def field_name(self, field_id: Optional[int]) -> Optional[str]:
+        """Alan ID'sine göre alan adı"""
+        return self._field_names.get(field_id)
+
+    def specialty_name(self, field_id: Optional[int], specialty_id: Optional[int]) -> Optional[str]:
+        """(alan, uzmanlık) ID çiftine göre uzmanlık adı"""
+        return self._specialty_names.get((field_id, specialty_id))
+
+    def field_id(self, name: Optional[str]) -> Optional[int]:
+        """Alan adına (büyük/küçük harf duyarsız) göre ID"""
+        return self._field_ids.get(normalize_label(name))
+
+    def specialty_id(self, field_id: int, name: Optional[str]) -> Optional[int]:
+        """Bir alandaki uzmanlık adına göre ID"""
+        return self._specialty_ids.get((field_id, normalize_label(name)))
+
+    def specialty_locations(self, name: Optional[str]) -> Tuple[Tuple[int, int], ...]:
+        """Uzmanlık adının geçtiği (alan, uzmanlık) ID çiftleri"""
+        return self._specialty_fields.get(normalize_label(name), ())
+
+    def compile_filter(self, field_id: Optional[int],
+                       specialty_ids: Optional[List[int]]) -> ProfileFilter:
+        """İstek parametrelerinden profil filtresi üret
+
+        Eski _filter_profile davranışı korunur: bilinmeyen alan ID'si alan
+        kontrolünü atlar, uzmanlıklar yalnızca alan ID'si ile birlikte
+        dikkate alınır ve hiçbiri çözülemezse hiçbir profil eşleşmez.
+        """
+        if not field_id and not specialty_ids:
+            return ACCEPT_ALL
+
+        cache_key = (field_id, tuple(sorted(set(specialty_ids))) if specialty_ids else None)
+        with self._filters_lock:
+            cached = self._filters.get(cache_key)
+        if cached is not None:
+            return cached
+
+        field_name = self.field_name(field_id) if field_id else None
+        if specialty_ids and field_id:
+            green = normalize_label(field_name) if field_name else None
+            pairs = set()
+            for specialty_id in specialty_ids:
+                specialty_name = self.specialty_name(field_id, specialty_id)
+                if specialty_name and green is not None:
+                    pairs.add((green, normalize_label(specialty_name)))
+            profile_filter = ProfileFilter(pairs=frozenset(pairs))
+        elif field_name:
+            profile_filter = ProfileFilter(greens=frozenset({normalize_label(field_name)}))
+        else:
+            profile_filter = ACCEPT_ALL
+
+        with self._filters_lock:
+            self._filters[cache_key] = profile_filter
+        return profile_filter
+
+
+_taxonomy: Optional[TaxonomyIndex] = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy() -> TaxonomyIndex:
+    """Process genelindeki taksonomi indeksini getir (fields.json bir kez okunur)"""
+    global _taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None:
+            _taxonomy = TaxonomyIndex(load_fields())
+        return _taxonomy
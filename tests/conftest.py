@@ -0,0 +1,95 @@
+"""
+Ortak test fixture'ları: kayıtlı YÖK sayfalarını sunan yerel HTTP sunucusu
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+# Proje root'unu Python path'e ekle
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "yok"
+PROFILE_PATH = "/AkademikArama/AkademisyenGorevOgrenimBilgileri"
+
+
+class FixtureSite:
+    """tests/fixtures/yok altındaki sayfaları YÖK adresleriyle eşleştirir
+
+    Gerçek sitede olduğu gibi grafik sayfası cookie ile son açılan profili verir;
+    sonuç sayfaları da yalnızca arama yapılmış oturumda açılır.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def route(self, path: str, query, cookies):
+        arg = lambda key: (query.get(key) or [""])[0]
+        headers = {}
+        if path in ("/AkademikArama", "/AkademikArama/"):
+            name = "search.html"
+        elif path == "/AkademikArama/AkademikAra":
+            headers["Set-Cookie"] = "fixtureSearch=1; Path=/AkademikArama"
+            name = "overview.html"
+        elif path == "/AkademikArama/AkademisyenArama" and cookies.get("fixtureSearch"):
+            name = f"results_{arg('page') or '1'}.html"
+        elif path == PROFILE_PATH and arg("authorId"):
+            headers["Set-Cookie"] = f"fixtureAuthor={arg('authorId')}; Path=/AkademikArama"
+            name = f"profile_{arg('authorId')}.html"
+        elif path == "/AkademikArama/viewAuthorGraphs.jsp" and cookies.get("fixtureAuthor"):
+            name = f"graph_{cookies['fixtureAuthor']}.html"
+        elif path == "/AkademikArama/hata":
+            return 500, "<html><body>Sunucu hatası</body></html>".encode("utf-8"), headers
+        else:
+            name = None
+        page = FIXTURES_DIR / name if name else None
+        if page is None or not page.is_file():
+            return 404, b"<html><body>Not found</body></html>", headers
+        return 200, page.read_bytes(), headers
+
+
+def _make_handler(site: FixtureSite):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            cookies = {}
+            for item in (self.headers.get("Cookie") or "").split(";"):
+                key, _, value = item.strip().partition("=")
+                if key:
+                    cookies[key] = value
+            with site._lock:
+                site.requests.append(self.path)
+            status, body, headers = site.route(parts.path, parse_qs(parts.query), cookies)
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def yok_site():
+    """(FixtureSite, base_url) - base_url '/' ile biter"""
+    site = FixtureSite()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(site))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield site, f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,107 @@
+"""
+Toplu arama: sorgu başına sonuç bildirimi, authorId tekilleştirme ve sorgu cache'i
+"""
+import asyncio
+import json
+
+import pytest
+
+from src.scraper import query_cache
+from src.scraper.batch import BatchScrapeRunner
+from src.scraper.query_cache import QueryResultCache
+from src.scraper.session_manager import AcademicScrapingSession
+
+
+def profile_url(author_id: str) -> str:
+    return f"https://akademik.yok.gov.tr/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId={author_id}"
+
+
+# Sorgu -> bulunan authorId'ler; "YILMAZ" ile "AHMET" sonuçları örtüşür
+RESULTS = {
+    "AHMET": ["A1", "A2", "A3"],
+    "YILMAZ": ["A3", "A4", "A1"],
+    "KAYA": ["A5"],
+}
+
+
+class FakeScraper:
+    """Sorgu adına göre hazır update akışı üreten scraper"""
+
+    created = 0
+
+    def __init__(self):
+        FakeScraper.created += 1
+        self.queries = []
+
+    async def scrape_profiles_streaming(self, name, session_id, field_id=None, specialty_ids=None,
+                                        email=None, cache_max_age=None, session=None):
+        self.queries.append(name)
+        await asyncio.sleep(0)
+        if name not in RESULTS:
+            yield {"type": "error", "data": {"message": f"{name} bulunamadı"}}
+            return
+        for count, author_id in enumerate(RESULTS[name], 1):
+            profile = {"id": count, "name": f"{name} {author_id}", "url": profile_url(author_id)}
+            session.add_profile(profile)
+            yield {"type": "profile_added", "data": {"profile": profile, "count": count}}
+        yield {"type": "completed", "data": {"session_id": session_id}}
+
+
+@pytest.fixture
+def batch_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(query_cache, "_query_cache", QueryResultCache())
+    FakeScraper.created = 0
+    return AcademicScrapingSession("batch_test", tmp_path / "sessions")
+
+
+def run_batch(session, queries, concurrency=2, cache_max_age=None):
+    summaries = []
+
+    async def on_query_done(summary):
+        summaries.append(summary)
+
+    runner = BatchScrapeRunner(session, queries, scraper_factory=FakeScraper, concurrency=concurrency,
+                               cache_max_age=cache_max_age, on_query_done=on_query_done)
+    stats = asyncio.run(runner.run())
+    return stats, summaries
+
+
+def test_each_query_result_is_reported_as_it_finishes(batch_session):
+    queries = [{"name": "AHMET"}, {"name": "YILMAZ"}, {"name": "KAYA"}, {"name": "YOK"}]
+    stats, summaries = run_batch(batch_session, queries)
+
+    assert FakeScraper.created == 2
+    assert sorted(summary["query_index"] for summary in summaries) == [0, 1, 2, 3]
+    by_name = {summary["query"]["name"]: summary for summary in summaries}
+    assert by_name["AHMET"]["author_ids"] == ["A1", "A2", "A3"]
+    assert by_name["KAYA"]["status"] == "completed"
+    assert by_name["YOK"]["status"] == "error"
+    assert by_name["YOK"]["error"] == "YOK bulunamadı"
+    assert (stats["completed_queries"], stats["failed_queries"]) == (3, 1)
+
+    # Özetler batch dizinine de yazılır
+    logged = [json.loads(line) for line in (batch_session.base_dir / "queries.jsonl").read_text().splitlines()]
+    assert [entry["query_index"] for entry in logged] == [summary["query_index"] for summary in summaries]
+
+
+def test_overlapping_profiles_are_deduplicated_by_author_id(batch_session):
+    stats, summaries = run_batch(batch_session, [{"name": "AHMET"}, {"name": "YILMAZ"}], concurrency=1)
+
+    assert stats["unique_profiles"] == 4
+    assert stats["duplicate_profiles"] == 2
+    assert len(batch_session.profiles) == 4
+    assert [summary["new_profiles"] for summary in summaries] == [3, 1]
+    # Her sorgunun kendi kayıtları alt session'da tam olarak durur
+    assert [summary["profiles"] for summary in summaries] == [3, 3]
+    assert (batch_session.base_dir / "queries" / "q0001").is_dir()
+
+
+def test_repeated_query_is_served_from_query_cache(batch_session):
+    stats, summaries = run_batch(batch_session, [{"name": "AHMET"}, {"name": "ahmet"}], concurrency=1)
+
+    assert [summary["source"] for summary in summaries] == ["scrape", "cache"]
+    assert stats["cache_hits"] == 1
+    assert stats["duplicate_profiles"] == 3
+
+    stats, summaries = run_batch(batch_session, [{"name": "AHMET"}], cache_max_age=0)
+    assert summaries[0]["source"] == "scrape"
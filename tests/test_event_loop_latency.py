@@ -0,0 +1,104 @@
+"""
+Selenium işi event loop dışında: yavaş bir driver meşgulken durum tool'ları hızlı yanıt vermeli
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from src import mcp_server
+from src.scraper import session_manager
+from src.scraper.academic_scraper import StreamingAcademicScraper
+
+# Tek bir tarayıcı çağrısının süresi ve durum tool'larından beklenen üst sınır
+DRIVER_CALL_SECONDS = 0.5
+STATUS_BOUND_SECONDS = 0.1
+
+
+class SlowDriver:
+    """Her çağrısı thread'i gerçekten bloklayan sahte WebDriver"""
+
+    current_url = "about:blank"
+    page_source = "<html></html>"
+
+    def __init__(self):
+        self.calls = 0
+
+    def _block(self):
+        self.calls += 1
+        time.sleep(DRIVER_CALL_SECONDS)
+
+    def get(self, url):
+        self._block()
+        self.current_url = url
+
+    def find_element(self, by, value):
+        self._block()
+        raise LookupError(value)
+
+    def find_elements(self, by, value):
+        self._block()
+        return []
+
+    def execute_script(self, script, *args):
+        self._block()
+        return None
+
+    def quit(self):
+        pass
+
+
+class SlowScraper(StreamingAcademicScraper):
+    def setup_driver(self):
+        # Chrome açılışı gibi yavaş
+        time.sleep(DRIVER_CALL_SECONDS)
+        self.driver = SlowDriver()
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_manager, "SESSIONS_DIR", tmp_path / "sessions")
+    monkeypatch.setattr(mcp_server, "_scheduler", None)
+    monkeypatch.setattr(mcp_server, "create_scraper", lambda engine=None: SlowScraper(driver_pool=None))
+    return mcp_server
+
+
+async def timed_call(server, name, arguments):
+    started = time.perf_counter()
+    result = await server.handle_call_tool(name, arguments)
+    return time.perf_counter() - started, json.loads(result[0].text)
+
+
+async def measure_status_latency(server):
+    session_ids = []
+    for query in ("AHMET YILMAZ", "AYŞE KAYA"):
+        _, started = await timed_call(server, "scrape_academic_profiles", {
+            "name": query, "wait_for_completion": False, "cache_max_age": 0
+        })
+        session_ids.append(started["data"]["session_id"])
+
+    latencies = []
+    statuses = set()
+    deadline = time.perf_counter() + 4 * DRIVER_CALL_SECONDS
+    while time.perf_counter() < deadline:
+        for session_id in session_ids:
+            elapsed, status = await timed_call(server, "get_session_status", {"session_id": session_id})
+            latencies.append(elapsed)
+            statuses.add(status["status"])
+        elapsed, _ = await timed_call(server, "list_active_sessions", {})
+        latencies.append(elapsed)
+        await asyncio.sleep(0.05)
+
+    for task in asyncio.all_tasks() - {asyncio.current_task()}:
+        task.cancel()
+    return latencies, statuses
+
+
+def test_status_tools_answer_while_driver_blocks(server):
+    latencies, statuses = asyncio.run(measure_status_latency(server))
+
+    # Ölçüm sırasında scraping'ler gerçekten tarayıcıda meşguldü
+    assert "running" in statuses
+    assert len(latencies) >= 10
+    assert max(latencies) < STATUS_BOUND_SECONDS, f"en yavaş durum çağrısı {max(latencies):.3f}s"
@@ -0,0 +1,115 @@
+"""
+İşbirliği grafiği: CSR sorguları ve session'lardan artımlı kurulum
+"""
+import pytest
+
+from src.scraper import graph_index
+from src.scraper.graph_index import CollaborationGraph, GraphIndex
+from src.scraper.session_manager import AcademicScrapingSession
+
+#     B --- C
+#    /       \
+#   A         D --- E        F (yalnız)
+#    \       /
+#     G --- H
+IDS = ["A", "B", "C", "D", "E", "F", "G", "H"]
+EDGES = [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("A", "G"), ("G", "H"), ("H", "D")]
+
+
+@pytest.fixture
+def graph():
+    index = {author_id: i for i, author_id in enumerate(IDS)}
+    edges = {tuple(sorted((index[u], index[v]))) for u, v in EDGES}
+    return CollaborationGraph(list(IDS), [f"KİŞİ {author_id}" for author_id in IDS], edges)
+
+
+def ids(graph, nodes):
+    return [graph.ids[i] for i in nodes]
+
+
+def test_csr_neighbors_are_sorted_and_symmetric(graph):
+    assert graph.node_count == 8
+    assert graph.edge_count == 7
+    assert ids(graph, graph.neighbors(graph.resolve("D"))) == ["C", "E", "H"]
+    assert ids(graph, graph.neighbors(graph.resolve("F"))) == []
+    assert ids(graph, graph.top_degree(3)) == ["D", "A", "B"]
+
+
+def test_resolve_accepts_profile_url(graph):
+    url = "https://akademik.yok.gov.tr/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId=E"
+    assert graph.resolve(url) == graph.resolve("E") == 4
+    assert graph.resolve("Z") is None
+
+
+def test_shortest_path(graph):
+    r = graph.resolve
+    path = ids(graph, graph.shortest_path(r("A"), r("E")))
+    # A'dan E'ye iki eşit uzunlukta yol var
+    assert path in (["A", "B", "C", "D", "E"], ["A", "G", "H", "D", "E"])
+    assert ids(graph, graph.shortest_path(r("B"), r("G"))) == ["B", "A", "G"]
+    assert graph.shortest_path(r("C"), r("C")) == [r("C")]
+    assert graph.shortest_path(r("A"), r("F")) is None
+    # Derinlik sınırı aşılırsa yol bulunmaz
+    assert graph.shortest_path(r("A"), r("E"), max_depth=3) is None
+
+
+def test_common_neighbors(graph):
+    r = graph.resolve
+    assert ids(graph, graph.common_neighbors(r("B"), r("G"))) == ["A"]
+    assert ids(graph, graph.common_neighbors(r("C"), r("H"))) == ["D"]
+    assert graph.common_neighbors(r("A"), r("E")) == []
+
+
+def test_neighborhood(graph):
+    r = graph.resolve
+    assert [(graph.ids[i], d) for i, d in graph.neighborhood(r("A"))] == [("B", 1), ("G", 1)]
+    two_hops = [(graph.ids[i], d) for i, d in graph.neighborhood(r("A"), hops=2)]
+    assert two_hops == [("B", 1), ("G", 1), ("C", 2), ("H", 2)]
+    assert len(graph.neighborhood(r("A"), hops=5, limit=3)) == 3
+    assert graph.neighborhood(r("F"), hops=3) == []
+
+
+def profile_url(author_id: str) -> str:
+    return f"https://akademik.yok.gov.tr/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId={author_id}"
+
+
+def add_collaborators(session: AcademicScrapingSession, source: str, targets):
+    for target in targets:
+        session.add_collaborator({"name": f"KİŞİ {target}", "url": profile_url(target), "source_author_id": source})
+
+
+def test_graph_index_ingests_finished_session_incrementally(tmp_path, monkeypatch):
+    sessions_dir = tmp_path / "sessions"
+    first = AcademicScrapingSession("first", sessions_dir)
+    add_collaborators(first, "A", ["B", "C"])
+    second = AcademicScrapingSession("second", sessions_dir)
+    add_collaborators(second, "B", ["C"])
+
+    read_dirs = []
+    read_session_edges = graph_index.read_session_edges
+
+    def counting_read(session_dir):
+        read_dirs.append(session_dir.name)
+        return read_session_edges(session_dir)
+
+    monkeypatch.setattr(graph_index, "read_session_edges", counting_read)
+    index = GraphIndex(sessions_dir)
+    graph = index.graph()
+    assert sorted(read_dirs) == ["first", "second"]
+    assert graph.edge_count == 3
+    # Değişiklik yoksa aynı grafik, yeniden okuma yok
+    assert index.graph() is graph
+    assert index.rebuilds == 1
+
+    read_dirs.clear()
+    third = AcademicScrapingSession("third", sessions_dir)
+    add_collaborators(third, "C", ["D", "A"])
+    index.mark_dirty(third)
+    graph = index.graph()
+
+    assert read_dirs == ["third"]
+    assert index.rebuilds == 2
+    assert graph.edge_count == 4
+    assert ids(graph, graph.shortest_path(graph.resolve("B"), graph.resolve("D"))) == ["B", "C", "D"]
+    assert graph.names[graph.resolve("D")] == "KİŞİ D"
+    assert index.stats()["sessions"] == 3
@@ -0,0 +1,194 @@
+"""
+HTTP motoru: kayıtlı YÖK sayfalarıyla arama, email eşleşmesi ve işbirlikçi grafiği
+"""
+import asyncio
+
+import pytest
+
+from src.scraper import http_scraper
+from src.scraper.http_scraper import HttpAcademicScraper
+from src.scraper.profile_cache import ProfileCache
+from src.scraper.session_manager import AcademicScrapingSession
+from src.utils.http_client import HttpStatusError, KeepAliveHttpClient
+
+TARGET_ID = "EC26298E00000015"
+TARGET_EMAIL = "ismail.ahmet.yilmaz.0015@istanbul.edu.tr"
+COLLABORATOR_IDS = ["600B7BD200000000", "600B7BD200000001", "600B7BD200000002"]
+
+
+def profile_url(base_url: str, author_id: str) -> str:
+    return f"{base_url}AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId={author_id}"
+
+
+async def collect(updates):
+    return [update async for update in updates]
+
+
+@pytest.fixture
+def scraper(yok_site, tmp_path, monkeypatch):
+    _, base_url = yok_site
+    monkeypatch.setattr(http_scraper, "SEARCH_URL", base_url + "AkademikArama/")
+    client = KeepAliveHttpClient()
+    cache = ProfileCache(tmp_path / "profiles.sqlite3")
+    scraper = HttpAcademicScraper(http_client=client, profile_cache=cache)
+    yield scraper
+    cache.close()
+    client.close()
+
+
+def test_error_status_raises(yok_site):
+    _, base_url = yok_site
+    client = KeepAliveHttpClient()
+    with pytest.raises(HttpStatusError) as error:
+        client.get(base_url + "AkademikArama/hata")
+    assert error.value.response.status == 500
+    with pytest.raises(HttpStatusError):
+        client.get(base_url + "AkademikArama/yok")
+    assert client.get(base_url + "AkademikArama/hata", check=False).status == 500
+    client.close()
+
+
+def test_sessions_do_not_share_cookies(yok_site):
+    _, base_url = yok_site
+    client = KeepAliveHttpClient()
+    first, second = client.session(), client.session()
+    first.get(profile_url(base_url, TARGET_ID))
+    # Başka bir scraping aynı anda farklı bir profil açıyor
+    second.get(profile_url(base_url, COLLABORATOR_IDS[0]))
+
+    graph = first.get(base_url + "AkademikArama/viewAuthorGraphs.jsp")
+    assert TARGET_ID in graph.text
+    # İkinci oturumun profili için grafik yok: kendi cookie'siyle 404
+    with pytest.raises(HttpStatusError):
+        second.get(base_url + "AkademikArama/viewAuthorGraphs.jsp")
+    # Bağlantı havuzu ortak
+    assert client.requests_sent == 4
+    client.close()
+
+
+def test_search_collects_all_result_pages(scraper, tmp_path):
+    session = AcademicScrapingSession("test_http_search", tmp_path / "sessions")
+    updates = asyncio.run(collect(scraper.scrape_profiles_streaming(
+        "AHMET YILMAZ", session.session_id, cache_max_age=0, session=session)))
+
+    profiles = [u["data"]["profile"] for u in updates if u["type"] == "profile_added"]
+    assert [p["id"] for p in profiles] == list(range(1, 26))
+    assert profiles[0]["url"].endswith("authorId=EC26298E00000000")
+    assert all("@" in p["email"] for p in profiles)
+    assert updates[-1]["type"] == "completed"
+    assert session.status == "completed"
+
+
+def test_email_match_reads_collaborator_graph_over_http(scraper, yok_site, tmp_path):
+    site, _ = yok_site
+    session = AcademicScrapingSession("test_http_email", tmp_path / "sessions")
+    updates = asyncio.run(collect(scraper.scrape_profiles_streaming(
+        "AHMET YILMAZ", session.session_id, email=TARGET_EMAIL, cache_max_age=0, session=session)))
+
+    assert not [u for u in updates if u["type"] == "error"]
+    match = next(u["data"]["profile"] for u in updates if u["type"] == "email_match")
+    assert match["name"] == "İSMAİL AHMET YILMAZ"
+    assert match["url"].endswith(TARGET_ID)
+    # Email ile bulunan kişi de authorId cache'ine yazılır
+    assert scraper.profile_cache.get(TARGET_ID, "profile")["email"] == TARGET_EMAIL
+
+    collaborators = [u["data"]["collaborator"] for u in updates if u["type"] == "collaborator_added"]
+    assert sorted(c["url"].rsplit("=", 1)[1] for c in collaborators) == COLLABORATOR_IDS
+    assert {c["name"] for c in collaborators} == {"KEREM YILMAZ", "SEDA GÜNEŞ", "GÜLŞEN IŞIK"}
+    assert all(c["source_author_id"] == TARGET_ID for c in collaborators)
+    # Grafik tarayıcı açılmadan HTTP ile okundu
+    assert scraper.driver is None
+    assert any(path.endswith("viewAuthorGraphs.jsp") for path in site.requests)
+
+
+def test_crawl_reads_graphs_over_http(scraper, yok_site, tmp_path, monkeypatch):
+    from src import mcp_server
+
+    _, base_url = yok_site
+    engines = []
+
+    def create_scraper(engine=None):
+        engines.append(engine)
+        return scraper
+
+    monkeypatch.setattr(mcp_server, "create_scraper", create_scraper)
+    session = AcademicScrapingSession("test_http_crawl", tmp_path / "sessions")
+    query = {"seeds": [profile_url(base_url, TARGET_ID)], "max_depth": 1, "max_nodes": 10,
+             "concurrency": 4, "engine": "http", "cache_max_age": 0}
+    crawler = mcp_server.create_network_crawler(session, query)
+    crawler.start([{"author_id": TARGET_ID, "url": query["seeds"][0]}], query)
+    stats = asyncio.run(crawler.run())
+
+    assert engines == ["http"]
+    # HTTP motorunda paralellik driver havuzu ile sınırlanmaz
+    assert crawler.concurrency == 4
+    assert stats["nodes"] == 4 and stats["edges"] == 3
+    assert sorted(crawler.nodes) == sorted(COLLABORATOR_IDS + [TARGET_ID])
+    assert scraper.driver is None
+
+
+def test_email_known_as_collaborator_yields_profile_shaped_match(scraper, yok_site, tmp_path, monkeypatch):
+    from src.scraper import academic_scraper
+    from src.scraper.resolution_index import ResolutionIndex
+    from src.scraper.session_manager import get_state_writer
+
+    _, base_url = yok_site
+    sessions_dir = tmp_path / "sessions"
+    earlier = AcademicScrapingSession("test_earlier_crawl", sessions_dir)
+    earlier.add_collaborator({
+        "id": 7, "name": "İSMAİL AHMET YILMAZ", "url": profile_url(base_url, TARGET_ID),
+        "status": "completed", "deleted": False, "title": "PROFESÖR",
+        "info": "İSTANBUL ÜNİVERSİTESİ/TIP FAKÜLTESİ", "green_label": "Sağlık Bilimleri",
+        "blue_label": "", "keywords": "", "email": TARGET_EMAIL, "photoUrl": "/default_photo.jpg",
+        "source_author_id": COLLABORATOR_IDS[0],
+    })
+    get_state_writer().flush(timeout=5)
+    index = ResolutionIndex(sessions_dir)
+    monkeypatch.setattr(academic_scraper, "get_resolution_index", lambda: index)
+
+    session = AcademicScrapingSession("test_http_known_email", sessions_dir)
+    updates = asyncio.run(collect(scraper.scrape_profiles_streaming(
+        "AHMET YILMAZ", session.session_id, email=TARGET_EMAIL, session=session)))
+
+    match = next(u["data"] for u in updates if u["type"] == "email_match")
+    assert match["source"] == "index"
+    profile = match["profile"]
+    assert profile["header"] == "İSTANBUL ÜNİVERSİTESİ/TIP FAKÜLTESİ"
+    assert profile["info"].splitlines()[0] == "PROFESÖR"
+    assert not {"source_author_id", "status", "deleted", "keywords"} & set(profile)
+    # Arama sayfaları atlandı, işbirlikçiler yine grafikten geldi
+    collaborators = [u["data"]["collaborator"] for u in updates if u["type"] == "collaborator_added"]
+    assert sorted(c["url"].rsplit("=", 1)[1] for c in collaborators) == COLLABORATOR_IDS
+
+
+def test_resume_reopens_search_and_pages_forward(scraper, yok_site, tmp_path):
+    site, _ = yok_site
+    session = AcademicScrapingSession("test_http_resume", tmp_path / "sessions")
+
+    async def interrupt_on_second_page():
+        updates = scraper.scrape_profiles_streaming("AHMET YILMAZ", session.session_id,
+                                                    cache_max_age=0, session=session)
+        async for update in updates:
+            if update["type"] == "profile_added" and update["data"]["count"] == 21:
+                break
+        await updates.aclose()
+
+    asyncio.run(interrupt_on_second_page())
+    assert session.checkpoint["page"] == 2
+    assert session.resumable
+
+    # Devam yeni bir sunucu oturumunda (boş cookie jar) yapılır
+    client = KeepAliveHttpClient()
+    resumed = HttpAcademicScraper(http_client=client, profile_cache=scraper.profile_cache)
+    del site.requests[:]
+    updates = asyncio.run(collect(resumed.scrape_profiles_streaming(
+        "AHMET YILMAZ", session.session_id, cache_max_age=0, resume=True, session=session)))
+    client.close()
+
+    assert not [u for u in updates if u["type"] == "error"]
+    added = [u["data"]["profile"]["id"] for u in updates if u["type"] == "profile_added"]
+    assert added == [22, 23, 24, 25]
+    assert [p["id"] for p in session.profiles] == list(range(1, 26))
+    # Arama yeniden yapıldı, ikinci sayfaya sonraki sayfa linkiyle gidildi
+    assert site.requests[0] == "/AkademikArama/"
+    assert any("page=2" in path for path in site.requests)
@@ -0,0 +1,141 @@
+"""
+Saf HTML ayrıştırıcılar: kayıtlı YÖK sayfalarından canlı çıkarıcılarla aynı sözlükler
+"""
+import json
+import re
+from pathlib import Path
+
+from src.scraper.parsers import (DEFAULT_PHOTO_URL, collaborators_from_graph_data, find_link_by_text,
+                                 find_next_page_url, parse_collaborator_graph, parse_collaborator_page,
+                                 parse_result_rows, parse_search_form)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "yok"
+SITE = "https://akademik.yok.gov.tr"
+RESULTS_URL = SITE + "/AkademikArama/AkademisyenArama?aramaTerim=AHMET+YILMAZ&page=1"
+GRAPH_URL = SITE + "/AkademikArama/viewAuthorGraphs.jsp"
+
+# StreamingAcademicScraper._extract_profile_data / _extract_result_rows çıktısının alanları
+PROFILE_KEYS = ["id", "name", "title", "url", "info", "header", "green_label", "blue_label", "email", "photoUrl"]
+# StreamingAcademicScraper._extract_collaborator_data çıktısının alanları
+COLLABORATOR_KEYS = ["id", "name", "url", "status", "deleted", "title", "info", "green_label", "blue_label",
+                     "keywords", "email", "photoUrl"]
+
+
+def fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def profile_url(author_id: str) -> str:
+    return f"{SITE}/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId={author_id}"
+
+
+def test_result_rows_match_live_profile_dicts():
+    profiles = parse_result_rows(fixture("results_1.html"), RESULTS_URL, start_id=1)
+
+    assert len(profiles) == 20
+    assert all(list(profile) == PROFILE_KEYS for profile in profiles)
+    assert profiles[0] == {
+        "id": 1,
+        "name": "AHMET YILMAZ",
+        "title": "ARAŞTIRMA GÖREVLİSİ",
+        "url": profile_url("EC26298E00000000"),
+        "info": "ARAŞTIRMA GÖREVLİSİ\n"
+                "AHMET YILMAZ\n"
+                "ERZURUM ÜNİVERSİTESİ/FEN FAKÜLTESİ/ÇOCUK GELİŞİMİ BÖLÜMÜ/\n"
+                "Sosyal-Beşeri ve İdari Bilimler Temel Alanı Çocuk Gelişimi "
+                "Ağız, Yüz ve Çene Cerrahisi ; Erzurum Çalışmaları",
+        "header": "ERZURUM ÜNİVERSİTESİ/FEN FAKÜLTESİ/ÇOCUK GELİŞİMİ BÖLÜMÜ/",
+        "green_label": "Sosyal-Beşeri ve İdari Bilimler Temel Alanı",
+        "blue_label": "Çocuk Gelişimi",
+        "email": "ahmet.yilmaz.0000@erzurum.edu.tr",
+        "photoUrl": SITE + "/AkademikArama/authorimages/EC26298E00000000.jpg",
+    }
+
+
+def test_result_rows_number_from_start_id():
+    profiles = parse_result_rows(fixture("results_2.html"), RESULTS_URL, start_id=21)
+
+    assert [profile["id"] for profile in profiles] == [21, 22, 23, 24, 25]
+    assert all("[at]" not in profile["email"] and "@" in profile["email"] for profile in profiles)
+
+
+def test_result_rows_skip_incomplete_rows():
+    page = "<table><tr id='authorInfo_1'><td><h6>DOÇENT</h6></td></tr></table>"
+    assert parse_result_rows(page, RESULTS_URL) == []
+
+
+def test_next_page_follows_active_item():
+    assert find_next_page_url(fixture("results_1.html"), RESULTS_URL) == RESULTS_URL.replace("page=1", "page=2")
+    # Son sayfada aktif öğeden sonra link yok
+    assert find_next_page_url(fixture("results_2.html"), RESULTS_URL) is None
+    assert find_next_page_url(fixture("overview.html"), RESULTS_URL) is None
+
+
+def test_collaborator_page_matches_live_collaborator_dict():
+    url = profile_url("600B7BD200000000")
+    collaborator = parse_collaborator_page(fixture("profile_600B7BD200000000.html"),
+                                           {"name": "KEREM YILMAZ", "href": url}, 3, url)
+
+    assert list(collaborator) == COLLABORATOR_KEYS
+    assert collaborator == {
+        "id": 3,
+        "name": "KEREM YILMAZ",
+        "url": url,
+        "status": "completed",
+        "deleted": False,
+        "title": "DOKTOR ÖĞRETİM ÜYESİ",
+        "info": "ISPARTA ÜNİVERSİTESİ/FEN FAKÜLTESİ/DİN PSİKOLOJİSİ BÖLÜMÜ/",
+        "green_label": "İlahiyat Temel Alanı",
+        "blue_label": "Din Psikolojisi",
+        "keywords": "",
+        "email": "kerem.yilmaz.0000@isparta.edu.tr",
+        "photoUrl": SITE + "/AkademikArama/authorimages/600B7BD200000000.jpg",
+    }
+
+
+def test_collaborator_without_link_or_profile_is_deleted():
+    expected = {"id": 1, "name": "SİLİNMİŞ", "url": "", "status": "completed", "deleted": True,
+                "photoUrl": DEFAULT_PHOTO_URL}
+    assert parse_collaborator_page("", {"name": "SİLİNMİŞ", "href": ""}, 1, SITE) == expected
+
+    url = profile_url("600B7BD2000000FF")
+    missing = parse_collaborator_page("<html><body>Not found</body></html>", {"name": "SİLİNMİŞ", "href": url}, 1, url)
+    assert missing == dict(expected, url=url)
+
+
+def test_graph_page_lists_collaborators_without_center():
+    collaborators = parse_collaborator_graph(fixture("graph_EC26298E00000015.html"), GRAPH_URL,
+                                             profile_url("EC26298E00000015"), require_center=True)
+
+    assert collaborators == [
+        {"name": "KEREM YILMAZ", "href": profile_url("600B7BD200000000")},
+        {"name": "SEDA GÜNEŞ", "href": profile_url("600B7BD200000001")},
+        {"name": "GÜLŞEN IŞIK", "href": profile_url("600B7BD200000002")},
+    ]
+
+
+def test_graph_page_matches_script_data_path():
+    # Selenium yolu aynı düğümleri GRAPH_DATA_SCRIPT ile okur
+    script = re.search(r"var graphData = (\{.*\});", fixture("graph_EC26298E00000015.html")).group(1)
+    nodes = json.loads(script)["nodes"]
+    assert collaborators_from_graph_data(nodes, [], GRAPH_URL, profile_url("EC26298E00000015")) == \
+        parse_collaborator_graph(fixture("graph_EC26298E00000015.html"), GRAPH_URL, profile_url("EC26298E00000015"))
+
+
+def test_graph_of_another_profile_is_rejected():
+    # Oturumda başka profil açıldıysa grafik o profilindir
+    assert parse_collaborator_graph(fixture("graph_EC26298E00000015.html"), GRAPH_URL,
+                                    profile_url("EC26298E00000000"), require_center=True) is None
+    assert parse_collaborator_graph(fixture("profile_600B7BD200000000.html"), GRAPH_URL) is None
+
+
+def test_search_form_and_authors_tab():
+    form = parse_search_form(fixture("search.html"), SITE + "/AkademikArama/")
+    assert form == {
+        "action": SITE + "/AkademikArama/AkademikAra",
+        "method": "GET",
+        "fields": {"aramaTerim": "", "islem": "1"},
+        "term_field": "aramaTerim",
+    }
+    assert find_link_by_text(fixture("overview.html"), "Akademisyenler", SITE + "/AkademikArama/AkademikAra") == \
+        RESULTS_URL
@@ -0,0 +1,125 @@
+"""
+Profil cache'i: TTL, çağrı başına max_age, LRU boyut sınırı ve hit/miss sayaçları
+"""
+import time
+
+import pytest
+
+from src.scraper.academic_scraper import StreamingAcademicScraper
+from src.scraper.profile_cache import ProfileCache
+from src.scraper.session_manager import AcademicScrapingSession
+
+
+def profile(author_id: str) -> dict:
+    return {"name": f"KİŞİ {author_id}",
+            "url": f"https://akademik.yok.gov.tr/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId={author_id}"}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "profiles.sqlite3"
+
+
+def test_entries_expire_after_ttl(cache_path):
+    cache = ProfileCache(cache_path, ttl=0.2, flush_interval=0)
+    cache.put("A1", profile("A1"))
+    assert cache.get("A1") == profile("A1")
+    assert cache.flush(timeout=5)
+    time.sleep(0.3)
+    assert cache.get("A1") is None
+    cache.close()
+
+    # Süresi dolan kayıt yeniden açılan cache'te de döndürülmez
+    reopened = ProfileCache(cache_path, ttl=0.2)
+    assert reopened.get("A1") is None
+    assert reopened.stats()["entries"] == 1
+    reopened.close()
+
+
+def test_max_age_overrides_ttl_per_call(cache_path):
+    cache = ProfileCache(cache_path, ttl=3600)
+    cache.put("A1", profile("A1"))
+    time.sleep(0.05)
+    assert cache.get("A1", max_age=0.01) is None
+    assert cache.get("A1", max_age=60) == profile("A1")
+    assert cache.get("A1", max_age=0) is None
+    assert cache.get("A1") == profile("A1")
+    cache.close()
+
+
+def test_kinds_are_separate(cache_path):
+    cache = ProfileCache(cache_path)
+    cache.put("A1", profile("A1"), "profile")
+    cache.put("A1", {"url": profile("A1")["url"], "collaborators": []}, "graph")
+    assert cache.get("A1", "profile") == profile("A1")
+    assert cache.get("A1", "graph")["collaborators"] == []
+    assert cache.get("A1", "collaborator") is None
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted_at_cap(cache_path):
+    cache = ProfileCache(cache_path, max_entries=3, memory_entries=0, flush_interval=0)
+    for author_id in ("A1", "A2", "A3"):
+        cache.put(author_id, profile(author_id))
+        time.sleep(0.01)
+    assert cache.flush(timeout=5)
+    # A1'e erişildi: en uzun süredir erişilmeyen A2
+    assert cache.get("A1") is not None
+    time.sleep(0.01)
+    cache.put("A4", profile("A4"))
+    assert cache.flush(timeout=5)
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 1
+    assert cache.get("A2") is None
+    assert all(cache.get(author_id) is not None for author_id in ("A1", "A3", "A4"))
+    cache.close()
+
+
+def test_entries_survive_reopen_and_count_is_kept(cache_path):
+    cache = ProfileCache(cache_path)
+    for author_id in ("A1", "A2"):
+        cache.put(author_id, profile(author_id))
+    # Yazım arka planda: kayıt hemen okunabilir
+    assert cache.get("A2") == profile("A2")
+    cache.close()
+
+    reopened = ProfileCache(cache_path)
+    assert reopened.stats()["entries"] == 2
+    assert reopened.get("A1") == profile("A1")
+    assert reopened.purge() == 2
+    assert reopened.get("A1") is None
+    reopened.close()
+
+
+def test_hit_and_miss_counters(cache_path):
+    cache = ProfileCache(cache_path)
+    cache.put("A1", profile("A1"))
+    cache.get("A1")
+    cache.get("A1")
+    cache.get("A9")
+    cache.get(None)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == 0.667
+    cache.close()
+
+
+def test_session_status_counts_scraper_cache_lookups(cache_path, tmp_path):
+    cache = ProfileCache(cache_path)
+    scraper = StreamingAcademicScraper(driver_pool=None, profile_cache=cache)
+    scraper.session = AcademicScrapingSession("test_cache_counters", tmp_path / "sessions")
+    scraper.cache_max_age = None
+
+    scraper._cache_put(profile("A1"), "profile")
+    assert scraper._cache_get("A1", "profile") == profile("A1")
+    assert scraper._cache_get("A2", "profile") is None
+    assert scraper.session.get_status()["cache"] == {"hits": 1, "misses": 1}
+
+    # cache_max_age=0: cache'e hiç bakılmaz, sayaçlar değişmez
+    scraper.cache_max_age = 0
+    assert scraper._cache_get("A1", "profile") is None
+    assert scraper.session.get_status()["cache"] == {"hits": 1, "misses": 1}
+    cache.close()
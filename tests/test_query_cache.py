@@ -0,0 +1,166 @@
+"""
+Sorgu cache'i: taze / bayat / süresi dolmuş kayıtlar, anahtar normalizasyonu ve
+scrape_academic_profiles'ın cache isabetinde yeni scraping başlatmaması
+"""
+import asyncio
+import json
+
+import pytest
+
+from src import mcp_server
+from src.scraper import query_cache, session_manager
+from src.scraper.query_cache import FRESH, STALE, QueryResultCache, make_query_key
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+PROFILES = [{"id": i, "name": f"AHMET YILMAZ {i}", "url": f"https://akademik.yok.gov.tr/?authorId=A{i}"}
+            for i in range(1, 4)]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(query_cache, "time", clock)
+    return clock
+
+
+def store(cache, name="AHMET YILMAZ"):
+    cache.store(make_query_key(name), {"name": name}, PROFILES, [], "s1")
+
+
+def test_query_key_casefolds_turkish_names():
+    assert make_query_key("İSMAİL IŞIK") == make_query_key("ismail ışık") == make_query_key("  İsmail   Işık ")
+    assert make_query_key("İ") == make_query_key("i")
+    assert make_query_key("I") == make_query_key("ı")
+    # Türkçede I ile i farklı harflerdir
+    assert make_query_key("I") != make_query_key("i")
+    assert make_query_key("A", specialty_ids=[3, 1, 3]) == make_query_key("a", specialty_ids=[1, 3])
+    assert make_query_key("A", email=" X@Y.EDU.TR ") == make_query_key("a", email="x@y.edu.tr")
+    assert make_query_key("A", field_id=2) != make_query_key("A")
+
+
+def test_fresh_stale_and_expired_states(clock):
+    cache = QueryResultCache(ttl=60, stale_ttl=600)
+    store(cache)
+    key = make_query_key("AHMET YILMAZ")
+
+    entry, state = cache.lookup(key)
+    assert state == FRESH
+    assert [p["name"] for p in entry["profiles"]] == [p["name"] for p in PROFILES]
+
+    clock.now += 61
+    assert cache.lookup(key)[1] == STALE
+    clock.now += 600
+    assert cache.lookup(key) == (None, None)
+    # Süresi dolan kayıt silinir
+    assert cache.stats()["entries"] == 0
+    assert (cache.stats()["fresh_hits"], cache.stats()["stale_hits"], cache.stats()["misses"]) == (1, 1, 1)
+
+
+def test_max_age_is_a_hard_bound(clock):
+    cache = QueryResultCache(ttl=60, stale_ttl=600)
+    store(cache)
+    key = make_query_key("AHMET YILMAZ")
+
+    clock.now += 30
+    assert cache.lookup(key, max_age=10) == (None, None)
+    assert cache.lookup(key, max_age=45)[1] == FRESH
+    clock.now += 100
+    assert cache.lookup(key, max_age=120) == (None, None)
+    assert cache.lookup(key, max_age=200)[1] == STALE
+    # Kayıt, sınır vermeyen çağıranlar için korunur
+    assert cache.lookup(key)[1] == STALE
+
+
+def test_refresh_is_started_once_until_stored(clock):
+    cache = QueryResultCache(ttl=60, stale_ttl=600)
+    store(cache)
+    key = make_query_key("AHMET YILMAZ")
+
+    assert cache.begin_refresh(key)
+    assert not cache.begin_refresh(key)
+    assert cache.list_entries()[0]["refreshing"]
+    store(cache)
+    assert cache.begin_refresh(key)
+    cache.end_refresh(key)
+    assert cache.begin_refresh(key)
+
+
+def test_least_recently_used_query_is_dropped(clock):
+    cache = QueryResultCache(max_entries=2)
+    for name in ("A", "B"):
+        store(cache, name)
+    cache.lookup(make_query_key("A"))
+    store(cache, "C")
+    assert cache.lookup(make_query_key("B")) == (None, None)
+    assert cache.lookup(make_query_key("A"))[1] == FRESH
+    assert cache.purge(name="c") == 1
+
+
+@pytest.fixture
+def cached_query(tmp_path, monkeypatch):
+    cache = QueryResultCache()
+    monkeypatch.setattr(query_cache, "_query_cache", cache)
+    monkeypatch.setattr(session_manager, "SESSIONS_DIR", tmp_path / "sessions")
+    monkeypatch.setattr(mcp_server, "_scheduler", mcp_server.ScrapeScheduler(max_running=1))
+
+    def create_scraper(engine=None):
+        raise AssertionError("cache isabetinde scraper oluşturulmamalı")
+
+    monkeypatch.setattr(mcp_server, "create_scraper", create_scraper)
+    cache.store(make_query_key("AHMET YILMAZ"), {"name": "AHMET YILMAZ"}, PROFILES, [], "cached_session")
+    return cache
+
+
+def call(arguments):
+    result = asyncio.run(mcp_server.handle_call_tool("scrape_academic_profiles", arguments))
+    return json.loads(result[0].text)
+
+
+def test_background_call_returns_cached_session(cached_query):
+    response = call({"name": "ahmet yılmaz", "wait_for_completion": False})
+
+    assert response["type"] == "session_started"
+    assert response["data"]["session_id"] == "cached_session"
+    assert response["data"]["status"] == "completed"
+    assert response["data"]["total_profiles"] == 3
+    assert response["data"]["cache"]["state"] == "fresh"
+    assert mcp_server.get_scheduler().stats()["running"] == 0
+
+
+def test_waited_call_returns_cached_records(cached_query):
+    response = call({"name": "AHMET YILMAZ"})
+
+    assert response["data"]["session_id"] == "cached_session"
+    assert [p["name"] for p in response["data"]["profiles"]] == [p["name"] for p in PROFILES]
+
+
+class FakeProgressSession:
+    def __init__(self):
+        self.messages = []
+
+    async def send_progress_notification(self, progress_token, progress, total, message, related_request_id):
+        self.messages.append(json.loads(message))
+
+
+def test_streamed_call_sends_cached_records_as_notifications(cached_query, monkeypatch):
+    ctx = type("Ctx", (), {"session": FakeProgressSession(), "request_id": 1})()
+    streamer = mcp_server.ProgressStreamer(ctx, "token", batch_size=2)
+    monkeypatch.setattr(mcp_server.ProgressStreamer, "for_current_request", classmethod(lambda cls: streamer))
+
+    response = call({"name": "AHMET YILMAZ"})
+
+    data = response["data"]
+    assert "profiles" not in data and "collaborators" not in data
+    assert data["streamed"] is True
+    assert data["session_id"] == "cached_session"
+    assert data["total_profiles"] == 3
+    sent = [p["name"] for m in ctx.session.messages for p in m.get("profiles", ())]
+    assert sent == [p["name"] for p in PROFILES]
+    assert data["notifications"] == len(ctx.session.messages)
@@ -0,0 +1,96 @@
+"""
+Çözümleme indeksi: isim normalizasyonu, trigram'lar, email araması ve bulanık isim araması
+"""
+import pytest
+
+from src.scraper import resolution_index
+from src.scraper.resolution_index import ResolutionIndex, name_trigrams, normalize_email, normalize_name
+from src.scraper.session_manager import AcademicScrapingSession
+
+
+def profile_url(author_id: str) -> str:
+    return f"https://akademik.yok.gov.tr/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId={author_id}"
+
+
+@pytest.fixture
+def index(tmp_path):
+    sessions_dir = tmp_path / "sessions"
+    search = AcademicScrapingSession("search", sessions_dir)
+    search.add_profile({"name": "İSMAİL IŞIK", "url": profile_url("A1"), "title": "PROFESÖR",
+                        "header": "ANKARA ÜNİVERSİTESİ/", "email": "ismail.isik@ankara.edu.tr"})
+    search.add_profile({"name": "AHMET YILMAZ", "url": profile_url("A2"), "title": "DOÇENT", "email": ""})
+    crawl = AcademicScrapingSession("crawl", sessions_dir)
+    # Email'i yalnızca işbirlikçi kaydında görülen kişi
+    crawl.add_collaborator({"name": "AHMET YILMAZ", "url": profile_url("A2"),
+                            "email": "Ahmet.Yilmaz[at]konya.edu.tr", "source_author_id": "A1"})
+    crawl.add_collaborator({"name": "AHMET YILDIZ", "url": profile_url("A3"), "email": ""})
+    return ResolutionIndex(sessions_dir)
+
+
+def test_normalize_name_folds_dotted_and_dotless_i():
+    assert normalize_name("İSMAİL IŞIK") == "ismail isik"
+    for variant in ("ismail ışık", "Ismail Işık", "İsmail Isik", "  İSMAİL-IŞIK "):
+        assert normalize_name(variant) == "ismail isik"
+    assert normalize_name("ÖZTÜRK, Çağrı") == "ozturk cagri"
+    assert normalize_name(None) == ""
+
+
+def test_name_trigrams_are_padded_per_word():
+    assert name_trigrams("ali") == {"  a", " al", "ali", "li "}
+    assert name_trigrams(normalize_name("IŞIK")) == name_trigrams(normalize_name("ışık"))
+    assert name_trigrams("ali veli") == name_trigrams("ali") | name_trigrams("veli")
+    assert name_trigrams("") == set()
+
+
+def test_normalize_email():
+    assert normalize_email(" Ahmet.Yilmaz[at]Konya.edu.tr ") == "ahmet.yilmaz@konya.edu.tr"
+    assert normalize_email(None) == ""
+
+
+def test_lookup_email(index):
+    found = index.lookup_email("ISMAIL.ISIK@ankara.edu.tr")
+    assert found["author_id"] == "A1"
+    assert found["kind"] == "profiles"
+    assert found["session_id"] == "search"
+    assert index.lookup_email("bilinmiyor@ankara.edu.tr") is None
+    assert index.lookup_email("") is None
+
+
+def test_lookup_email_prefers_profile_record_and_keeps_collaborator_email(index):
+    found = index.lookup_email("ahmet.yilmaz@konya.edu.tr")
+    assert found["author_id"] == "A2"
+    assert found["kind"] == "profiles"
+    assert found["email"] == "Ahmet.Yilmaz[at]konya.edu.tr"
+    stats = index.stats()
+    assert (stats["people"], stats["emails"]) == (3, 2)
+
+
+def test_fuzzy_names_ranks_by_trigram_similarity(index):
+    response = index.fuzzy_names("ahmet yılmaz")
+    assert [r["author_id"] for r in response["results"]][:2] == ["A2", "A3"]
+    assert response["results"][0]["similarity"] == 1.0
+    assert response["results"][0]["similarity"] > response["results"][1]["similarity"]
+    assert [r["author_id"] for r in index.fuzzy_names("ISMAIL ISIK")["results"]] == ["A1"]
+    assert index.fuzzy_names("")["results"] == []
+
+
+def test_fuzzy_names_stops_at_limit(tmp_path, monkeypatch):
+    sessions_dir = tmp_path / "sessions"
+    session = AcademicScrapingSession("many", sessions_dir)
+    for i in range(30):
+        session.add_profile({"name": f"AHMET YILMAZ {chr(65 + i % 26)}{i}", "url": profile_url(f"B{i}")})
+    index = ResolutionIndex(sessions_dir)
+
+    summaries = []
+    summary = ResolutionIndex._summary
+
+    def counting_summary(self, author_id):
+        summaries.append(author_id)
+        return summary(self, author_id)
+
+    monkeypatch.setattr(resolution_index.ResolutionIndex, "_summary", counting_summary)
+    response = index.fuzzy_names("ahmet yilmaz", limit=5, min_similarity=0.1)
+    assert response["total"] == 30
+    assert len(response["results"]) == 5
+    # Özetler yalnızca döndürülen adaylar için kurulur
+    assert len(summaries) == 5
@@ -0,0 +1,74 @@
+"""
+Scraping scheduler: kabul kontrolü, driver havuzu sınırı ve öncelikler
+"""
+import asyncio
+
+from src.mcp_server import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, ScrapeScheduler
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_selenium_jobs_wait_for_a_free_driver():
+    async def scenario():
+        scheduler = ScrapeScheduler(max_running=10, max_drivers=2)
+        tickets = {f"s{i}": scheduler.submit(f"s{i}", drivers=1) for i in range(4)}
+        assert [sid for sid, ticket in tickets.items() if ticket.done()] == ["s0", "s1"]
+        assert scheduler.position("s2") == 1
+        # Driver gerektirmeyen iş beklemeden başlar
+        assert scheduler.submit("http", drivers=0).done()
+        assert scheduler.stats()["drivers_in_use"] == 2
+
+        scheduler.release("s0")
+        assert tickets["s2"].done() and not tickets["s3"].done()
+        scheduler.release("http")
+        assert not tickets["s3"].done()
+
+    run(scenario())
+
+
+def test_worker_jobs_hold_several_drivers():
+    async def scenario():
+        scheduler = ScrapeScheduler(max_running=10, max_drivers=2)
+        batch = scheduler.submit("batch", drivers=5)
+        single = scheduler.submit("single", drivers=1)
+        assert batch.done() and not single.done()
+        assert scheduler.stats()["drivers_in_use"] == 2
+        scheduler.release("batch")
+        assert single.done()
+
+    run(scenario())
+
+
+def test_interactive_jobs_go_first_and_callers_take_turns():
+    async def scenario():
+        scheduler = ScrapeScheduler(max_running=1)
+        scheduler.submit("running")
+        scheduler.submit("a1", caller_id="a")
+        scheduler.submit("a2", caller_id="a")
+        scheduler.submit("b1", caller_id="b")
+        scheduler.submit("urgent", caller_id="c", priority=PRIORITY_INTERACTIVE)
+
+        order = []
+        current = "running"
+        for _ in range(4):
+            scheduler.release(current)
+            current = next(sid for sid in scheduler._running)
+            order.append(current)
+        assert order == ["urgent", "a1", "b1", "a2"]
+
+    run(scenario())
+
+
+def test_cancelled_waiter_is_skipped():
+    async def scenario():
+        scheduler = ScrapeScheduler(max_running=1, max_drivers=1)
+        scheduler.submit("first", drivers=1)
+        waiting = scheduler.submit("second", drivers=1, priority=PRIORITY_BACKGROUND)
+        third = scheduler.submit("third", drivers=1)
+        waiting.cancel()
+        scheduler.release("first")
+        assert third.done()
+
+    run(scenario())
@@ -0,0 +1,108 @@
+"""
+Yerel tam metin arama: sorgu ayrıştırıcı, Türkçe katlama, BM25 sıralaması ve authorId tekilleştirme
+"""
+import pytest
+
+from src.scraper.search_index import ProfileSearchIndex, Query, tokenize
+from src.scraper.session_manager import AcademicScrapingSession
+
+
+def profile_url(author_id: str) -> str:
+    return f"https://akademik.yok.gov.tr/AkademikArama/AkademisyenGorevOgrenimBilgileri?islem=direct&authorId={author_id}"
+
+
+def person(author_id: str, name: str, blue_label: str = "", keywords: str = "", **fields):
+    return dict({"name": name, "url": profile_url(author_id), "title": "PROFESÖR",
+                 "header": "ANKARA ÜNİVERSİTESİ/MÜHENDİSLİK FAKÜLTESİ/",
+                 "green_label": "Mühendislik Temel Alanı", "blue_label": blue_label,
+                 "keywords": keywords}, **fields)
+
+
+@pytest.fixture
+def index(tmp_path):
+    sessions_dir = tmp_path / "sessions"
+    first = AcademicScrapingSession("first", sessions_dir)
+    first.add_profile(person("A1", "GÜLŞEN IŞIK", "Bilgisayar Mühendisliği", "Yapay Zeka ; Görüntü İşleme"))
+    first.add_profile(person("A2", "İSMAİL KAYA", "Makine Mühendisliği", "Isı Transferi"))
+    first.add_profile(person("A3", "AHMET YILMAZ", "Bilgisayar Mühendisliği", "Kaya Mekaniği ; Veri Tabanı"))
+    second = AcademicScrapingSession("second", sessions_dir)
+    # Aynı kişi ikinci session'da işbirlikçi olarak, daha az metinle
+    second.add_collaborator({"name": "GÜLŞEN IŞIK", "url": profile_url("A1"), "title": "PROFESÖR",
+                             "info": "ANKARA ÜNİVERSİTESİ/", "keywords": ""})
+    second.add_collaborator({"name": "ZEYNEP ŞAHİN", "url": profile_url("A4"), "title": "DOÇENT",
+                             "info": "İSTANBUL ÜNİVERSİTESİ/TIP FAKÜLTESİ/", "keywords": ""})
+    return ProfileSearchIndex(sessions_dir)
+
+
+def author_ids(response):
+    return [result["author_id"] for result in response["results"]]
+
+
+def test_tokenize_folds_turkish_letters():
+    assert tokenize("İSMAİL Işık ÖZTÜRK çağrı") == ["ismail", "isik", "ozturk", "cagri"]
+    assert tokenize("ismail IŞIK öztürk ÇAĞRI") == tokenize("İsmail ışık Öztürk çağrı")
+
+
+def test_query_parser_tree():
+    assert Query("").tree is None
+    assert Query("bilgisayar").tree == ("term", "bilgisayar")
+    assert Query("mühendis*").tree == ("prefix", "muhendis")
+    assert Query('"yapay zeka"').tree == ("phrase", ["yapay", "zeka"])
+    assert Query("Sosyal-Beşeri").tree == ("phrase", ["sosyal", "beseri"])
+    assert Query("a b OR c").tree == ("or", [("and", [("term", "a"), ("term", "b")]), ("term", "c")])
+    assert Query("a AND (b OR c) -d").tree == (
+        "and", [("term", "a"), ("or", [("term", "b"), ("term", "c")]), ("not", ("term", "d"))])
+    # Türkçe operatörler
+    assert Query("a VE b VEYA DEĞİL c").tree == Query("a AND b OR NOT c").tree
+    # Eksik parantez / sondaki NOT yok sayılır
+    assert Query("(a OR b").tree == ("or", [("term", "a"), ("term", "b")])
+    assert Query("a NOT").tree == ("term", "a")
+
+
+def test_dotted_and_dotless_i_variants_match(index):
+    expected = author_ids(index.search("IŞIK"))
+    assert expected == ["A1"]
+    for query in ("ışık", "isik", "Işık", "ISIK"):
+        assert author_ids(index.search(query)) == expected
+    for query in ("İSMAİL", "ismail", "Ismail"):
+        assert author_ids(index.search(query)) == ["A2"]
+
+
+def test_records_are_deduplicated_by_author_id(index):
+    response = index.search("gülşen")
+    assert response["total"] == 1
+    # Daha fazla metin içeren profil kaydı kullanılır
+    assert response["results"][0]["kind"] == "profiles"
+    assert response["results"][0]["session_id"] == "first"
+    assert index.stats()["documents"] == 4
+
+
+def test_bm25_ranks_name_matches_above_keyword_matches(index):
+    # "kaya": A2'de isimde (ağırlık 3), A3'te anahtar kelimede (ağırlık 2)
+    response = index.search("kaya")
+    assert author_ids(response) == ["A2", "A3"]
+    assert response["results"][0]["score"] > response["results"][1]["score"] > 0
+
+
+def test_bm25_prefers_documents_matching_rare_terms(index):
+    response = index.search("bilgisayar OR makine")
+    # "makine" tek belgede geçtiği için idf'i daha yüksek
+    assert author_ids(response)[0] == "A2"
+    assert sorted(author_ids(response)) == ["A1", "A2", "A3"]
+
+
+def test_boolean_phrase_and_prefix_queries(index):
+    assert author_ids(index.search("bilgisayar -yılmaz")) == ["A1"]
+    assert author_ids(index.search('"görüntü işleme"')) == ["A1"]
+    assert author_ids(index.search('"işleme görüntü"')) == []
+    assert sorted(author_ids(index.search("mühendis*"))) == ["A1", "A2", "A3"]
+    assert author_ids(index.search("tıp")) == ["A4"]
+    assert sorted(author_ids(index.search("NOT mühendislik"))) == ["A4"]
+
+
+def test_paging(index):
+    first_page = index.search("mühendis*", limit=2)
+    second_page = index.search("mühendis*", limit=2, offset=2)
+    assert first_page["total"] == second_page["total"] == 3
+    assert len(first_page["results"]) == 2
+    assert author_ids(first_page) + author_ids(second_page) == author_ids(index.search("mühendis*"))
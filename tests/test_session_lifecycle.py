@@ -0,0 +1,62 @@
+"""
+Session yaşam döngüsü: sırada iptal, yeniden yükleme ve bellekten atma
+"""
+import asyncio
+import json
+
+import pytest
+
+from src import mcp_server
+from src.scraper import session_manager
+from src.scraper.session_manager import AcademicScrapingSession, get_state_writer
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    path = tmp_path / "sessions"
+    monkeypatch.setattr(session_manager, "SESSIONS_DIR", path)
+    monkeypatch.setattr(mcp_server, "_scheduler", mcp_server.ScrapeScheduler(max_running=1))
+    yield path
+    get_state_writer().flush(timeout=5)
+
+
+def test_session_cancelled_while_queued_is_reaped(sessions_dir):
+    async def scenario():
+        scheduler = mcp_server.get_scheduler()
+        scheduler.submit("holder")
+        session = session_manager.create_session("queued_then_cancelled")
+        session.status = "queued"
+        ticket = scheduler.submit(session.session_id)
+        waiter = asyncio.create_task(mcp_server.run_admitted(session.session_id, ticket, asyncio.sleep))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return session
+
+    session = asyncio.run(scenario())
+    assert session.status == "error"
+    assert session.finished_at is not None
+    assert session_manager.reap_sessions(timeout=0) >= 1
+    assert "queued_then_cancelled" not in session_manager.active_sessions
+
+
+def test_interrupted_session_loads_as_error(sessions_dir):
+    session = AcademicScrapingSession("crashed_while_running", sessions_dir)
+    session.update_progress(40, "Profil listesi yükleniyor...")
+    get_state_writer().flush(timeout=5)
+
+    loaded = AcademicScrapingSession.load("crashed_while_running", sessions_dir)
+    assert loaded.status == "error"
+    assert loaded.finished_at is not None
+    get_state_writer().flush(timeout=5)
+    state = json.loads((sessions_dir / "crashed_while_running" / "session.json").read_text())
+    assert state["status"] == "error"
+
+
+def test_running_sessions_are_not_reaped(sessions_dir):
+    session = session_manager.create_session("still_running")
+    session.update_progress(50, "İşbirlikçiler çekiliyor...")
+    assert session_manager.reap_sessions(timeout=0) == 0
+    assert "still_running" in session_manager.active_sessions
+    session_manager.remove_session("still_running")
@@ -0,0 +1,52 @@
+"""
+get_session_results sayfalaması: cursor her sayfada ilerler
+"""
+import pytest
+
+from src.scraper import session_manager
+from src.scraper.session_manager import get_state_writer, read_results_page
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_manager, "SESSIONS_DIR", tmp_path / "sessions")
+    session = session_manager.create_session("paged_results")
+    for i in range(5):
+        session.add_profile({"id": i + 1, "name": f"PROFİL {i}", "url": f"https://x/?authorId=P{i}",
+                             "info": "PROFESÖR\nPROFİL\nÜNİVERSİTE/", "email": f"p{i}@x.edu.tr"})
+    for i in range(3):
+        session.add_collaborator({"id": i + 1, "name": f"İŞBİRLİKÇİ {i}", "url": f"https://x/?authorId=C{i}",
+                                  "status": "completed", "deleted": False})
+    session.update_progress(100, "İşlem tamamlandı")
+    yield session
+    session_manager.remove_session("paged_results")
+    get_state_writer().flush(timeout=5)
+
+
+@pytest.mark.parametrize("limit", [0, -3])
+def test_non_positive_limit_is_rejected(session, limit):
+    with pytest.raises(ValueError):
+        read_results_page(session.session_id, limit=limit)
+
+
+@pytest.mark.parametrize("limit,max_bytes", [(1, None), (2, None), (3, None), (None, 1)])
+def test_cursor_always_advances_until_exhausted(session, limit, max_bytes):
+    seen = []
+    cursors = []
+    cursor = None
+    while True:
+        page = read_results_page(session.session_id, limit=limit, cursor=cursor, max_bytes=max_bytes)
+        assert page["returned"] >= 1
+        seen += [record["name"] for record in page["profiles"] + page["collaborators"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+        assert cursor not in cursors
+        cursors.append(cursor)
+    assert len(seen) == 8 and len(set(seen)) == 8
+
+
+def test_offset_past_the_end_has_no_cursor(session):
+    page = read_results_page(session.session_id, offset=50, limit=2)
+    assert page["returned"] == 0
+    assert page["next_cursor"] is None